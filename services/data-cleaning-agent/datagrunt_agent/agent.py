@@ -4,38 +4,183 @@ Exports root_agent as required by the Google ADK framework.
 Run with: adk web datagrunt_agent
 """
 
+import asyncio
+import functools
 import os
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from typing import Any
 
 from dotenv import load_dotenv
 from google.adk.agents import Agent
+from google.adk.models import Gemini
 from google.adk.tools.agent_tool import AgentTool
 from google.adk.tools.base_tool import BaseTool
 from google.adk.tools.function_tool import FunctionTool
 from google.adk.tools.tool_context import ToolContext
+from google.genai import errors as genai_errors
 
-from datagrunt_agent.prompts.coordinator import COORDINATOR_PROMPT
-from datagrunt_agent.prompts.data_cleaner import DATA_CLEANER_PROMPT
-from datagrunt_agent.prompts.profiler import PROFILER_PROMPT
-from datagrunt_agent.prompts.quality_analyst import QUALITY_ANALYST_PROMPT
-from datagrunt_agent.prompts.schema_architect import SCHEMA_ARCHITECT_PROMPT
+from datagrunt_agent.prompts._precompiled import instruction_provider, warmup
 from datagrunt_agent.tools import (
     cleaning,
     cleaning_report,
     export,
     ingestion,
+    pipeline,
     profiling,
     quality,
     report,
 )
 
-load_dotenv()
-
 # ---------------------------------------------------------------------------
 # Model Configuration
 # ---------------------------------------------------------------------------
 
-DEFAULT_MODEL = os.getenv("DEFAULT_MODEL", "gemini-2.5-flash")
+# Model tier per agent when neither its own env var nor DEFAULT_MODEL is
+# set. The Coordinator routes and the Profiler formats tool output, so they
+# run on the cheapest tier; the Quality Analyst and Data Cleaner interpret
+# findings; the Schema Architect proposes schemas.
+RECOMMENDED_MODELS = {
+    "coordinator": "gemini-2.5-flash-lite",
+    "profiler": "gemini-2.5-flash-lite",
+    "quality_analyst": "gemini-2.5-flash",
+    "data_cleaner": "gemini-2.5-flash",
+    "schema_architect": "gemini-2.5-pro",
+}
+
+# Models tried in order when a request is rate-limited (HTTP 429)
+_DEFAULT_FALLBACK_MODELS = "gemini-2.5-flash,gemini-2.5-pro"
+
+
+@dataclass(frozen=True, slots=True)
+class AgentConfig:
+    """Environment-driven settings for the agent tree."""
+
+    default_model: str
+    coordinator_model: str
+    profiler_model: str
+    schema_architect_model: str
+    quality_analyst_model: str
+    data_cleaner_model: str
+    fallback_models: tuple[str, ...]
+    tool_concurrency_limit: int
+    warmup_prompts: bool
+
+
+@functools.cache
+def get_config() -> AgentConfig:
+    """Load .env and read the agent settings once per process."""
+    load_dotenv()
+    env = os.environ
+    default_model = env.get("DEFAULT_MODEL", "")
+
+    def model_for(agent: str, env_key: str) -> str:
+        return env.get(env_key) or default_model or RECOMMENDED_MODELS[agent]
+
+    fallbacks = env.get("FALLBACK_MODELS", _DEFAULT_FALLBACK_MODELS)
+    return AgentConfig(
+        default_model=default_model or "gemini-2.5-flash",
+        coordinator_model=model_for("coordinator", "COORDINATOR_MODEL"),
+        profiler_model=model_for("profiler", "PROFILER_MODEL"),
+        schema_architect_model=env.get(
+            "SCHEMA_ARCHITECT_MODEL",
+            RECOMMENDED_MODELS["schema_architect"],
+        ),
+        quality_analyst_model=model_for("quality_analyst", "QUALITY_ANALYST_MODEL"),
+        data_cleaner_model=model_for("data_cleaner", "DATA_CLEANER_MODEL"),
+        fallback_models=tuple(m.strip() for m in fallbacks.split(",") if m.strip()),
+        tool_concurrency_limit=int(env.get("TOOL_CONCURRENCY_LIMIT", "4")),
+        warmup_prompts=env.get("WARMUP_PROMPTS", "").lower() in ("1", "true"),
+    )
+
+
+class FallbackGemini(Gemini):
+    """Gemini model that retries rate-limited requests on fallback models.
+
+    A request that fails with HTTP 429 before any response was streamed is
+    re-sent to the next model in fallback_models. Other errors, and a 429
+    from the last model, propagate unchanged.
+    """
+
+    fallback_models: tuple[str, ...] = ()
+
+    async def generate_content_async(self, llm_request, stream: bool = False):
+        models = [llm_request.model or self.model, *self.fallback_models]
+        for index, model in enumerate(models):
+            llm_request.model = model
+            yielded = False
+            try:
+                async for response in super().generate_content_async(
+                    llm_request,
+                    stream,
+                ):
+                    yielded = True
+                    yield response
+                return
+            except genai_errors.ClientError as exc:
+                if exc.code != 429 or yielded or index == len(models) - 1:
+                    raise
+
+
+def _model(name: str) -> str | Gemini:
+    """Return the model for an agent, wrapped with its fallback chain."""
+    fallbacks = [m for m in _config.fallback_models if m != name]
+    if not fallbacks:
+        return name
+    return FallbackGemini(model=name, fallback_models=tuple(fallbacks))
+
+
+_config = get_config()
+
+DEFAULT_MODEL = _config.default_model
+
+# ---------------------------------------------------------------------------
+# Tool Concurrency
+# ---------------------------------------------------------------------------
+
+# Max tool calls from a single model response that may run at once.
+# Set to 1 to restore strictly sequential tool execution.
+TOOL_CONCURRENCY_LIMIT = _config.tool_concurrency_limit
+
+_tool_executor = ThreadPoolExecutor(
+    max_workers=max(TOOL_CONCURRENCY_LIMIT, 1),
+    thread_name_prefix="datagrunt-tool",
+)
+_write_lock = threading.Lock()
+
+
+def _concurrent(
+    func: Callable[..., Any], serialized: bool = False
+) -> Callable[..., Any]:
+    """Wrap a blocking tool so ADK can run it alongside other tool calls.
+
+    ADK awaits async tools, so independent calls emitted in one model
+    response (several exports, profile_columns + sample_data) overlap on
+    the tool thread pool instead of blocking the event loop one after the
+    other. Tools that rewrite tables pass serialized=True and still run
+    one at a time.
+    """
+    if TOOL_CONCURRENCY_LIMIT <= 1:
+        return func
+
+    def call(**kwargs: Any) -> Any:
+        if serialized:
+            with _write_lock:
+                return func(**kwargs)
+        return func(**kwargs)
+
+    @functools.wraps(func)
+    async def wrapper(**kwargs: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _tool_executor,
+            functools.partial(call, **kwargs),
+        )
+
+    return wrapper
+
 
 # ---------------------------------------------------------------------------
 # Specialist Agents
@@ -45,14 +190,16 @@ profiler_agent = Agent(
     name="Profiler",
     description=(
         "Analyzes table schemas and column statistics. Returns types, null rates, "
-        "cardinality, and type coercion recommendations for all columns in one call."
+        "cardinality, and type coercion recommendations for all columns (of one "
+        "or several tables) in one call."
     ),
-    model=os.getenv("PROFILER_MODEL", DEFAULT_MODEL),
-    instruction=PROFILER_PROMPT,
+    model=_model(_config.profiler_model),
+    instruction=instruction_provider("profiler"),
     tools=[
-        FunctionTool(func=profiling.profile_columns),
-        FunctionTool(func=profiling.profile_table),
-        FunctionTool(func=profiling.sample_data),
+        FunctionTool(func=_concurrent(profiling.profile_columns)),
+        FunctionTool(func=_concurrent(profiling.profile_tables)),
+        FunctionTool(func=_concurrent(profiling.profile_table)),
+        FunctionTool(func=_concurrent(profiling.sample_data)),
     ],
 )
 
@@ -63,8 +210,8 @@ schema_architect_agent = Agent(
         "transformation. Compares schemas, detects type changes, proposes "
         "unified canonical schemas from multiple sources."
     ),
-    model=os.getenv("SCHEMA_ARCHITECT_MODEL", "gemini-2.5-pro"),
-    instruction=SCHEMA_ARCHITECT_PROMPT,
+    model=_model(_config.schema_architect_model),
+    instruction=instruction_provider("schema_architect"),
     tools=[
         # Phase 2 tools will be added here
     ],
@@ -77,11 +224,11 @@ quality_analyst_agent = Agent(
         "null-like strings, whitespace issues, duplicates, constant columns, "
         "and outlier detection. Reports findings but never modifies data."
     ),
-    model=os.getenv("QUALITY_ANALYST_MODEL", DEFAULT_MODEL),
-    instruction=QUALITY_ANALYST_PROMPT,
+    model=_model(_config.quality_analyst_model),
+    instruction=instruction_provider("quality_analyst"),
     tools=[
-        FunctionTool(func=quality.quality_report),
-        FunctionTool(func=report.export_quality_report),
+        FunctionTool(func=_concurrent(quality.quality_report)),
+        FunctionTool(func=_concurrent(report.export_quality_report)),
     ],
 )
 
@@ -93,27 +240,14 @@ data_cleaner_agent = Agent(
         "standardization, type coercion, dedup flagging, PII detection, and "
         "produces a structured cleaning report."
     ),
-    model=os.getenv("DATA_CLEANER_MODEL", DEFAULT_MODEL),
-    instruction=DATA_CLEANER_PROMPT,
+    model=_model(_config.data_cleaner_model),
+    instruction=instruction_provider("data_cleaner"),
     tools=[
-        FunctionTool(func=cleaning.clean_table),
-        FunctionTool(func=cleaning_report.export_cleaning_report),
+        FunctionTool(func=_concurrent(cleaning.clean_table, serialized=True)),
+        FunctionTool(func=_concurrent(cleaning_report.export_cleaning_report)),
     ],
 )
 
-# ---------------------------------------------------------------------------
-# Actionable finding categories that warrant cleaning
-# ---------------------------------------------------------------------------
-
-_ACTIONABLE_CATEGORIES = {
-    "null_like_strings",
-    "whitespace",
-    "type_analysis",
-    "duplicates",
-    "constant_columns",
-    "null_analysis",
-}
-
 # ---------------------------------------------------------------------------
 # Callbacks
 # ---------------------------------------------------------------------------
@@ -127,20 +261,55 @@ def _after_tool_callback(
 ) -> dict | None:
     """Inject next_action directives for pipeline auto-chaining.
 
-    Handles two transitions:
-    1. load_file (success) → delegate to Quality Analyst
-    2. QualityAnalyst (with actionable findings) → delegate to Data Cleaner
+    Handles three transitions:
+    1. load_file (success) → delegate to Profiler and Quality Analyst in
+       parallel (one model response, two function calls)
+    2. load_files (any table loaded) → profile every loaded table with one
+       profile_tables call and audit each table, all in parallel
+    3. QualityAnalyst (with actionable findings) → delegate to Data Cleaner
     """
-    # --- load_file → Quality Analyst ---
+    # --- load_file → Profiler + Quality Analyst (parallel) ---
     if tool.name == "load_file" and isinstance(tool_response, dict):
         if tool_response.get("status") == "success":
             table_name = tool_response.get("table_name")
             tool_response["next_action"] = {
-                "action": "delegate_to_quality_analyst",
+                "action": "parallel_delegate",
                 "table_name": table_name,
+                "delegates": [
+                    {"agent": "Profiler", "tool": "profile_columns"},
+                    {"agent": "QualityAnalyst", "tool": "quality_report"},
+                ],
                 "instruction": (
-                    "Immediately delegate to the Quality Analyst agent "
-                    f"to run quality_report on '{table_name}'. "
+                    "Immediately delegate to the Profiler and Quality Analyst "
+                    f"agents on '{table_name}' in the same response — issue both "
+                    "calls together, do not wait for one before the other. "
+                    "Do not wait for user input."
+                ),
+            }
+        return None
+
+    # --- load_files → Profiler (all tables) + Quality Analyst (per table) ---
+    if tool.name == "load_files" and isinstance(tool_response, dict):
+        table_names = tool_response.get("table_names") or []
+        if table_names:
+            tool_response["next_action"] = {
+                "action": "parallel_delegate",
+                "table_names": table_names,
+                "delegates": [
+                    {"agent": "Profiler", "tool": "profile_tables"},
+                    *(
+                        {
+                            "agent": "QualityAnalyst",
+                            "tool": "quality_report",
+                            "table_name": name,
+                        }
+                        for name in table_names
+                    ),
+                ],
+                "instruction": (
+                    "Immediately delegate to the Profiler (one profile_tables "
+                    f"call for {table_names}) and to the Quality Analyst for "
+                    "each table, all in the same response. "
                     "Do not wait for user input."
                 ),
             }
@@ -151,17 +320,13 @@ def _after_tool_callback(
         findings = tool_context.state.get("quality_findings", [])
         table_name = tool_context.state.get("quality_table_name", "")
 
-        actionable = [
-            f for f in findings
-            if f.get("category") in _ACTIONABLE_CATEGORIES
-        ]
-
-        if actionable and table_name:
+        if table_name and pipeline.has_actionable_findings(findings):
             # QualityAnalyst returns text to the coordinator. ADK requires
             # the callback return value to be a string (Gemini Part).
             # Append a next_action directive as text so the coordinator
             # follows it like the load_file → QualityAnalyst chain.
             import json
+
             next_action = {
                 "action": "delegate_to_data_cleaner",
                 "table_name": table_name,
@@ -171,10 +336,7 @@ def _after_tool_callback(
                     "Do not wait for user input."
                 ),
             }
-            return (
-                f"{tool_response}\n\n"
-                f"next_action: {json.dumps(next_action)}"
-            )
+            return f"{tool_response}\n\nnext_action: {json.dumps(next_action)}"
 
     return None
 
@@ -183,6 +345,15 @@ def _after_tool_callback(
 # Coordinator Agent (root_agent — the ADK entry point)
 # ---------------------------------------------------------------------------
 
+_EXPORT_TOOLS = (
+    export.export_csv,
+    export.export_parquet,
+    export.export_json,
+    export.export_jsonl,
+    export.export_excel,
+    export.export_arrow,
+)
+
 root_agent = Agent(
     name="DataGrunt",
     description=(
@@ -190,8 +361,8 @@ root_agent = Agent(
         "profiles schemas, detects data quality issues, cleans data, and "
         "exports to multiple formats. Coordinates specialist agents."
     ),
-    model=os.getenv("COORDINATOR_MODEL", DEFAULT_MODEL),
-    instruction=COORDINATOR_PROMPT,
+    model=_model(_config.coordinator_model),
+    instruction=instruction_provider("coordinator"),
     after_tool_callback=_after_tool_callback,
     tools=[
         # Sub-agents
@@ -199,21 +370,45 @@ root_agent = Agent(
         AgentTool(agent=schema_architect_agent),
         AgentTool(agent=quality_analyst_agent),
         AgentTool(agent=data_cleaner_agent),
+        # Direct tools — Full pipeline (load → audit → clean in one call)
+        FunctionTool(func=_concurrent(pipeline.load_and_clean, serialized=True)),
         # Direct tools — Ingestion
-        FunctionTool(func=ingestion.load_file),
-        FunctionTool(func=ingestion.detect_format),
-        FunctionTool(func=ingestion.list_tables),
-        FunctionTool(func=ingestion.inspect_raw_file),
+        FunctionTool(func=_concurrent(ingestion.load_file, serialized=True)),
+        FunctionTool(func=_concurrent(ingestion.load_files, serialized=True)),
+        FunctionTool(func=_concurrent(ingestion.detect_format)),
+        FunctionTool(func=_concurrent(ingestion.list_tables)),
+        FunctionTool(func=_concurrent(ingestion.inspect_raw_file)),
         # Direct tools — Export
-        FunctionTool(func=export.export_csv),
-        FunctionTool(func=export.export_parquet),
-        FunctionTool(func=export.export_json),
-        FunctionTool(func=export.export_jsonl),
-        FunctionTool(func=export.export_excel),
+        *(FunctionTool(func=_concurrent(func)) for func in _EXPORT_TOOLS),
         # Direct tools — Report
-        FunctionTool(func=report.export_quality_report),
-        FunctionTool(func=cleaning_report.export_cleaning_report),
+        FunctionTool(func=_concurrent(report.export_quality_report)),
+        FunctionTool(func=_concurrent(cleaning_report.export_cleaning_report)),
         # Direct tools — Quick profiling
-        FunctionTool(func=profiling.sample_data),
+        FunctionTool(func=_concurrent(profiling.sample_data)),
     ],
 )
+
+# ---------------------------------------------------------------------------
+# Prompt Warmup
+# ---------------------------------------------------------------------------
+
+
+def _warm_prompts():
+    """Prime Gemini's prefix cache with every agent prompt."""
+    from google import genai
+
+    warmup(
+        genai.Client(),
+        {
+            "coordinator": _config.coordinator_model,
+            "profiler": _config.profiler_model,
+            "schema_architect": _config.schema_architect_model,
+            "quality_analyst": _config.quality_analyst_model,
+            "data_cleaner": _config.data_cleaner_model,
+        },
+    )
+
+
+# Runs in the background so server startup is not blocked on the requests
+if _config.warmup_prompts:
+    threading.Thread(target=_warm_prompts, name="prompt-warmup", daemon=True).start()
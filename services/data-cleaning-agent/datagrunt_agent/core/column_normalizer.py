@@ -5,7 +5,7 @@ Works on any format, not just CSV.
 """
 
 import re
-
+from functools import lru_cache
 
 SPECIAL_CHARS_PATTERN = re.compile(r"[^a-z0-9]+")
 MULTI_UNDERSCORE_PATTERN = re.compile(r"_+")
@@ -13,6 +13,19 @@ CAMEL_CASE_BOUNDARY = re.compile(r"(.)([A-Z][a-z]+)")
 CAMEL_CASE_LOWER_UPPER = re.compile(r"([a-z0-9])([A-Z])")
 
 
+_ASCII_LOWER = frozenset("abcdefghijklmnopqrstuvwxyz")
+_ASCII_UPPER = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZ")
+_ASCII_LOWER_DIGIT = _ASCII_LOWER | frozenset("0123456789")
+
+# Byte table mapping every byte other than [a-z0-9] to an underscore, for
+# names with no uppercase letters (and therefore no camelCase boundaries).
+_SEPARATOR_TABLE = bytes(
+    b if b in b"abcdefghijklmnopqrstuvwxyz0123456789" else ord("_") for b in range(256)
+)
+_UNDERSCORE_RUNS = re.compile(rb"__+")
+
+
+@lru_cache(maxsize=4096)
 def normalize_column_name(name: str) -> str:
     """Normalize a single column name to lowercase snake_case.
 
@@ -23,7 +36,73 @@ def normalize_column_name(name: str) -> str:
     4. Collapse multiple underscores
     5. Strip leading/trailing underscores
     6. Prefix with underscore if starts with a digit
+
+    ASCII names (the common case) skip the regex pipeline: lowercase
+    names are mapped with one bytes.translate, mixed-case names take a
+    single-pass scanner. Anything else goes through the regex pipeline so
+    Unicode case mapping is handled exactly as before.
+    """
+    if name.isascii():
+        if name.islower():
+            result = _snake_case_translate(name)
+        else:
+            result = _snake_case_ascii(name)
+    else:
+        result = _snake_case_regex(name)
+
+    if not result:
+        return "unnamed"
+    if result[0].isdigit():
+        return f"_{result}"
+    return result
+
+
+def _snake_case_translate(name: str) -> str:
+    """snake_case for ASCII names without uppercase letters."""
+    out = name.encode("ascii").translate(_SEPARATOR_TABLE)
+    if b"__" in out:
+        out = _UNDERSCORE_RUNS.sub(b"_", out)
+    return out.strip(b"_").decode("ascii")
+
+
+def _snake_case_ascii(name: str) -> str:
+    """Single-pass equivalent of _snake_case_regex for ASCII input.
+
+    An underscore is emitted between two kept characters when they were
+    separated by non-alphanumerics, or when an uppercase letter starts a
+    camelCase word (it follows a lowercase letter/digit, or is followed
+    by a lowercase letter). Runs of separators collapse to one and
+    leading/trailing separators are dropped.
     """
+    chars: list[str] = []
+    pending_sep = False
+    prev = ""
+    last = len(name) - 1
+
+    for i, ch in enumerate(name):
+        if ch in _ASCII_LOWER_DIGIT:
+            if pending_sep and chars:
+                chars.append("_")
+            pending_sep = False
+            chars.append(ch)
+        elif ch in _ASCII_UPPER:
+            if i > 0 and (
+                prev in _ASCII_LOWER_DIGIT or (i < last and name[i + 1] in _ASCII_LOWER)
+            ):
+                pending_sep = True
+            if pending_sep and chars:
+                chars.append("_")
+            pending_sep = False
+            chars.append(ch.lower())
+        else:
+            pending_sep = True
+        prev = ch
+
+    return "".join(chars)
+
+
+def _snake_case_regex(name: str) -> str:
+    """Regex-based snake_case conversion (used for non-ASCII names)."""
     # Expand camelCase to snake_case
     result = CAMEL_CASE_BOUNDARY.sub(r"\1_\2", name)
     result = CAMEL_CASE_LOWER_UPPER.sub(r"\1_\2", result)
@@ -31,22 +110,17 @@ def normalize_column_name(name: str) -> str:
     result = result.lower()
     result = SPECIAL_CHARS_PATTERN.sub("_", result)
     result = result.strip("_")
-    result = MULTI_UNDERSCORE_PATTERN.sub("_", result)
-
-    if not result:
-        return "unnamed"
-    if result[0].isdigit():
-        return f"_{result}"
-    return result
+    return MULTI_UNDERSCORE_PATTERN.sub("_", result)
 
 
 def normalize_column_names(columns: list[str]) -> list[str]:
     """Normalize a list of column names, ensuring uniqueness.
 
-    Duplicate names get a numeric suffix (_1, _2, etc.).
+    Duplicate names get a numeric suffix (_1, _2, etc.). Wide schemas
+    often repeat header names (and reloads repeat whole schemas), so each
+    distinct name is normalized once.
     """
-    normalized = [normalize_column_name(col) for col in columns]
-    return make_unique(normalized)
+    return make_unique(list(map(normalize_column_name, columns)))
 
 
 def make_unique(names: list[str]) -> list[str]:
@@ -69,6 +143,4 @@ def build_rename_mapping(original: list[str]) -> dict[str, str]:
     Only includes entries where the name actually changes.
     """
     normalized = normalize_column_names(original)
-    return {
-        old: new for old, new in zip(original, normalized) if old != new
-    }
+    return {old: new for old, new in zip(original, normalized) if old != new}
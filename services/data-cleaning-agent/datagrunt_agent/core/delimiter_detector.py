@@ -3,12 +3,17 @@
 Ported from datagrunt/core/csv_io/csvcomponents.py CSVDelimiter.
 """
 
-import re
+import string
 from collections import Counter
+from functools import lru_cache
 from pathlib import Path
 
+from datagrunt_agent.core.file_detector import file_cache_key
 
-DELIMITER_REGEX_PATTERN = re.compile(r'[^0-9a-zA-Z_ "-]')
+# Characters that can never be a delimiter: [0-9a-zA-Z_ "-]. Deleting them
+# with str.translate leaves only delimiter candidates, in line order.
+_NON_DELIMITER_CHARS = string.ascii_letters + string.digits + '_ "-'
+_NON_DELIMITER_TABLE = str.maketrans("", "", _NON_DELIMITER_CHARS)
 DEFAULT_DELIMITER = ","
 TAB_DELIMITER = "\t"
 
@@ -25,6 +30,9 @@ def detect_delimiter(file_path: str) -> str:
     4. Return the most common one as the delimiter.
     5. Fall back to comma if nothing found.
 
+    Results are cached per (path, mtime, size), so repeat calls on an
+    unchanged file skip the read.
+
     Args:
         file_path: Path to the delimited file.
 
@@ -37,12 +45,20 @@ def detect_delimiter(file_path: str) -> str:
     if path.suffix.lower() in TSV_EXTENSIONS:
         return TAB_DELIMITER
 
+    abs_path, mtime_ns, size = file_cache_key(file_path)
+
     # Check for empty/blank file
-    if path.stat().st_size == 0:
+    if size == 0:
         return DEFAULT_DELIMITER
 
+    return _detect_delimiter_cached(abs_path, mtime_ns, size)
+
+
+@lru_cache(maxsize=256)
+def _detect_delimiter_cached(abs_path: str, mtime_ns: int, size: int) -> str:
+    """Frequency analysis on the header row (cached per file version)."""
     # Read first line
-    first_line = _read_first_line(file_path)
+    first_line = _read_first_line(abs_path)
     if not first_line:
         return DEFAULT_DELIMITER
 
@@ -57,10 +73,24 @@ def detect_delimiter(file_path: str) -> str:
     return candidates[0][0]
 
 
+_FIRST_LINE_MAX_BYTES = 1024 * 1024
+
+
 def _read_first_line(file_path: str) -> str:
-    """Read the first line of a file."""
-    with open(file_path, "r", encoding="utf-8", errors="replace") as fh:
-        return fh.readline().strip()
+    """Read the first line of a file.
+
+    Does one bounded binary read (1 MiB, far more than a header row needs)
+    and decodes only the bytes up to the first line break, so a file with
+    a huge or missing first newline is never read or decoded whole.
+    """
+    with open(file_path, "rb") as fh:
+        chunk = fh.read(_FIRST_LINE_MAX_BYTES)
+    end = len(chunk)
+    for terminator in (b"\n", b"\r"):
+        idx = chunk.find(terminator, 0, end)
+        if idx >= 0:
+            end = idx
+    return chunk[:end].decode("utf-8", errors="replace").strip()
 
 
 def _get_delimiter_candidates(line: str) -> list[tuple[str, int]]:
@@ -69,9 +99,7 @@ def _get_delimiter_candidates(line: str) -> list[tuple[str, int]]:
     Returns:
         List of (character, count) tuples sorted by frequency descending.
     """
-    line_no_spaces = line.replace(" ", "")
-    chars = DELIMITER_REGEX_PATTERN.findall(line_no_spaces)
-    counts = Counter(chars)
+    counts = Counter(line.translate(_NON_DELIMITER_TABLE))
     return counts.most_common()
 
 
@@ -90,16 +118,21 @@ def read_raw_lines(file_path: str, n: int = 15) -> list[str]:
     return lines
 
 
+_LINE_COUNT_BUFFER_BYTES = 8 * 1024 * 1024
+
+
 def count_source_lines(file_path: str) -> int:
     """Count the number of data lines in a file (excluding header).
 
-    Uses fast binary reading for performance on large files.
+    Reads into a single reusable buffer (no per-chunk allocation) and
+    counts newlines with bytearray.count, which runs in C.
     """
     line_count = 0
-    with open(file_path, "rb") as fh:
+    buf = bytearray(_LINE_COUNT_BUFFER_BYTES)
+    with open(file_path, "rb", buffering=0) as fh:
         while True:
-            buf = fh.read(1024 * 1024)
-            if not buf:
+            n = fh.readinto(buf)
+            if not n:
                 break
-            line_count += buf.count(b"\n")
+            line_count += buf.count(b"\n", 0, n)
     return max(line_count - 1, 0)
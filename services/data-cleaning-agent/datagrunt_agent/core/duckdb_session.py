@@ -1,37 +1,68 @@
 """DuckDB session manager with table registry and safe SQL execution."""
 
+import os
 import re
+import threading
+from collections.abc import Mapping
+from dataclasses import dataclass
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 import duckdb
 import polars as pl
 
+from datagrunt_agent.core.sql_loader import load_sql
 
 _DESTRUCTIVE_PATTERN = re.compile(
     r"^\s*(DELETE\b|DROP\s+TABLE\b|TRUNCATE\b|DROP\s+DATABASE\b)",
     re.IGNORECASE,
 )
+# Leading keywords every destructive statement starts with. Statements that
+# begin with anything else skip the regex entirely.
+_DESTRUCTIVE_KEYWORDS = ("DELETE", "DROP", "TRUNCATE")
+
+# Statements starting with these keywords never change table contents or
+# schemas, so they leave cached row counts and DESCRIBE results intact.
+# Anything else invalidates them.
+_READ_ONLY_KEYWORDS = (
+    "SELECT",
+    "FROM",
+    "DESCRIBE",
+    "SUMMARIZE",
+    "SHOW",
+    "EXPLAIN",
+    "PRAGMA",
+)
+
+# Runs of anything other than ASCII letters/digits (underscores included)
+# collapse to a single underscore in generated table names.
+_TABLE_NAME_SEPARATORS = re.compile(r"[^a-zA-Z0-9]+")
+
+_EXTENSIONS = ("icu", "spatial")
+
+# Process-wide extension state. INSTALL touches disk (and the network on
+# first use), so it runs once per process; later sessions only LOAD.
+# Extensions that failed to install are not retried.
+_installed_extensions: set[str] = set()
+_unavailable_extensions: set[str] = set()
+
+
+def _default_threads() -> int:
+    """Size the DuckDB thread pool from the host CPU count."""
+    return min(32, os.cpu_count() or 8)
 
 
+@dataclass(slots=True, frozen=True)
 class TableMetadata:
     """Metadata about a table loaded into the DuckDB session."""
 
-    def __init__(
-        self,
-        table_name: str,
-        source_path: str,
-        source_format: str,
-        row_count: int,
-        column_count: int,
-        source_row_count: int = 0,
-    ):
-        self.table_name = table_name
-        self.source_path = source_path
-        self.source_format = source_format
-        self.row_count = row_count
-        self.column_count = column_count
-        self.source_row_count = source_row_count
+    table_name: str
+    source_path: str
+    source_format: str
+    row_count: int
+    column_count: int
+    source_row_count: int = 0
 
 
 class DuckDBSession:
@@ -42,28 +73,54 @@ class DuckDBSession:
     - Table registry tracking loaded tables and their source files
     - Safe SQL execution with destructive query rejection
     - Helper methods for common operations
+
+    A DuckDB connection must not be shared across threads, so tools running
+    on worker threads get their own cursor onto the same in-memory database.
     """
 
-    def __init__(self, threads: int = 16):
-        self._connection = duckdb.connect(":memory:", config={"threads": threads})
+    def __init__(self, threads: int | None = None):
+        self._connection = duckdb.connect(
+            ":memory:",
+            config={"threads": threads or _default_threads()},
+        )
+        self._owner_thread = threading.get_ident()
+        self._thread_local = threading.local()
         self._table_registry: dict[str, TableMetadata] = {}
+        self._row_counts: dict[str, int] = {}
+        self._schemas: dict[str, list[tuple]] = {}
+        self._metadata_generation = 0
         self._install_extensions()
+        for statement in load_sql("common", "create_macros").split(";"):
+            self._connection.execute(statement)
 
     def _install_extensions(self):
-        """Install commonly needed DuckDB extensions."""
-        for ext in ("icu", "spatial"):
+        """Install (once per process) and load commonly needed extensions."""
+        for ext in _EXTENSIONS:
+            if ext in _unavailable_extensions:
+                continue
             try:
-                self._connection.execute(f"INSTALL {ext}; LOAD {ext};")
+                if ext not in _installed_extensions:
+                    self._connection.execute(f"INSTALL {ext}")
+                    _installed_extensions.add(ext)
+                self._connection.execute(f"LOAD {ext}")
             except Exception:
-                pass
+                _unavailable_extensions.add(ext)
 
     @property
     def connection(self) -> duckdb.DuckDBPyConnection:
-        return self._connection
+        """Return the connection to use from the calling thread."""
+        if threading.get_ident() == self._owner_thread:
+            return self._connection
+        cursor = getattr(self._thread_local, "cursor", None)
+        if cursor is None:
+            cursor = self._connection.cursor()
+            self._thread_local.cursor = cursor
+        return cursor
 
     @property
-    def table_registry(self) -> dict[str, TableMetadata]:
-        return dict(self._table_registry)
+    def table_registry(self) -> Mapping[str, TableMetadata]:
+        """Read-only live view of the registry (no copy per access)."""
+        return MappingProxyType(self._table_registry)
 
     def register_table(self, metadata: TableMetadata):
         """Register a table in the session registry."""
@@ -72,18 +129,43 @@ class DuckDBSession:
     def unregister_table(self, table_name: str):
         """Remove a table from the registry."""
         self._table_registry.pop(table_name, None)
+        self._row_counts.pop(table_name, None)
+        self._schemas.pop(table_name, None)
 
     def table_exists(self, table_name: str) -> bool:
         """Check if a table exists in the DuckDB session."""
         try:
-            self._connection.execute(f"SELECT 1 FROM {table_name} LIMIT 0")
+            self.connection.execute(f"SELECT 1 FROM {table_name} LIMIT 0")
             return True
         except Exception:
             return False
 
     def execute(self, sql: str) -> duckdb.DuckDBPyRelation:
         """Execute SQL against the session connection."""
-        return self._connection.sql(sql)
+        self._invalidate_cached_metadata(sql)
+        return self.connection.sql(sql)
+
+    def _invalidate_cached_metadata(self, sql: str):
+        """Drop cached row counts and schemas unless the statement is read-only."""
+        if (
+            not sql.lstrip()[:9]
+            .upper()
+            .startswith(
+                _READ_ONLY_KEYWORDS,
+            )
+        ):
+            self._metadata_generation += 1
+            self._row_counts.clear()
+            self._schemas.clear()
+
+    def scalar(self, sql: str) -> Any:
+        """Execute SQL and return the first column of its first row.
+
+        Returns None when the query produces no rows.
+        """
+        self._invalidate_cached_metadata(sql)
+        row = self.connection.execute(sql).fetchone()
+        return row[0] if row else None
 
     def execute_safe(self, sql: str) -> duckdb.DuckDBPyRelation:
         """Execute SQL with destructive query rejection.
@@ -94,19 +176,22 @@ class DuckDBSession:
         rejection = reject_destructive(sql)
         if rejection:
             raise ValueError(rejection["error"])
-        return self._connection.sql(sql)
+        self._invalidate_cached_metadata(sql)
+        return self.connection.sql(sql)
 
     def execute_to_polars(self, sql: str) -> pl.DataFrame:
         """Execute SQL and return results as a Polars DataFrame."""
-        return self._connection.sql(sql).pl()
+        self._invalidate_cached_metadata(sql)
+        return self.connection.sql(sql).pl()
 
     def execute_to_polars_safe(self, sql: str, table: str) -> pl.DataFrame:
         """Execute SQL safely, returning helpful errors on binder failures."""
         rejection = reject_destructive(sql)
         if rejection:
             raise ValueError(rejection["error"])
+        self._invalidate_cached_metadata(sql)
         try:
-            return self._connection.sql(sql).pl()
+            return self.connection.sql(sql).pl()
         except duckdb.BinderException as exc:
             columns = self.get_column_names(table)
             raise duckdb.BinderException(
@@ -115,25 +200,106 @@ class DuckDBSession:
 
     def get_column_names(self, table: str) -> list[str]:
         """Return column names for a table."""
-        return [
-            row["column_name"]
-            for row in self._connection.sql(f"DESCRIBE {table}").pl().to_dicts()
-        ]
+        return [row[0] for row in self._describe(table)]
 
     def get_column_types(self, table: str) -> dict[str, str]:
         """Return a mapping of column name to type for a table."""
-        rows = self._connection.sql(f"DESCRIBE {table}").pl().to_dicts()
-        return {row["column_name"]: row["column_type"] for row in rows}
+        return {row[0]: row[1] for row in self._describe(table)}
+
+    def _describe(self, table: str) -> list[tuple]:
+        """Return DESCRIBE rows as tuples: (column_name, column_type, ...).
+
+        Cached per table like row counts, so the Profiler, Quality Analyst
+        and Cleaner tools resolve a table's columns and types once between
+        schema or data changes instead of on every call.
+        """
+        rows = self._schemas.get(table)
+        if rows is None:
+            generation = self._metadata_generation
+            rows = self.connection.execute(f"DESCRIBE {table}").fetchall()
+            if generation == self._metadata_generation:
+                self._schemas[table] = rows
+        return rows
 
     def get_row_count(self, table: str) -> int:
-        """Return the row count for a table."""
-        return self._connection.sql(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+        """Return the row count for a table.
+
+        Counts are cached until the next statement that may modify data
+        runs through this session, so repeated calls between mutations
+        (profiling, quality checks, exports) skip the COUNT(*) scan.
+        """
+        count = self._row_counts.get(table)
+        if count is None:
+            generation = self._metadata_generation
+            count = self.connection.sql(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            # Don't cache a count that a concurrent write may have outdated
+            if generation == self._metadata_generation:
+                self._row_counts[table] = count
+        return count
+
+    def get_distinct_counts(self, table: str, columns: list[str]) -> dict[str, int]:
+        """Return exact non-null distinct counts for columns, in one scan.
+
+        Exact COUNT(DISTINCT) keeps a hash table per column; prefer the
+        HyperLogLog approx_unique from SUMMARIZE unless exactness matters.
+        """
+        if not columns:
+            return {}
+        row = self.aggregate(
+            table,
+            [f'COUNT(DISTINCT "{col}")' for col in columns],
+        )
+        return dict(zip(columns, row))
+
+    def aggregate(
+        self,
+        table: str,
+        aggregates: list[str],
+        projections: list[list[str]] | None = None,
+    ) -> tuple:
+        """Compute aggregate expressions over a table in one scan.
+
+        Built through the relational API (table → project → aggregate), so
+        no SELECT statement is assembled and parsed per probe; only the
+        expression lists are. ``projections`` are layers of expressions
+        evaluated in order before aggregating; each layer, and then the
+        aggregates, can reference the aliases of the layer before it.
+
+        Returns:
+            One value per aggregate expression, in order.
+        """
+        relation = self.connection.table(table)
+        for layer in projections or []:
+            relation = relation.project(", ".join(layer))
+        return relation.aggregate(", ".join(aggregates)).fetchone()
+
+    def get_columns_without_nulls(self, table: str) -> set[str]:
+        """Return columns that storage statistics prove contain no NULLs.
+
+        Reads DuckDB's per-segment zone-map statistics instead of scanning
+        data. A column qualifies only if every one of its segments reports
+        "Has Null: false" and none has pending in-place updates (whose
+        values the segment statistics may not cover). Any other column —
+        or any failure to read the statistics — is left out, so callers
+        scan those columns as before.
+        """
+        sql = (
+            "SELECT column_name FROM pragma_storage_info(?) "
+            "GROUP BY column_name "
+            "HAVING bool_or(contains(stats, 'Has Null: false')) "
+            "AND NOT bool_or(contains(stats, 'Has Null: true')) "
+            "AND NOT bool_or(has_updates)"
+        )
+        try:
+            rows = self.connection.execute(sql, [table]).fetchall()
+        except duckdb.Error:
+            return set()
+        return {row[0] for row in rows}
 
     def generate_table_name(self, file_path: str) -> str:
         """Generate a safe DuckDB table name from a file path."""
         stem = Path(file_path).stem
-        safe_name = re.sub(r"[^a-zA-Z0-9_]", "_", stem).lower()
-        safe_name = re.sub(r"_+", "_", safe_name).strip("_")
+        safe_name = _TABLE_NAME_SEPARATORS.sub("_", stem).strip("_").lower()
         if not safe_name or safe_name[0].isdigit():
             safe_name = f"t_{safe_name}"
         return f"table_{safe_name}"
@@ -160,17 +326,22 @@ class DuckDBSession:
         truncated = len(all_cols) > max_columns
         cols = all_cols[:max_columns]
 
-        def _truncate(value: str) -> str:
-            if len(value) > max_cell_width:
-                return value[: max_cell_width - 3] + "..."
-            return value
+        keep = max_cell_width - 3
+
+        def _cell(value: Any) -> str:
+            text = str(value)
+            if len(text) > max_cell_width:
+                return text[:keep] + "..."
+            return text
 
         header = "| " + " | ".join(cols) + " |"
         sep = "| " + " | ".join("---" for _ in cols) + " |"
-        rows = []
-        for row in frame.to_dicts():
-            row_str = "| " + " | ".join(_truncate(str(row[c])) for c in cols) + " |"
-            rows.append(row_str)
+        # rows() yields plain tuples for just the displayed columns — no
+        # per-row dict and no lookups for excluded/truncated columns.
+        rows = [
+            "| " + " | ".join(map(_cell, row)) + " |"
+            for row in frame.select(cols).rows()
+        ]
         lines = [header, sep] + rows
         if truncated:
             lines.append(f"\n*(showing {len(cols)} of {len(all_cols)} columns)*")
@@ -183,6 +354,8 @@ class DuckDBSession:
 
 def reject_destructive(sql: str) -> dict[str, Any] | None:
     """Return an error dict if the SQL would destroy data, else None."""
+    if not sql.lstrip()[:8].upper().startswith(_DESTRUCTIVE_KEYWORDS):
+        return None
     if _DESTRUCTIVE_PATTERN.search(sql):
         return {
             "error": (
@@ -195,6 +368,11 @@ def reject_destructive(sql: str) -> dict[str, Any] | None:
     return None
 
 
+def quote_identifier(name: str) -> str:
+    """Quote a name as a DuckDB identifier, escaping embedded quotes."""
+    return '"' + name.replace('"', '""') + '"'
+
+
 def validate_path(path: str) -> str:
     """Validate that the path exists and return the absolute path.
 
@@ -209,7 +387,9 @@ def validate_path(path: str) -> str:
     return abs_path
 
 
-def validate_column(column: str, table: str, session: "DuckDBSession") -> dict[str, Any] | None:
+def validate_column(
+    column: str, table: str, session: "DuckDBSession"
+) -> dict[str, Any] | None:
     """Return an error dict if column does not exist in table, else None."""
     columns = session.get_column_names(table)
     if column not in columns:
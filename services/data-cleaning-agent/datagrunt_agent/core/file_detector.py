@@ -1,12 +1,16 @@
 """Detect file format and encoding from extension, magic bytes, and byte analysis."""
 
+import codecs
 import enum
+import os
 import tempfile
+from functools import lru_cache
 from pathlib import Path
 
 
 class FileFormat(enum.Enum):
     """Supported file formats."""
+
     CSV = "csv"
     TSV = "tsv"
     JSON = "json"
@@ -65,14 +69,28 @@ def detect_format(file_path: str) -> FileFormat:
 
     # Fall back to magic bytes
     try:
-        with open(path, "rb") as fh:
-            header = fh.read(8)
-        for magic, fmt in MAGIC_BYTES.items():
-            if header.startswith(magic):
-                return fmt
-    except (OSError, IOError):
-        pass
+        return _detect_format_from_magic(*file_cache_key(file_path))
+    except OSError:
+        return FileFormat.UNKNOWN
+
+
+def file_cache_key(file_path: str) -> tuple[str, int, int]:
+    """Return (absolute path, mtime_ns, size) for memoizing per-file detection.
 
+    A rewritten file gets a new key, so cached results never go stale.
+    """
+    st = os.stat(file_path)
+    return os.path.abspath(file_path), st.st_mtime_ns, st.st_size
+
+
+@lru_cache(maxsize=256)
+def _detect_format_from_magic(abs_path: str, mtime_ns: int, size: int) -> FileFormat:
+    """Match the file header against MAGIC_BYTES (cached per file version)."""
+    with open(abs_path, "rb") as fh:
+        header = fh.read(8)
+    for magic, fmt in MAGIC_BYTES.items():
+        if header.startswith(magic):
+            return fmt
     return FileFormat.UNKNOWN
 
 
@@ -95,10 +113,22 @@ _BINARY_FORMATS = {FileFormat.PARQUET, FileFormat.EXCEL}
 _ENCODING_SAMPLE_BYTES = 65536  # 64KB sample for detection
 
 
+# Byte-order marks, longest first (the UTF-32 LE BOM starts with the UTF-16 LE one)
+_BOM_ENCODINGS = (
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+
 def detect_encoding(file_path: str, fmt: FileFormat | None = None) -> str | None:
     """Detect the character encoding of a text file.
 
-    Uses charset_normalizer to analyze the first 64KB.
+    Analyzes the first 64KB. BOM-marked, pure-ASCII and valid UTF-8 samples
+    are identified directly; only the remaining ambiguous samples go to
+    charset_normalizer.
 
     Args:
         file_path: Path to the file.
@@ -111,25 +141,88 @@ def detect_encoding(file_path: str, fmt: FileFormat | None = None) -> str | None
         return None
 
     try:
-        from charset_normalizer import from_bytes
+        return _detect_encoding_cached(*file_cache_key(file_path))
+    except Exception:
+        return "utf-8"
 
-        with open(file_path, "rb") as fh:
-            sample = fh.read(_ENCODING_SAMPLE_BYTES)
 
-        result = from_bytes(sample).best()
-        if result is None:
-            return "utf-8"
-        return result.encoding
-    except Exception:
+@lru_cache(maxsize=256)
+def _detect_encoding_cached(abs_path: str, mtime_ns: int, size: int) -> str:
+    """Detect the encoding of the file sample (cached per file version)."""
+    with open(abs_path, "rb") as fh:
+        sample = fh.read(_ENCODING_SAMPLE_BYTES)
+
+    shortcut = _detect_encoding_shortcut(sample)
+    if shortcut:
+        return shortcut
+
+    from charset_normalizer import from_bytes
+
+    result = from_bytes(sample).best()
+    if result is None:
         return "utf-8"
+    return result.encoding
+
+
+# Source encodings DuckDB's read_csv decodes natively, keyed by Python codec
+# name. UTF-16 is left out on purpose: delimiter detection, header sampling
+# and line counting all read the raw file as ASCII-compatible bytes.
+_DUCKDB_CSV_ENCODINGS = {"iso8859-1": "latin-1"}
+
+
+def duckdb_csv_encoding(encoding: str | None) -> str | None:
+    """Return the read_csv encoding option for a natively supported encoding.
+
+    Returns None when DuckDB cannot read the encoding directly.
+    """
+    if not encoding:
+        return None
+    try:
+        name = codecs.lookup(encoding).name
+    except LookupError:
+        return None
+    return _DUCKDB_CSV_ENCODINGS.get(name)
 
 
-def ensure_utf8(file_path: str, fmt: FileFormat | None = None) -> tuple[str, str | None, bool]:
+def _detect_encoding_shortcut(sample: bytes) -> str | None:
+    """Identify the common unambiguous cases without statistical detection.
+
+    Returns None when the sample needs charset_normalizer.
+    """
+    for bom, encoding in _BOM_ENCODINGS:
+        if sample.startswith(bom):
+            return encoding
+    if sample.isascii():
+        return "ascii"
+    try:
+        # final=False tolerates a multi-byte character cut off by the sample
+        codecs.getincrementaldecoder("utf-8")().decode(sample, final=False)
+    except UnicodeDecodeError:
+        return None
+    return "utf-8"
+
+
+def _is_utf8_compatible(encoding: str) -> bool:
+    """True if files in this encoding can be loaded without transcoding."""
+    try:
+        return codecs.lookup(encoding).name in ("utf-8", "ascii")
+    except LookupError:
+        return False
+
+
+def ensure_utf8(
+    file_path: str,
+    fmt: FileFormat | None = None,
+    allow_native: bool = False,
+) -> tuple[str, str | None, bool]:
     """Ensure a file is UTF-8 encoded, transcoding if necessary.
 
     Args:
         file_path: Path to the source file.
         fmt: Optional pre-detected format. Binary formats skip transcoding.
+        allow_native: If True and DuckDB can read the detected encoding
+            directly (see duckdb_csv_encoding), skip transcoding and return
+            the original path. The caller must pass the encoding to read_csv.
 
     Returns:
         Tuple of (load_path, detected_encoding, is_lossy):
@@ -142,38 +235,71 @@ def ensure_utf8(file_path: str, fmt: FileFormat | None = None) -> tuple[str, str
     if encoding is None:
         return file_path, None, False
 
-    if encoding.lower().replace("-", "") in ("utf8", "ascii"):
+    if _is_utf8_compatible(encoding):
         return file_path, encoding, False
 
-    # Transcode to UTF-8
-    is_lossy = False
-    try:
-        with open(file_path, "r", encoding=encoding, errors="strict") as src:
-            content = src.read()
-    except (UnicodeDecodeError, LookupError):
-        with open(file_path, "r", encoding=encoding, errors="replace") as src:
-            content = src.read()
-        is_lossy = True
+    if allow_native and duckdb_csv_encoding(encoding):
+        return file_path, encoding, False
 
+    # Transcode to UTF-8, streaming so memory stays O(chunk)
     suffix = Path(file_path).suffix
     tmp = tempfile.NamedTemporaryFile(
-        mode="w", suffix=suffix, delete=False, encoding="utf-8",
+        mode="w",
+        suffix=suffix,
+        delete=False,
+        encoding="utf-8",
     )
-    tmp.write(content)
+    try:
+        try:
+            _transcode_stream(file_path, tmp, encoding, errors="strict")
+            is_lossy = False
+        except UnicodeDecodeError:
+            tmp.seek(0)
+            tmp.truncate()
+            _transcode_stream(file_path, tmp, encoding, errors="replace")
+            is_lossy = True
+    except BaseException:
+        tmp.close()
+        os.unlink(tmp.name)
+        raise
     tmp.close()
 
     return tmp.name, encoding, is_lossy
 
 
+_TRANSCODE_CHUNK_CHARS = 1024 * 1024
+
+
+def _transcode_stream(file_path: str, dst, encoding: str, errors: str) -> None:
+    """Copy file_path into the UTF-8 text stream dst one chunk at a time.
+
+    The text-mode reader decodes incrementally, so multi-byte sequences
+    split across chunk boundaries are handled and newlines are normalized
+    exactly as a whole-file read would.
+    """
+    with open(file_path, "r", encoding=encoding, errors=errors) as src:
+        while chunk := src.read(_TRANSCODE_CHUNK_CHARS):
+            dst.write(chunk)
+
+
+_BLANK_SCAN_CHUNK_BYTES = 65536
+# ASCII characters str.strip() treats as whitespace.
+_ASCII_WHITESPACE_BYTES = b" \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f"
+
+
 def is_blank_file(file_path: str, size_threshold_mb: float = 10.0) -> bool:
     """Check if a file contains only whitespace.
 
     Skips the check for files larger than size_threshold_mb as they are
-    very unlikely to be blank.
+    very unlikely to be blank. Scans raw bytes in 64KB chunks and stops
+    at the first non-whitespace byte, so non-blank files are decided by
+    the first chunk without decoding.
     """
     path = Path(file_path)
     if path.stat().st_size / (1024 * 1024) >= size_threshold_mb:
         return False
-    with open(path, "r", encoding="utf-8", errors="replace") as fh:
-        content = fh.read().strip()
-    return not content
+    with open(path, "rb") as fh:
+        while chunk := fh.read(_BLANK_SCAN_CHUNK_BYTES):
+            if chunk.translate(None, _ASCII_WHITESPACE_BYTES):
+                return False
+    return True
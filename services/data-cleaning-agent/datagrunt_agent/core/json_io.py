@@ -0,0 +1,59 @@
+"""JSON encoding and decoding for reports and JSON ingestion.
+
+Reports are encoded by the stdlib json module: UTF-8, two-space
+indentation, and str() for values JSON cannot represent (datetimes,
+UUIDs, paths). Parsing uses orjson when it is installed and falls back to
+the stdlib, accepting the same documents either way.
+"""
+
+import json
+import os
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize obj to indented UTF-8 JSON bytes."""
+    return json.dumps(
+        obj,
+        indent=2,
+        default=str,
+        ensure_ascii=False,
+    ).encode("utf-8")
+
+
+def loads(text: str) -> Any:
+    """Parse a JSON document, raising json.JSONDecodeError if invalid.
+
+    orjson parses first; anything it rejects is re-parsed by the stdlib,
+    which also accepts NaN/Infinity and integers beyond 64 bits, so the
+    result and the error details (lineno, colno, msg) match json.loads.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
+
+
+def write_json(path: str, obj: Any) -> None:
+    """Write obj as JSON to path, replacing any existing file.
+
+    The encoded bytes go straight to the file descriptor, without the
+    buffered file object layers, normally in a single write() call. No
+    fsync is issued; report tools already run on the agent's tool thread
+    pool, so the write never blocks the event loop.
+    """
+    payload = memoryview(dumps(obj))
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_CLOEXEC", 0)
+    fd = os.open(path, flags, 0o644)
+    try:
+        while payload:
+            payload = payload[os.write(fd, payload) :]
+    finally:
+        os.close(fd)
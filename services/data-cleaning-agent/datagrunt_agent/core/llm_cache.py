@@ -0,0 +1,123 @@
+"""Content-addressed cache for the tools' one-shot Gemini calls.
+
+Header detection and PII detection send a prompt built entirely from file
+content, at temperature 0. Re-running the pipeline on a byte-identical file
+produces the same prompt, so the answer is looked up by
+sha256(purpose, model, prompt) instead of paying for another model round
+trip. Editing a prompt changes its hash, so stale answers are never reused.
+
+Entries live in process memory, least recently used first out once
+_MEMORY_MAX_ENTRIES is reached. Set DATAGRUNT_LLM_CACHE to a file path to
+also persist them in SQLite across runs.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+
+_MEMORY_MAX_ENTRIES = 1024
+_memory: OrderedDict[str, str] = OrderedDict()
+_lock = threading.Lock()
+
+_CREATE_TABLE = (
+    "CREATE TABLE IF NOT EXISTS llm_cache "
+    "(key TEXT PRIMARY KEY, response TEXT NOT NULL)"
+)
+
+
+def cache_key(purpose: str, model: str, prompt: str) -> str:
+    """Return the cache key for a prompt sent to a model for a purpose."""
+    digest = hashlib.sha256()
+    for part in (purpose, model, prompt):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _db_path() -> str:
+    return os.getenv("DATAGRUNT_LLM_CACHE", "")
+
+
+def _db_get(path: str, key: str) -> str | None:
+    try:
+        with sqlite3.connect(path) as conn:
+            conn.execute(_CREATE_TABLE)
+            row = conn.execute(
+                "SELECT response FROM llm_cache WHERE key = ?",
+                (key,),
+            ).fetchone()
+    except sqlite3.Error:
+        return None
+    return row[0] if row else None
+
+
+def _db_put(path: str, key: str, response: str):
+    try:
+        with sqlite3.connect(path) as conn:
+            conn.execute(_CREATE_TABLE)
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_cache VALUES (?, ?)",
+                (key, response),
+            )
+    except sqlite3.Error:
+        pass
+
+
+def _remember(key: str, response: str):
+    with _lock:
+        _memory[key] = response
+        _memory.move_to_end(key)
+        while len(_memory) > _MEMORY_MAX_ENTRIES:
+            _memory.popitem(last=False)
+
+
+def cached_generate[T](
+    purpose: str,
+    model: str,
+    prompt: str,
+    generate: Callable[[], str],
+    parse: Callable[[str], T],
+) -> T:
+    """Return parse() of the cached response, calling generate() on a miss.
+
+    A response is stored only after parse() accepts it, so a malformed
+    reply is never replayed; if generate() or parse() raises, nothing is
+    cached and the exception propagates to the caller's fallback. A stored
+    response that parse() rejects with ValueError, LookupError, TypeError
+    or AttributeError is dropped and regenerated.
+    """
+    key = cache_key(purpose, model, prompt)
+    with _lock:
+        cached = _memory.get(key)
+        if cached is not None:
+            _memory.move_to_end(key)
+
+    path = _db_path()
+    if cached is None and path:
+        cached = _db_get(path, key)
+
+    if cached is not None:
+        try:
+            result = parse(cached)
+        except (ValueError, LookupError, TypeError, AttributeError):
+            with _lock:
+                _memory.pop(key, None)
+        else:
+            _remember(key, cached)
+            return result
+
+    response = generate()
+    result = parse(response)
+    _remember(key, response)
+    if path:
+        _db_put(path, key, response)
+    return result
+
+
+def clear_memory_cache():
+    """Drop all in-process entries (the SQLite file is left untouched)."""
+    with _lock:
+        _memory.clear()
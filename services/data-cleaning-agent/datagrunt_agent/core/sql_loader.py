@@ -5,10 +5,10 @@ Supports simple {{ variable }} substitution for table names, file paths, etc.
 """
 
 import re
+from collections.abc import Callable
 from functools import lru_cache
 from pathlib import Path
 
-
 _SQL_DIR = Path(__file__).parent.parent / "sql"
 _TEMPLATE_PATTERN = re.compile(r"\{\{\s*(\w+)\s*\}\}")
 
@@ -25,6 +25,9 @@ def _read_sql_file(relative_path: str) -> str:
 def load_sql(category: str, name: str, **params: str) -> str:
     """Load a SQL template and substitute parameters.
 
+    Rendered SQL is cached per (template, params), so repeat calls with the
+    same table/column names skip rendering entirely.
+
     Args:
         category: The subdirectory (e.g., 'ingestion', 'profiling').
         name: The SQL file name without extension (e.g., 'load_csv').
@@ -37,19 +40,60 @@ def load_sql(category: str, name: str, **params: str) -> str:
         sql = load_sql('ingestion', 'load_csv', file_path='/data/test.csv', table_name='test')
     """
     relative_path = f"{category}/{name}.sql"
-    template = _read_sql_file(relative_path)
-    return render_template(template, **params)
+    try:
+        params_key = tuple(sorted(params.items()))
+        hash(params_key)
+    except TypeError:
+        return render_template(_read_sql_file(relative_path), **params)
+    return _render_cached(relative_path, params_key)
+
+
+def compile_sql(category: str, name: str) -> Callable[..., str]:
+    """Load a SQL template once and return its render function.
+
+    Meant for module-level use with templates whose parameters rarely
+    repeat (e.g. export output paths): rendering skips load_sql's cache
+    key and result cache, which one-off SQL would only churn.
+
+    Example:
+        to_csv = compile_sql('export', 'to_csv')
+        sql = to_csv(table_name='test', output_path='/tmp/test.csv')
+    """
+    segments = _split_template(_read_sql_file(f"{category}/{name}.sql"))
+
+    def render(**params: str) -> str:
+        return _render_segments(segments, params)
+
+    return render
+
+
+@lru_cache(maxsize=512)
+def _render_cached(relative_path: str, params_key: tuple) -> str:
+    """Render a template file with a hashable parameter tuple (cached)."""
+    return render_template(_read_sql_file(relative_path), **dict(params_key))
+
+
+@lru_cache(maxsize=256)
+def _split_template(template: str) -> tuple[str, ...]:
+    """Split a template once into alternating literal / parameter-name
+    segments (even indexes are literals, odd indexes parameter names)."""
+    return tuple(_TEMPLATE_PATTERN.split(template))
+
+
+def _render_segments(segments: tuple[str, ...], params: dict) -> str:
+    """Join pre-split template segments, substituting parameter values."""
+    try:
+        return "".join(
+            str(params[segment]) if i % 2 else segment
+            for i, segment in enumerate(segments)
+        )
+    except KeyError as exc:
+        raise KeyError(
+            f"Missing SQL template parameter: '{exc.args[0]}'. "
+            f"Available: {list(params.keys())}"
+        ) from None
 
 
 def render_template(template: str, **params: str) -> str:
     """Substitute {{ variable }} placeholders in a SQL template."""
-    def replacer(match):
-        key = match.group(1)
-        if key not in params:
-            raise KeyError(
-                f"Missing SQL template parameter: '{key}'. "
-                f"Available: {list(params.keys())}"
-            )
-        return str(params[key])
-
-    return _TEMPLATE_PATTERN.sub(replacer, template)
+    return _render_segments(_split_template(template), params)
@@ -0,0 +1,114 @@
+"""Agent instructions resolved lazily and reused on every turn.
+
+ADK treats a plain-string instruction as a template: every model request
+re-scans the whole prompt for ``{state_key}`` placeholders before sending
+it. None of the DataGrunt prompts use session-state templating, so each
+agent is given an instruction provider that returns the constant as-is,
+which ADK sends without the per-turn template pass.
+
+Prompt modules are imported on first use, so building the agent tree
+does not materialize prompts for agents that never run. ``warmup`` opts
+out of that laziness at startup and primes Gemini's prefix cache.
+"""
+
+import importlib
+import logging
+from collections.abc import Callable
+from functools import cache, lru_cache
+from typing import Any
+
+# Prompt name -> (module, constant) under datagrunt_agent.prompts
+_PROMPT_SOURCES = {
+    "coordinator": ("coordinator", "COORDINATOR_PROMPT"),
+    "data_cleaner": ("data_cleaner", "DATA_CLEANER_PROMPT"),
+    "profiler": ("profiler", "PROFILER_PROMPT"),
+    "quality_analyst": ("quality_analyst", "QUALITY_ANALYST_PROMPT"),
+    "schema_architect": ("schema_architect", "SCHEMA_ARCHITECT_PROMPT"),
+}
+
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=8)
+def get_prompt(name: str) -> str:
+    """Return the named prompt, importing its module on first access.
+
+    Raises:
+        KeyError: If no prompt is registered under ``name``.
+    """
+    module_name, constant = _PROMPT_SOURCES[name]
+    module = importlib.import_module(f"datagrunt_agent.prompts.{module_name}")
+    return getattr(module, constant)
+
+
+def prompt_versions() -> dict[str, str]:
+    """Return each prompt's PROMPT_VERSION (``name@sha``), keyed by name.
+
+    Layers that cache or checkpoint agent output should include these in
+    their keys: an edited prompt gets a new version, an unchanged one keeps
+    its version across restarts.
+    """
+    versions = {}
+    for name, (module_name, _) in _PROMPT_SOURCES.items():
+        get_prompt(name)
+        module = importlib.import_module(f"datagrunt_agent.prompts.{module_name}")
+        versions[name] = module.PROMPT_VERSION
+    return versions
+
+
+@cache
+def instruction_provider(name: str) -> Callable[[Any], str]:
+    """Return an ADK instruction provider for the named prompt.
+
+    Raises:
+        KeyError: If no prompt is registered under ``name``.
+    """
+    if name not in _PROMPT_SOURCES:
+        raise KeyError(name)
+
+    def provide(_context: Any) -> str:
+        return get_prompt(name)
+
+    provide.__name__ = f"{name}_instruction"
+    return provide
+
+
+def warmup(client: Any = None, models: dict[str, str] | None = None) -> list[str]:
+    """Resolve every prompt and optionally prime the model's prefix cache.
+
+    Without a client this only imports the prompt modules, so the first
+    turn of each agent does not pay for it. With a ``google.genai`` client
+    and a prompt name -> model mapping, each prompt is also sent once as
+    the system instruction of a 1-token request, so Gemini's implicit
+    context cache already holds the prompt prefix when real traffic
+    arrives. Warmup is best-effort: a request the API rejects (quota,
+    server or auth errors) is logged and skipped.
+
+    Returns:
+        Names of the prompts that were sent to the model.
+    """
+    for name in _PROMPT_SOURCES:
+        get_prompt(name)
+    if client is None:
+        return []
+
+    from google.genai import errors, types
+
+    warmed = []
+    for name, model in (models or {}).items():
+        try:
+            client.models.generate_content(
+                model=model,
+                contents=".",
+                config=types.GenerateContentConfig(
+                    system_instruction=get_prompt(name),
+                    max_output_tokens=1,
+                    temperature=0,
+                ),
+            )
+        except errors.APIError as exc:
+            logger.warning("Prompt warmup for %s on %s failed: %s", name, model, exc)
+            continue
+        warmed.append(name)
+    return warmed
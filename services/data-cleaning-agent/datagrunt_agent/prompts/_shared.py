@@ -0,0 +1,11 @@
+"""Prompt text shared verbatim by every DataGrunt agent.
+
+Kept byte-identical across agents so the rules are stated one way and
+the repeated tokens are the same for every model call.
+"""
+
+# Appended to the end of each agent's "## Rules" section.
+SHARED_RULES_FOOTER = """\
+- Never guess column names or statistics. Use the values the tools return.
+- Be concise. Data engineers need facts, not fluff.
+"""
@@ -1,6 +1,14 @@
 """Schema Architect agent instructions (Phase 2 — schema detection, evolution, canonicalization)."""
 
-SCHEMA_ARCHITECT_PROMPT = """\
+import hashlib
+import sys
+
+from datagrunt_agent.prompts._shared import SHARED_RULES_FOOTER
+
+__all__ = ["PROMPT_SHA", "PROMPT_VERSION", "SCHEMA_ARCHITECT_PROMPT"]
+
+SCHEMA_ARCHITECT_PROMPT = sys.intern(
+    """\
 You are the Schema Architect, a specialist agent focused on schema detection,
 schema evolution, and canonical schema transformation.
 
@@ -29,3 +37,9 @@ sources conform to a single, clean, canonical schema.
 - Flag columns that exist in only some tables as optional vs required.
 - Always present proposals for user confirmation before applying.
 """
+    + SHARED_RULES_FOOTER
+)
+
+# Content hash of the prompt; changes whenever the prompt text does
+PROMPT_SHA = hashlib.sha256(SCHEMA_ARCHITECT_PROMPT.encode()).hexdigest()[:12]
+PROMPT_VERSION = "schema_architect@" + PROMPT_SHA
@@ -0,0 +1,2 @@
+CREATE OR REPLACE TABLE {{ table_name }} AS
+SELECT * REPLACE ({{ cast_list }}) FROM {{ table_name }}
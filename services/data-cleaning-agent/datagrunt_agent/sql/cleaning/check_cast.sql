@@ -0,0 +1 @@
+SELECT COUNT(TRY_CAST("{{ column_name }}" AS {{ new_type }})) FROM {{ table_name }}
@@ -1 +0,0 @@
-ALTER TABLE {{ table_name }} DROP COLUMN "{{ column_name }}"
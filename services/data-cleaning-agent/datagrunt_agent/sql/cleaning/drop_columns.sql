@@ -0,0 +1,2 @@
+CREATE OR REPLACE TABLE {{ table_name }} AS
+SELECT * EXCLUDE ({{ column_list }}) FROM {{ table_name }}
@@ -1,9 +1,6 @@
-ALTER TABLE {{ table_name }} ADD COLUMN IF NOT EXISTS is_duplicate BOOLEAN DEFAULT false;
-
-UPDATE {{ table_name }}
-SET is_duplicate = true
-WHERE rowid NOT IN (
-    SELECT MIN(rowid)
-    FROM {{ table_name }}
-    GROUP BY {{ column_list }}
-)
+CREATE OR REPLACE TABLE {{ table_name }} AS
+SELECT
+    {{ select_list }},
+    ROW_NUMBER() OVER (PARTITION BY {{ column_list }} ORDER BY rowid) > 1 AS is_duplicate
+FROM {{ table_name }}
+ORDER BY rowid
@@ -0,0 +1,3 @@
+UPDATE {{ table_name }}
+SET {{ assignments }}
+WHERE {{ changed_predicate }}
@@ -0,0 +1,7 @@
+CREATE OR REPLACE MACRO is_null_like_normalized(x) AS
+    x IN (SELECT v FROM (VALUES
+        ('null'), ('none'), ('n/a'), ('na'), ('-'), (''), ('#n/a'), ('nan'), ('missing')
+    ) AS sentinels(v));
+
+CREATE OR REPLACE MACRO is_null_like(x) AS
+    is_null_like_normalized(LOWER(TRIM(x::VARCHAR)))
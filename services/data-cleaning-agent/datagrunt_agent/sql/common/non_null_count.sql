@@ -1 +0,0 @@
-SELECT COUNT(*) FROM {{ table_name }} WHERE "{{ column_name }}" IS NOT NULL
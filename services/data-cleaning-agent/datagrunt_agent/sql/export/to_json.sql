@@ -1 +1 @@
-COPY (SELECT * FROM {{ table_name }}) TO '{{ output_path }}' (ARRAY true)
+COPY {{ table_name }} TO '{{ output_path }}' (FORMAT JSON, ARRAY true)
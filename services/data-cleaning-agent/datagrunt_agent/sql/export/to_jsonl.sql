@@ -1 +1 @@
-COPY (SELECT * FROM {{ table_name }}) TO '{{ output_path }}'
+COPY {{ table_name }} TO '{{ output_path }}' (FORMAT JSON, ARRAY false)
@@ -1 +1 @@
-COPY {{ table_name }} TO '{{ output_path }}' (FORMAT PARQUET)
+COPY {{ table_name }} TO '{{ output_path }}' (FORMAT PARQUET, COMPRESSION ZSTD, ROW_GROUP_SIZE 122880)
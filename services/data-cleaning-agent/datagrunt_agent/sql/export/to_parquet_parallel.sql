@@ -0,0 +1 @@
+COPY {{ table_name }} TO '{{ output_path }}' (FORMAT PARQUET, PER_THREAD_OUTPUT TRUE, COMPRESSION ZSTD, ROW_GROUP_SIZE 122880)
@@ -1 +0,0 @@
-SELECT COUNT(*) FROM {{ table_name }} WHERE {{ null_conditions }}
@@ -3,6 +3,7 @@ SELECT *
 FROM read_csv(
     '{{ file_path }}',
     sep = '{{ delimiter }}',
+    encoding = '{{ encoding }}',
     quote = '{{ quote_char }}',
     escape = '{{ escape_char }}',
     auto_detect = true,
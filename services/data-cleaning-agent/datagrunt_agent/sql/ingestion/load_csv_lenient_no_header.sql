@@ -3,6 +3,7 @@ SELECT *
 FROM read_csv(
     '{{ file_path }}',
     sep = '{{ delimiter }}',
+    encoding = '{{ encoding }}',
     header = false,
     auto_detect = true,
     strict_mode = false,
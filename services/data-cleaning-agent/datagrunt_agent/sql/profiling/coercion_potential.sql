@@ -0,0 +1 @@
+SELECT {{ aggregates }} FROM {{ table_name }}
@@ -0,0 +1,10 @@
+SELECT
+    '{{ table_name }}' AS table_name,
+    column_name,
+    column_type,
+    approx_unique,
+    null_percentage::FLOAT AS null_percentage,
+    min,
+    max,
+    avg
+FROM (SUMMARIZE SELECT * FROM {{ source_table }})
@@ -0,0 +1,3 @@
+CREATE OR REPLACE TEMP TABLE {{ sample_table }} AS
+SELECT * FROM {{ table_name }}
+USING SAMPLE reservoir({{ sample_size }} ROWS) REPEATABLE (42)
@@ -5,6 +5,7 @@ Executes a strict cleaning protocol in a fixed order:
 2. Whitespace trimming
 3. Empty string → NULL normalization
 4. Null-like string normalization (sentinels → NULL)
+   (steps 1-4 run fused, as one multi-column UPDATE)
 5. Date standardization (YYYY-MM-DD)
 6. Type coercion (VARCHAR → tighter types, skip identifiers)
 7. Mixed-case normalization (low-cardinality categoricals → lowercase)
@@ -13,6 +14,7 @@ Executes a strict cleaning protocol in a fixed order:
 10. Constant column removal (cardinality of 1)
 11. PII detection (LLM-assisted, informational)
 12. Numeric precision validation (informational)
+   (steps 11 and 12 run concurrently)
 
 Uses session.execute() (not execute_safe) because ALTER TABLE ADD/DROP
 COLUMN is required. TRY_CAST is used for type coercion so non-castable
@@ -20,41 +22,45 @@ values become NULL instead of erroring.
 """
 
 import json
+import logging
 import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
+import duckdb
 from google.adk.tools import ToolContext
 
+from datagrunt_agent.core.llm_cache import cached_generate
 from datagrunt_agent.core.sql_loader import load_sql
 from datagrunt_agent.tools.ingestion import _get_session
 
-# Null-like sentinel values — must match quality.py
-_NULL_LIKE_SENTINELS = (
-    "'null'", "'none'", "'n/a'", "'na'", "'-'", "''",
-    "'#n/a'", "'nan'", "'missing'",
-)
-_SENTINEL_LIST = ", ".join(_NULL_LIKE_SENTINELS)
+logger = logging.getLogger(__name__)
 
 # Common mojibake replacements (Windows-1252 -> UTF-8 misinterpretation)
 # Keys are the mojibake sequences, values are the correct UTF-8 characters.
 _MOJIBAKE_MAP = {
-    "\u00c3\u00a9": "\u00e9",   # Ã© -> é
-    "\u00c3\u00a1": "\u00e1",   # Ã¡ -> á
-    "\u00c3\u00ad": "\u00ed",   # Ã­ -> í
-    "\u00c3\u00b3": "\u00f3",   # Ã³ -> ó
-    "\u00c3\u00ba": "\u00fa",   # Ãº -> ú
-    "\u00c3\u00b1": "\u00f1",   # Ã± -> ñ
-    "\u00c3\u00bc": "\u00fc",   # Ã¼ -> ü
-    "\u00c3\u00b6": "\u00f6",   # Ã¶ -> ö
-    "\u00c3\u00a4": "\u00e4",   # Ã¤ -> ä
-    "\u00c3\u00ab": "\u00eb",   # Ã« -> ë
-    "\u00c3\u00af": "\u00ef",   # Ã¯ -> ï
-    "\u00c3\u00a7": "\u00e7",   # Ã§ -> ç
-    "\u00c2\u00b0": "\u00b0",   # Â° -> °
-    "\u00c2\u00a3": "\u00a3",   # Â£ -> £
-    "\u00c2\u00a9": "\u00a9",   # Â© -> ©
+    "\u00c3\u00a9": "\u00e9",  # Ã© -> é
+    "\u00c3\u00a1": "\u00e1",  # Ã¡ -> á
+    "\u00c3\u00ad": "\u00ed",  # Ã­ -> í
+    "\u00c3\u00b3": "\u00f3",  # Ã³ -> ó
+    "\u00c3\u00ba": "\u00fa",  # Ãº -> ú
+    "\u00c3\u00b1": "\u00f1",  # Ã± -> ñ
+    "\u00c3\u00bc": "\u00fc",  # Ã¼ -> ü
+    "\u00c3\u00b6": "\u00f6",  # Ã¶ -> ö
+    "\u00c3\u00a4": "\u00e4",  # Ã¤ -> ä
+    "\u00c3\u00ab": "\u00eb",  # Ã« -> ë
+    "\u00c3\u00af": "\u00ef",  # Ã¯ -> ï
+    "\u00c3\u00a7": "\u00e7",  # Ã§ -> ç
+    "\u00c2\u00b0": "\u00b0",  # Â° -> °
+    "\u00c2\u00a3": "\u00a3",  # Â£ -> £
+    "\u00c2\u00a9": "\u00a9",  # Â© -> ©
 }
 
+# Max concurrent per-column cast checks when the batched cast fails
+_MAX_PARALLEL_CAST_CHECKS = 4
+
 # Protected columns that should never be dropped or modified by cleaning
 _PROTECTED_COLUMNS = {"processed_at", "is_duplicate"}
 
@@ -70,7 +76,10 @@ def clean_table(table_name: str, tool_context: ToolContext) -> dict[str, Any]:
 
     Returns:
         Dict with status, before/after metrics, per-operation results,
-        PII detection flags, identifier columns, and cleaning_report_path.
+        PII detection flags, identifier columns, cleaning_report_path, and
+        step_events: one step_complete event per executed step (steps 1-4
+        run as one "string_cleanup" step), in the order they finished;
+        the concurrent steps 11 and 12 are reported in protocol order.
     """
     session = _get_session()
 
@@ -80,81 +89,110 @@ def clean_table(table_name: str, tool_context: ToolContext) -> dict[str, Any]:
     findings = tool_context.state.get("quality_findings", [])
     source_file = tool_context.state.get("current_file", "")
 
-    # Snapshot before-state
+    # Snapshot before-state; the column metadata comes from the same lookup
     before_rows = session.get_row_count(table_name)
-    before_types = session.get_column_types(table_name)
-    before_columns = len([c for c in before_types if c != "processed_at"])
-
-    # Collect column metadata
     column_types = session.get_column_types(table_name)
     all_columns = [c for c in column_types if c != "processed_at"]
+    before_columns = len(all_columns)
     varchar_cols = [c for c in all_columns if column_types[c] == "VARCHAR"]
 
     # Run cleaning operations in strict order
     operations = []
-
-    # 1. Unknown character replacement
-    op = _clean_unknown_chars(session, table_name, varchar_cols)
-    if op:
-        operations.append(op)
-
-    # 2. Whitespace trimming
-    op = _clean_whitespace(session, table_name, varchar_cols, findings)
-    if op:
-        operations.append(op)
-
-    # 3. Empty string → NULL
-    op = _clean_empty_strings(session, table_name, varchar_cols)
-    if op:
-        operations.append(op)
-
-    # 4. Null-like string normalization
-    op = _clean_null_like_strings(session, table_name, findings)
-    if op:
-        operations.append(op)
+    step_events: list[dict] = []
+
+    # 1-4. Unknown chars, whitespace, empty → NULL, null-like → NULL,
+    # fused into one multi-column UPDATE. The probe scan also collects
+    # step 7's case statistics of the cleaned values.
+    started = time.perf_counter()
+    case_probe: dict[str, tuple[int, int]] = {}
+    string_ops = _clean_strings(
+        session,
+        table_name,
+        varchar_cols,
+        findings,
+        case_probe=case_probe,
+    )
+    _step_complete(
+        step_events,
+        table_name,
+        "string_cleanup",
+        started,
+        {"rows_affected": sum(o.get("rows_affected", 0) for o in string_ops)}
+        if string_ops
+        else None,
+    )
+    operations.extend(string_ops)
 
     # 5. Date standardization
+    started = time.perf_counter()
     op = _standardize_dates(session, table_name, findings)
+    _step_complete(step_events, table_name, "date_standardization", started, op)
     if op:
         operations.append(op)
+        for col in op["columns_standardized"]:
+            case_probe.pop(col, None)
 
     # 6. Type coercion
+    started = time.perf_counter()
     identifier_columns = []
     op, identifiers = _clean_type_coercion(session, table_name, findings)
     identifier_columns = identifiers
+    _step_complete(step_events, table_name, "type_coercion", started, op)
     if op:
         operations.append(op)
 
     # 7. Mixed-case normalization (refresh column types after coercion)
+    started = time.perf_counter()
     column_types = session.get_column_types(table_name)
     varchar_cols_post = [
-        c for c in column_types
+        c
+        for c in column_types
         if column_types[c] == "VARCHAR" and c not in _PROTECTED_COLUMNS
     ]
-    op = _normalize_case(session, table_name, varchar_cols_post)
+    op = _normalize_case(session, table_name, varchar_cols_post, case_probe)
+    _step_complete(step_events, table_name, "mixed_case_normalization", started, op)
     if op:
         operations.append(op)
 
     # 8. Soft dedup
+    started = time.perf_counter()
     op = _flag_duplicates(session, table_name, findings)
+    _step_complete(step_events, table_name, "soft_dedup", started, op)
     if op:
         operations.append(op)
 
     # 9. High-null column removal
+    started = time.perf_counter()
     op = _clean_high_null_columns(session, table_name, findings)
+    _step_complete(step_events, table_name, "high_null_column_removal", started, op)
     if op:
         operations.append(op)
 
     # 10. Constant column removal
+    started = time.perf_counter()
     op = _clean_constant_columns(session, table_name, findings)
+    _step_complete(step_events, table_name, "constant_column_removal", started, op)
     if op:
         operations.append(op)
 
-    # 11. PII detection (informational — LLM-assisted)
-    pii_detection = _detect_pii(session, table_name)
-
-    # 12. Numeric precision validation (informational)
-    numeric_precision_flags = _validate_numeric_precision(session, table_name)
+    # 11-12. PII detection (LLM-assisted) and numeric precision validation
+    # only read the cleaned table, so the PII sample query and Gemini round
+    # trip run on a worker cursor while the precision scan runs here
+    started = time.perf_counter()
+    precision_events: list[dict] = []
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        pii_future = pool.submit(_detect_pii, session, table_name)
+        numeric_precision_flags = _validate_numeric_precision(session, table_name)
+        _step_complete(
+            precision_events,
+            table_name,
+            "numeric_precision_validation",
+            started,
+            None,
+        )
+        pii_detection = pii_future.result()
+    _step_complete(step_events, table_name, "pii_detection", started, None)
+    step_events.extend(precision_events)
 
     # Snapshot after-state
     after_rows = session.get_row_count(table_name)
@@ -177,12 +215,13 @@ def clean_table(table_name: str, tool_context: ToolContext) -> dict[str, Any]:
         "pii_detection": pii_detection,
         "identifier_columns": identifier_columns,
         "numeric_precision_flags": numeric_precision_flags,
+        "step_events": step_events,
     }
 
     # Build and persist cleaning report
     from datagrunt_agent.tools.cleaning_report import build_cleaning_report
-
     from datagrunt_agent.tools.ingestion import _get_output_dir
+
     output_dir = _get_output_dir()
 
     report = build_cleaning_report(
@@ -200,234 +239,469 @@ def clean_table(table_name: str, tool_context: ToolContext) -> dict[str, Any]:
     return result
 
 
-# ---------------------------------------------------------------------------
-# Cleaning Operation Helpers
-# ---------------------------------------------------------------------------
-
+def _step_complete(
+    step_events: list[dict],
+    table_name: str,
+    step: str,
+    started: float,
+    op: dict | None,
+) -> None:
+    """Record and log a step_complete event as soon as a step finishes.
 
-def _clean_unknown_chars(
-    session, table_name: str, varchar_cols: list[str],
-) -> dict | None:
-    """Replace U+FFFD and common mojibake patterns in VARCHAR columns."""
-    if not varchar_cols:
-        return None
-
-    columns_cleaned = []
-    total_replacements = 0
+    The log line gives live progress while clean_table is still running;
+    the event list is returned with the result.
+    """
+    event = {
+        "event": "step_complete",
+        "step": step,
+        "changed": op is not None,
+        "rows_affected": op.get("rows_affected") if op else 0,
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+    }
+    step_events.append(event)
+    logger.info(
+        "clean_table %s: step %s done in %.1f ms",
+        table_name,
+        step,
+        event["elapsed_ms"],
+    )
 
-    for col in varchar_cols:
-        # Check for U+FFFD replacement character
-        count_sql = (
-            f'SELECT COUNT(*) FROM {table_name} '
-            f'WHERE "{col}" LIKE \'%\ufffd%\''
-        )
-        count = session.execute(count_sql).fetchone()[0]
 
-        if count > 0:
-            sql = load_sql(
-                "cleaning", "replace_unknown_chars",
-                table_name=table_name, column_name=col,
-            )
-            session.execute(sql)
-            total_replacements += count
-            if col not in columns_cleaned:
-                columns_cleaned.append(col)
-
-        # Check for common mojibake patterns
-        for bad, good in _MOJIBAKE_MAP.items():
-            check_sql = (
-                f'SELECT COUNT(*) FROM {table_name} '
-                f"WHERE \"{col}\" LIKE '%{bad}%'"
-            )
-            try:
-                mc = session.execute(check_sql).fetchone()[0]
-            except Exception:
-                continue
-            if mc > 0:
-                update_sql = (
-                    f'UPDATE {table_name} '
-                    f"SET \"{col}\" = REPLACE(\"{col}\", '{bad}', '{good}') "
-                    f"WHERE \"{col}\" LIKE '%{bad}%'"
-                )
-                session.execute(update_sql)
-                total_replacements += mc
-                if col not in columns_cleaned:
-                    columns_cleaned.append(col)
+# ---------------------------------------------------------------------------
+# Cleaning Operation Helpers
+# ---------------------------------------------------------------------------
 
-    if not columns_cleaned:
-        return None
 
-    return {
-        "operation": "unknown_char_replacement",
-        "columns_cleaned": columns_cleaned,
-        "replacements": total_replacements,
-    }
+# Logical string-cleanup steps (protocol steps 1-4), in protocol order
+_STRING_STEPS = ("unknown_chars", "whitespace", "empty_strings", "null_like")
 
 
-def _clean_whitespace(
-    session, table_name: str, varchar_cols: list[str],
+def _clean_strings(
+    session,
+    table_name: str,
+    varchar_cols: list[str],
     findings: list[dict],
-) -> dict | None:
-    """Trim leading/trailing whitespace from VARCHAR columns with issues."""
-    # Get columns flagged by quality scan
-    flagged = {
-        f["column"]
-        for f in findings
-        if f.get("category") == "whitespace"
-    }
+    steps: tuple[str, ...] = _STRING_STEPS,
+    case_probe: dict[str, tuple[int, int]] | None = None,
+) -> list[dict]:
+    """Run cleaning steps 1-4 as a single UPDATE of the table.
+
+    Unknown-character replacement, whitespace trimming, empty string →
+    NULL, and null-like sentinel → NULL compose into one expression per
+    column, applied in protocol order. One probe scan over the table
+    counts what each step changes in every column, and only the steps
+    (and mojibake patterns) with something to change are composed into
+    the column's expression. All columns are then rewritten by one UPDATE
+    whose WHERE clause (a needle regex and the step checks, OR'd) selects
+    only the rows where some column changes.
+
+    Targets follow the individual steps: steps 1-3 apply to VARCHAR
+    columns (whitespace also to columns flagged by the quality scan),
+    step 4 only to columns flagged with null-like strings.
+
+    If ``case_probe`` is given, it is filled with the step 7 statistics
+    of the cleaned VARCHAR columns from the same probe scan.
 
-    # Also trim all VARCHAR columns (whitespace may exist beyond what was flagged)
-    targets = list(set(varchar_cols) | flagged)
-    if not targets:
-        return None
-
-    columns_cleaned = []
-    total_affected = 0
+    Returns:
+        Operation dicts for the steps that changed data, in protocol order.
+    """
+    varchar = [c for c in varchar_cols if c not in _PROTECTED_COLUMNS]
+    flagged_whitespace = {
+        f["column"] for f in findings if f.get("category") == "whitespace"
+    }
+    flagged_null_like = [
+        f["column"] for f in findings if f.get("category") == "null_like_strings"
+    ]
 
-    for col in targets:
-        if col in _PROTECTED_COLUMNS:
+    plan: dict[str, list[str]] = {}
+    for col in [*varchar, *sorted(flagged_whitespace), *flagged_null_like]:
+        if col in _PROTECTED_COLUMNS or col in plan:
+            continue
+        col_steps = []
+        if "unknown_chars" in steps and col in varchar:
+            col_steps.append("unknown_chars")
+        if "whitespace" in steps and (col in varchar or col in flagged_whitespace):
+            col_steps.append("whitespace")
+        if "empty_strings" in steps and col in varchar:
+            col_steps.append("empty_strings")
+        if "null_like" in steps and col in flagged_null_like:
+            col_steps.append("null_like")
+        if col_steps:
+            plan[col] = col_steps
+
+    # U+FFFD and the mojibake sequences are all non-ASCII, so columns with
+    # no multi-byte characters skip step 1 entirely
+    unknown_char_cols = [c for c, s in plan.items() if "unknown_chars" in s]
+    non_ascii = _non_ascii_columns(session, table_name, unknown_char_cols)
+    for col in unknown_char_cols:
+        if col not in non_ascii:
+            plan[col].remove("unknown_chars")
+            if not plan[col]:
+                del plan[col]
+
+    columns_cleaned: dict[str, list[str]] = {step: [] for step in _STRING_STEPS}
+    affected = dict.fromkeys(_STRING_STEPS, 0)
+
+    probes = _probe_string_steps(
+        session,
+        table_name,
+        plan,
+        set(varchar),
+        case_probe,
+    )
+    cleaned_exprs: dict[str, str] = {}
+    change_predicates: dict[str, str] = {}
+    for col, col_steps in plan.items():
+        counts, needles = probes[col]
+        changing = [step for step in col_steps if counts[step] > 0]
+        if not changing:
             continue
 
-        # Count rows with whitespace before cleaning
-        count_sql = (
-            f'SELECT COUNT(*) FROM {table_name} '
-            f'WHERE "{col}" IS NOT NULL AND "{col}" != TRIM("{col}")'
+        cleaned_exprs[col] = _string_cleanup_expr(col, changing, needles)
+        change_predicates[col] = _string_change_predicate(col, changing, needles)
+        for step in changing:
+            columns_cleaned[step].append(col)
+            affected[step] += counts[step]
+
+    if cleaned_exprs:
+        session.execute(
+            load_sql(
+                "cleaning",
+                "fused_string_cleanup",
+                table_name=table_name,
+                **_multi_column_update(cleaned_exprs, change_predicates),
+            )
         )
-        count = session.execute(count_sql).fetchone()[0]
 
-        if count > 0:
-            sql = load_sql(
-                "cleaning", "trim_whitespace",
-                table_name=table_name, column_name=col,
+    operations = []
+    if columns_cleaned["unknown_chars"]:
+        operations.append(
+            {
+                "operation": "unknown_char_replacement",
+                "columns_cleaned": columns_cleaned["unknown_chars"],
+                "replacements": affected["unknown_chars"],
+            }
+        )
+    for step, operation in (
+        ("whitespace", "whitespace_trimming"),
+        ("empty_strings", "empty_string_normalization"),
+        ("null_like", "null_like_normalization"),
+    ):
+        if columns_cleaned[step]:
+            operations.append(
+                {
+                    "operation": operation,
+                    "columns_cleaned": columns_cleaned[step],
+                    "rows_affected": affected[step],
+                }
             )
-            session.execute(sql)
-            columns_cleaned.append(col)
-            total_affected += count
+    return operations
 
-    if not columns_cleaned:
-        return None
 
+def _multi_column_update(
+    exprs: dict[str, str],
+    predicates: dict[str, str] | None = None,
+) -> dict[str, str]:
+    """Build the SET list and changed-row predicate for a multi-column UPDATE.
+
+    ``predicates`` gives a cheaper test per column for "this row changes";
+    columns without one fall back to comparing against the new value.
+    """
+    predicates = predicates or {}
     return {
-        "operation": "whitespace_trimming",
-        "columns_cleaned": columns_cleaned,
-        "rows_affected": total_affected,
+        "assignments": ", ".join(f'"{c}" = {e}' for c, e in exprs.items()),
+        "changed_predicate": " OR ".join(
+            f"({predicates[c]})" if c in predicates else f'"{c}" IS DISTINCT FROM {e}'
+            for c, e in exprs.items()
+        ),
     }
 
 
-def _clean_empty_strings(
-    session, table_name: str, varchar_cols: list[str],
-) -> dict | None:
-    """Convert empty/whitespace-only strings to NULL."""
-    if not varchar_cols:
-        return None
+# U+FFFD followed by the mojibake sequences, in REPLACE-chain order
+_UNKNOWN_CHAR_NEEDLES = ("\ufffd", *_MOJIBAKE_MAP)
 
-    columns_cleaned = []
-    total_affected = 0
 
-    for col in varchar_cols:
-        if col in _PROTECTED_COLUMNS:
-            continue
-        # Count empties before cleaning
-        count_sql = (
-            f'SELECT COUNT(*) FROM {table_name} '
-            f"WHERE TRIM(\"{col}\") = ''"
-        )
-        count = session.execute(count_sql).fetchone()[0]
+def _needle_pattern(needles: tuple[str, ...] | list[str]) -> str:
+    """RE2 alternation matching any of the needles, for one-pass scans."""
+    return "|".join(re.escape(needle) for needle in needles)
 
-        if count > 0:
-            sql = load_sql(
-                "cleaning", "normalize_empty_strings",
-                table_name=table_name, column_name=col,
-            )
-            session.execute(sql)
-            columns_cleaned.append(col)
-            total_affected += count
 
-    if not columns_cleaned:
-        return None
+def _replace_unknown_chars_expr(
+    expr: str,
+    needles: tuple[str, ...] | list[str] = _UNKNOWN_CHAR_NEEDLES,
+) -> str:
+    """Wrap expr in the REPLACE chain for the given U+FFFD/mojibake needles."""
+    for needle in needles:
+        expr = f"REPLACE({expr}, '{needle}', '{_MOJIBAKE_MAP.get(needle, '')}')"
+    return expr
 
-    return {
-        "operation": "empty_string_normalization",
-        "columns_cleaned": columns_cleaned,
-        "rows_affected": total_affected,
-    }
 
+def _non_ascii_columns(session, table_name: str, columns: list[str]) -> set[str]:
+    """Return the columns holding at least one non-ASCII character.
 
-def _clean_null_like_strings(
-    session, table_name: str, findings: list[dict],
-) -> dict | None:
-    """Convert null-like sentinel strings to actual NULL."""
-    flagged = [
-        f for f in findings
-        if f.get("category") == "null_like_strings"
-    ]
+    A value is pure ASCII exactly when its byte length equals its character
+    length, so one aggregate scan checks every column at once.
+    """
+    if not columns:
+        return set()
+    row = session.aggregate(
+        table_name,
+        [f'BOOL_OR(strlen("{c}") != length("{c}"))' for c in columns],
+    )
+    return {c for c, has_non_ascii in zip(columns, row) if has_non_ascii}
 
-    if not flagged:
-        return None
 
-    columns_cleaned = []
-    total_affected = 0
+def _probe_string_steps(
+    session,
+    table_name: str,
+    plan: dict[str, list[str]],
+    varchar: set[str],
+    case_probe: dict[str, tuple[int, int]] | None = None,
+) -> dict[str, tuple[dict[str, int], list[str]]]:
+    """Count, in one scan of the table, the rows each step would change.
 
-    for finding in flagged:
-        col = finding["column"]
-        if col in _PROTECTED_COLUMNS:
-            continue
+    Each step is counted against the value the previous steps produce,
+    matching what the steps counted when they ran as separate UPDATEs.
 
-        count_sql = (
-            f'SELECT COUNT(*) FROM {table_name} '
-            f'WHERE LOWER(TRIM("{col}"::VARCHAR)) IN ({_SENTINEL_LIST})'
-        )
-        count = session.execute(count_sql).fetchone()[0]
+    When ``case_probe`` is given, the same scan also fills it with the
+    step 7 statistics (see _probe_case) of each VARCHAR column's cleaned
+    value, so mixed-case normalization need not scan those columns again.
 
-        if count > 0:
-            sql = load_sql(
-                "cleaning", "normalize_null_like",
-                table_name=table_name,
-                column_name=col,
-                sentinel_list=_SENTINEL_LIST,
+    Returns:
+        column -> (step -> rows changed, unknown-char needles present).
+    """
+    result: dict[str, tuple[dict[str, int], list[str]]] = {}
+    if not plan:
+        return result
+
+    # Each layer adds aliases computed once from the layer before: the raw
+    # value, its unknown-char matches (one RE2 pass over all needles), the
+    # fixed value, TRIM of that, LOWER of the trimmed value, and the fully
+    # cleaned value. The step checks reuse them instead of re-running the
+    # string functions per aggregate.
+    raws: list[str] = []
+    matches: list[str] = []
+    values: list[str] = []
+    trimmed: list[str] = []
+    lowered: list[str] = []
+    cleaned: list[str] = []
+    aggregates: list[tuple[str, str, str | None, str]] = []
+    case_aggregates: list[str] = []
+    case_cols: list[str] = []
+    for i, (col, col_steps) in enumerate(plan.items()):
+        raw_alias, m_alias, v_alias = f"raw_{i}", f"m_{i}", f"v_{i}"
+        t_alias, n_alias = f"t_{i}", f"n_{i}"
+        raw = f'"{col}"' if col in varchar else f'"{col}"::VARCHAR'
+        raws.append(f"{raw} AS {raw_alias}")
+        value = raw_alias
+        if "unknown_chars" in col_steps:
+            matches.append(
+                f"regexp_extract_all({raw_alias}, "
+                f"'{_needle_pattern(_UNKNOWN_CHAR_NEEDLES)}') AS {m_alias}"
+            )
+            # Only rows with a match pay for the REPLACE chain
+            value = (
+                f"CASE WHEN len({m_alias}) = 0 THEN {raw_alias} "
+                f"ELSE {_replace_unknown_chars_expr(raw_alias)} END"
+            )
+        values.append(f"{value} AS {v_alias}")
+        if set(col_steps) - {"unknown_chars"}:
+            trimmed.append(f"TRIM({v_alias}) AS {t_alias}")
+        if "null_like" in col_steps:
+            lowered.append(f"LOWER({t_alias}) AS {n_alias}")
+
+        if "unknown_chars" in col_steps:
+            for needle in _UNKNOWN_CHAR_NEEDLES:
+                aggregates.append(
+                    (
+                        col,
+                        "unknown_chars",
+                        needle,
+                        f"COUNT(*) FILTER (WHERE list_contains({m_alias}, '{needle}'))",
+                    )
+                )
+        if "whitespace" in col_steps:
+            aggregates.append(
+                (
+                    col,
+                    "whitespace",
+                    None,
+                    (
+                        f"COUNT(*) FILTER (WHERE {v_alias} IS NOT NULL "
+                        f"AND {v_alias} != {t_alias})"
+                    ),
+                )
+            )
+        if "empty_strings" in col_steps:
+            aggregates.append(
+                (
+                    col,
+                    "empty_strings",
+                    None,
+                    f"COUNT(*) FILTER (WHERE {t_alias} = '')",
+                )
             )
-            session.execute(sql)
-            columns_cleaned.append(col)
-            total_affected += count
+        if "null_like" in col_steps:
+            # Empty strings are already NULL by the time step 4 runs
+            not_empty = f" AND {t_alias} != ''" if "empty_strings" in col_steps else ""
+            aggregates.append(
+                (
+                    col,
+                    "null_like",
+                    None,
+                    (
+                        f"COUNT(*) FILTER (WHERE is_null_like_normalized({n_alias})"
+                        f"{not_empty})"
+                    ),
+                )
+            )
+        result[col] = (dict.fromkeys(col_steps, 0), [])
+
+        if case_probe is not None and col in varchar:
+            # Steps that change nothing leave the value as is, so the
+            # full-plan value equals what the UPDATE will write
+            cleaned_alias = f"c_{i}"
+            expr = t_alias if "whitespace" in col_steps else v_alias
+            if "empty_strings" in col_steps:
+                expr = f"CASE WHEN {t_alias} = '' THEN NULL ELSE {expr} END"
+            if "null_like" in col_steps:
+                expr = (
+                    f"CASE WHEN is_null_like_normalized({n_alias}) "
+                    f"THEN NULL ELSE {expr} END"
+                )
+            cleaned.append(f"{expr} AS {cleaned_alias}")
+            case_aggregates.extend(_case_aggregates(cleaned_alias))
+            case_cols.append(col)
+
+    row = session.aggregate(
+        table_name,
+        [*(expr for *_, expr in aggregates), *case_aggregates],
+        [
+            raws,
+            *(
+                ["*", *layer]
+                for layer in (matches, values, trimmed, lowered, cleaned)
+                if layer
+            ),
+        ],
+    )
 
-    if not columns_cleaned:
-        return None
+    for (col, step, needle, _), count in zip(aggregates, row):
+        counts, needles = result[col]
+        counts[step] += count
+        if needle is not None and count > 0:
+            needles.append(needle)
+    case_row = row[len(aggregates) :]
+    for i, col in enumerate(case_cols):
+        case_probe[col] = (case_row[2 * i], case_row[2 * i + 1])
+    return result
 
-    return {
-        "operation": "null_like_normalization",
-        "columns_cleaned": columns_cleaned,
-        "rows_affected": total_affected,
-    }
+
+def _string_cleanup_expr(
+    col: str,
+    col_steps: list[str],
+    needles: list[str],
+) -> str:
+    """Compose the per-column cleanup expression for the given steps."""
+    expr = f'"{col}"'
+    trimmed = False
+    if "unknown_chars" in col_steps:
+        expr = _replace_unknown_chars_expr(expr, needles)
+    if "whitespace" in col_steps:
+        expr = f"TRIM({expr})"
+        trimmed = True
+    if "empty_strings" in col_steps:
+        if trimmed:
+            expr = f"NULLIF({expr}, '')"
+        else:
+            expr = f"CASE WHEN TRIM({expr}) = '' THEN NULL ELSE {expr} END"
+    if "null_like" in col_steps:
+        # An already-trimmed value needs only lowering before the lookup
+        check = (
+            f"is_null_like_normalized(LOWER({expr}))"
+            if trimmed
+            else f"is_null_like({expr})"
+        )
+        expr = f"CASE WHEN {check} THEN NULL ELSE {expr} END"
+    return expr
+
+
+def _string_change_predicate(
+    col: str,
+    col_steps: list[str],
+    needles: list[str],
+) -> str:
+    """Return a predicate true exactly for rows the cleanup expression changes.
+
+    Tests the raw value with one regex match over the needles and the step
+    checks instead of evaluating the full REPLACE chain a second time in
+    the WHERE clause.
+    A row without any needle is unchanged by step 1, so the later steps'
+    checks can be made on the raw value; a row with one always changes.
+    """
+    q = f'"{col}"'
+    tests = []
+    if "unknown_chars" in col_steps:
+        tests.append(f"regexp_matches({q}, '{_needle_pattern(needles)}')")
+    if "whitespace" in col_steps:
+        tests.append(f"{q} != TRIM({q})")
+    if "empty_strings" in col_steps:
+        tests.append(f"TRIM({q}) = ''")
+    if "null_like" in col_steps:
+        tests.append(f"is_null_like({q})")
+    return " OR ".join(tests)
 
 
 def _standardize_dates(
-    session, table_name: str, findings: list[dict],
+    session,
+    table_name: str,
+    findings: list[dict],
 ) -> dict | None:
-    """Standardize DATE-castable VARCHAR columns to YYYY-MM-DD format."""
+    """Standardize DATE-castable VARCHAR columns to YYYY-MM-DD format.
+
+    All columns are rewritten by one multi-column UPDATE; values that do
+    not cast to DATE are kept as they are.
+    """
     date_cols = [
         f["column"]
         for f in findings
-        if f.get("category") == "type_analysis"
-        and f.get("date_castable_rate", 0) > 0.9
+        if f.get("category") == "type_analysis" and f.get("date_castable_rate", 0) > 0.9
     ]
 
     if not date_cols:
         return None
 
+    date_cols = list(dict.fromkeys(c for c in date_cols if c not in _PROTECTED_COLUMNS))
     columns_standardized = []
 
-    for col in date_cols:
-        if col in _PROTECTED_COLUMNS:
-            continue
-        try:
-            sql = load_sql(
-                "cleaning", "standardize_date",
-                table_name=table_name, column_name=col,
+    try:
+        session.execute(
+            load_sql(
+                "cleaning",
+                "standardize_dates",
+                table_name=table_name,
+                **_multi_column_update(
+                    {c: _standardized_date_expr(c) for c in date_cols},
+                    {c: f'TRY_CAST("{c}" AS DATE) IS NOT NULL' for c in date_cols},
+                ),
             )
-            session.execute(sql)
-            columns_standardized.append(col)
-        except Exception:
-            pass
+        )
+        columns_standardized = date_cols
+    except Exception:
+        # Fall back to one UPDATE per column so a column that cannot be
+        # standardized does not block the others
+        for col in date_cols:
+            try:
+                sql = load_sql(
+                    "cleaning",
+                    "standardize_date",
+                    table_name=table_name,
+                    column_name=col,
+                )
+                session.execute(sql)
+                columns_standardized.append(col)
+            except Exception:
+                pass
 
     if not columns_standardized:
         return None
@@ -439,16 +713,27 @@ def _standardize_dates(
     }
 
 
+def _standardized_date_expr(col: str) -> str:
+    """The column as YYYY-MM-DD where it casts to DATE, else unchanged."""
+    return f"""COALESCE(STRFTIME(TRY_CAST("{col}" AS DATE), '%Y-%m-%d'), "{col}")"""
+
+
 def _clean_type_coercion(
-    session, table_name: str, findings: list[dict],
+    session,
+    table_name: str,
+    findings: list[dict],
 ) -> tuple[dict | None, list[dict]]:
     """Coerce VARCHAR columns to tighter types, preserving identifiers.
 
+    All casts run as one table rewrite (SELECT * REPLACE) rather than one
+    planned ALTER per column.
+
     Returns:
         Tuple of (operation_result, identifier_columns).
     """
     type_findings = [
-        f for f in findings
+        f
+        for f in findings
         if f.get("category") == "type_analysis"
         and (f.get("suggested_cast") or f.get("leading_zero_count", 0) > 0)
     ]
@@ -459,6 +744,7 @@ def _clean_type_coercion(
     columns_coerced = {}
     coercion_failures = []
     identifier_columns = []
+    to_cast: dict[str, str] = {}
 
     for finding in type_findings:
         col = finding["column"]
@@ -470,11 +756,13 @@ def _clean_type_coercion(
 
         # Skip identifiers with leading zeros
         if leading_zeros > 0:
-            identifier_columns.append({
-                "column": col,
-                "pattern": "leading_zeros",
-                "preserved_as": "VARCHAR",
-            })
+            identifier_columns.append(
+                {
+                    "column": col,
+                    "pattern": "leading_zeros",
+                    "preserved_as": "VARCHAR",
+                }
+            )
             continue
 
         # Skip if no suggested cast (only came in for identifier detection)
@@ -485,21 +773,45 @@ def _clean_type_coercion(
         if suggested == "DATE":
             continue
 
+        to_cast[col] = suggested
+
+    if to_cast:
         try:
-            sql = load_sql(
-                "cleaning", "cast_column_type",
-                table_name=table_name,
-                column_name=col,
-                new_type=suggested,
-            )
-            session.execute(sql)
-            columns_coerced[col] = suggested
-        except Exception as exc:
-            coercion_failures.append({
-                "column": col,
-                "target_type": suggested,
-                "error": str(exc),
-            })
+            _cast_columns(session, table_name, to_cast)
+            columns_coerced.update(to_cast)
+        except Exception:
+            # Check each cast on its own, concurrently on worker cursors, so
+            # a single bad target type is reported without blocking the
+            # other columns, then apply the good casts in one rewrite
+            workers = min(_MAX_PARALLEL_CAST_CHECKS, len(to_cast))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                errors = list(
+                    pool.map(
+                        lambda item: _cast_error(session, table_name, *item),
+                        to_cast.items(),
+                    )
+                )
+            castable = {}
+            for (col, new_type), error in zip(to_cast.items(), errors):
+                if error is None:
+                    castable[col] = new_type
+                else:
+                    coercion_failures.append(
+                        {
+                            "column": col,
+                            "target_type": new_type,
+                            "error": error,
+                        }
+                    )
+            if castable:
+                try:
+                    _cast_columns(session, table_name, castable)
+                    columns_coerced.update(castable)
+                except duckdb.Error as exc:
+                    coercion_failures.extend(
+                        {"column": col, "target_type": new_type, "error": str(exc)}
+                        for col, new_type in castable.items()
+                    )
 
     if not columns_coerced and not coercion_failures:
         return None, identifier_columns
@@ -514,47 +826,85 @@ def _clean_type_coercion(
     return result, identifier_columns
 
 
-def _normalize_case(
-    session, table_name: str, varchar_cols: list[str],
-) -> dict | None:
-    """Normalize low-cardinality VARCHAR columns to lowercase.
+def _cast_columns(session, table_name: str, casts: dict[str, str]) -> None:
+    """TRY_CAST columns to new types in one table rewrite."""
+    session.execute(
+        load_sql(
+            "cleaning",
+            "cast_column_types",
+            table_name=table_name,
+            cast_list=", ".join(
+                f'TRY_CAST("{col}" AS {new_type}) AS "{col}"'
+                for col, new_type in casts.items()
+            ),
+        )
+    )
 
-    Only targets columns with < 50 unique values (categoricals).
-    """
-    if not varchar_cols:
-        return None
 
-    columns_normalized = []
+def _cast_error(
+    session,
+    table_name: str,
+    column: str,
+    new_type: str,
+) -> str | None:
+    """Return why casting a column fails, or None if the cast succeeds.
 
-    for col in varchar_cols:
-        if col in _PROTECTED_COLUMNS:
-            continue
+    Read-only, so checks for different columns can run concurrently.
+    """
+    try:
+        session.scalar(
+            load_sql(
+                "cleaning",
+                "check_cast",
+                table_name=table_name,
+                column_name=column,
+                new_type=new_type,
+            )
+        )
+    except duckdb.Error as exc:
+        return str(exc)
+    return None
 
-        # Check cardinality
-        card_sql = f'SELECT COUNT(DISTINCT "{col}") FROM {table_name} WHERE "{col}" IS NOT NULL'
-        cardinality = session.execute(card_sql).fetchone()[0]
 
-        if cardinality >= 50:
-            continue
+def _normalize_case(
+    session,
+    table_name: str,
+    varchar_cols: list[str],
+    known_probes: dict[str, tuple[int, int]] | None = None,
+) -> dict | None:
+    """Normalize low-cardinality VARCHAR columns to lowercase.
 
-        # Check if any values have mixed case (not already lowercase)
-        mixed_sql = (
-            f'SELECT COUNT(*) FROM {table_name} '
-            f'WHERE "{col}" IS NOT NULL AND "{col}" != LOWER("{col}")'
-        )
-        mixed_count = session.execute(mixed_sql).fetchone()[0]
+    Only targets columns with < 50 unique values (categoricals), by
+    approximate count. The cardinality and mixed-case counts for every
+    column come from one scan, and all targeted columns are lowered by one
+    UPDATE. Columns in ``known_probes`` (still current counts gathered
+    by an earlier scan) are not scanned again.
+    """
+    cols = [c for c in varchar_cols if c not in _PROTECTED_COLUMNS]
+    if not cols:
+        return None
 
-        if mixed_count > 0:
-            sql = load_sql(
-                "cleaning", "normalize_case",
-                table_name=table_name, column_name=col,
-            )
-            session.execute(sql)
-            columns_normalized.append(col)
+    known_probes = known_probes or {}
+    probes = {c: known_probes[c] for c in cols if c in known_probes}
+    unprobed = [c for c in cols if c not in probes]
+    if unprobed:
+        probes.update(_probe_case(session, table_name, unprobed))
+    columns_normalized = [
+        col for col in cols if probes[col][0] < 50 and probes[col][1] > 0
+    ]
 
     if not columns_normalized:
         return None
 
+    session.execute(
+        load_sql(
+            "cleaning",
+            "normalize_case",
+            table_name=table_name,
+            **_multi_column_update({c: f'LOWER("{c}")' for c in columns_normalized}),
+        )
+    )
+
     return {
         "operation": "mixed_case_normalization",
         "columns_normalized": columns_normalized,
@@ -562,49 +912,72 @@ def _normalize_case(
     }
 
 
+def _probe_case(
+    session,
+    table_name: str,
+    cols: list[str],
+) -> dict[str, tuple[int, int]]:
+    """Return column -> (approx distinct values, rows not already lowercase).
+
+    The cardinality only gates a < 50 threshold, so the HyperLogLog estimate
+    replaces an exact COUNT(DISTINCT) and its per-column hash table.
+    """
+    aggregates = []
+    for col in cols:
+        aggregates.extend(_case_aggregates(f'"{col}"'))
+    row = session.aggregate(table_name, aggregates)
+    return {col: (row[2 * i], row[2 * i + 1]) for i, col in enumerate(cols)}
+
+
+def _case_aggregates(expr: str) -> list[str]:
+    """Aggregates for _probe_case's (distinct values, not-lowercase rows)."""
+    return [
+        f"APPROX_COUNT_DISTINCT({expr})",
+        f"COUNT(*) FILTER (WHERE {expr} != LOWER({expr}))",
+    ]
+
+
 def _flag_duplicates(
-    session, table_name: str, findings: list[dict],
+    session,
+    table_name: str,
+    findings: list[dict],
 ) -> dict | None:
     """Add is_duplicate boolean column to flag duplicate rows.
 
-    Flags all-but-first occurrence. Never deletes rows.
+    Flags all-but-first occurrence. Never deletes rows. The column is
+    computed by a window over the table in one rewrite, rather than
+    ADD COLUMN followed by an UPDATE.
     """
     dup_findings = [
-        f for f in findings
-        if f.get("category") == "duplicates"
-        and f.get("approximate_count", 0) > 0
+        f
+        for f in findings
+        if f.get("category") == "duplicates" and f.get("approximate_count", 0) > 0
     ]
 
     if not dup_findings:
         return None
 
     columns = session.get_column_names(table_name)
-    check_columns = [
-        c for c in columns
-        if c not in _PROTECTED_COLUMNS
-    ]
+    check_columns = [c for c in columns if c not in _PROTECTED_COLUMNS]
 
     if not check_columns:
         return None
 
     column_list = ", ".join(f'"{c}"' for c in check_columns)
 
+    # One rewrite computes the flag; a flag from an earlier run is replaced
     sql = load_sql(
-        "cleaning", "flag_duplicates",
-        table_name=table_name, column_list=column_list,
+        "cleaning",
+        "flag_duplicates",
+        table_name=table_name,
+        select_list=("* EXCLUDE (is_duplicate)" if "is_duplicate" in columns else "*"),
+        column_list=column_list,
     )
-
-    # Execute each statement separately (ADD COLUMN + UPDATE)
-    for stmt in sql.split(";"):
-        stmt = stmt.strip()
-        if stmt:
-            session.execute(stmt)
+    session.execute(sql)
 
     # Count flagged duplicates
-    count_sql = (
-        f"SELECT COUNT(*) FROM {table_name} WHERE is_duplicate = true"
-    )
-    flagged_count = session.execute(count_sql).fetchone()[0]
+    count_sql = f"SELECT COUNT(*) FROM {table_name} WHERE is_duplicate = true"
+    flagged_count = session.scalar(count_sql)
 
     return {
         "operation": "soft_dedup",
@@ -614,34 +987,20 @@ def _flag_duplicates(
 
 
 def _clean_high_null_columns(
-    session, table_name: str, findings: list[dict],
+    session,
+    table_name: str,
+    findings: list[dict],
 ) -> dict | None:
     """Drop columns with >90% null rate."""
-    high_null = [
-        f for f in findings
-        if f.get("category") == "null_analysis"
-        and f.get("null_rate", 0) > 0.9
-    ]
-
-    if not high_null:
-        return None
-
-    columns_dropped = []
-
-    for finding in high_null:
-        col = finding["column"]
-        if col in _PROTECTED_COLUMNS:
-            continue
-
-        sql = load_sql(
-            "cleaning", "drop_column",
-            table_name=table_name, column_name=col,
-        )
-        try:
-            session.execute(sql)
-            columns_dropped.append(col)
-        except Exception:
-            pass
+    columns_dropped = _drop_columns(
+        session,
+        table_name,
+        [
+            f["column"]
+            for f in findings
+            if f.get("category") == "null_analysis" and f.get("null_rate", 0) > 0.9
+        ],
+    )
 
     if not columns_dropped:
         return None
@@ -653,34 +1012,21 @@ def _clean_high_null_columns(
 
 
 def _clean_constant_columns(
-    session, table_name: str, findings: list[dict],
+    session,
+    table_name: str,
+    findings: list[dict],
 ) -> dict | None:
     """Drop columns with cardinality of 1 (single unique value)."""
-    constant_findings = [
-        f for f in findings
-        if f.get("category") == "constant_columns"
-    ]
-
-    if not constant_findings:
-        return None
-
-    columns_dropped = []
-
-    for finding in constant_findings:
-        cols = finding.get("columns", [])
-        for col in cols:
-            if col in _PROTECTED_COLUMNS:
-                continue
-
-            sql = load_sql(
-                "cleaning", "drop_column",
-                table_name=table_name, column_name=col,
-            )
-            try:
-                session.execute(sql)
-                columns_dropped.append(col)
-            except Exception:
-                pass
+    columns_dropped = _drop_columns(
+        session,
+        table_name,
+        [
+            col
+            for f in findings
+            if f.get("category") == "constant_columns"
+            for col in f.get("columns", [])
+        ],
+    )
 
     if not columns_dropped:
         return None
@@ -691,11 +1037,43 @@ def _clean_constant_columns(
     }
 
 
+def _drop_columns(session, table_name: str, columns: list[str]) -> list[str]:
+    """Drop columns with one table rewrite instead of one ALTER per column.
+
+    Protected columns and columns no longer in the table (e.g. already
+    dropped by an earlier step) are skipped.
+
+    Returns:
+        The columns actually dropped, or [] if the rewrite failed.
+    """
+    existing = set(session.get_column_names(table_name))
+    to_drop = [
+        c
+        for c in dict.fromkeys(columns)
+        if c in existing and c not in _PROTECTED_COLUMNS
+    ]
+    if not to_drop:
+        return []
+
+    sql = load_sql(
+        "cleaning",
+        "drop_columns",
+        table_name=table_name,
+        column_list=", ".join(f'"{c}"' for c in to_drop),
+    )
+    try:
+        session.execute(sql)
+    except Exception:
+        return []
+    return to_drop
+
+
 def _detect_pii(session, table_name: str) -> list[dict]:
     """Detect PII in columns using LLM-assisted analysis.
 
     Samples first 5 non-null distinct values per column + column name,
-    sends a single Gemini call for all columns.
+    sends a single Gemini call for all columns. The response is cached by
+    prompt content, so re-cleaning identical data skips the model call.
 
     Returns list of per-column PII flags.
     """
@@ -705,19 +1083,7 @@ def _detect_pii(session, table_name: str) -> list[dict]:
     if not check_columns:
         return []
 
-    # Gather samples
-    column_samples = {}
-    for col in check_columns:
-        sample_sql = (
-            f'SELECT DISTINCT "{col}" FROM {table_name} '
-            f'WHERE "{col}" IS NOT NULL LIMIT 5'
-        )
-        try:
-            rows = session.execute(sample_sql).fetchall()
-            values = [str(r[0]) for r in rows if r[0] is not None]
-            column_samples[col] = values
-        except Exception:
-            column_samples[col] = []
+    column_samples = _sample_distinct_values(session, table_name, check_columns)
 
     # Build prompt for LLM
     sample_text = ""
@@ -744,81 +1110,133 @@ def _detect_pii(session, table_name: str) -> list[dict]:
 
     try:
         import importlib
+
         genai = importlib.import_module("google.genai")
         types = importlib.import_module("google.genai.types")
 
-        client = genai.Client(vertexai=True)
-        response = client.models.generate_content(
-            model=os.getenv("PII_DETECTION_MODEL", "gemini-2.5-flash"),
-            contents=prompt,
-            config=types.GenerateContentConfig(temperature=0.0),
-        )
+        model = os.getenv("PII_DETECTION_MODEL", "gemini-2.5-flash")
+
+        def generate() -> str:
+            client = genai.Client(vertexai=True)
+            response = client.models.generate_content(
+                model=model,
+                contents=prompt,
+                config=types.GenerateContentConfig(temperature=0.0),
+            )
+            return response.text
+
+        def parse(text: str) -> list[dict[str, Any]]:
+            text = text.strip()
+            # Strip markdown code fences if present
+            if text.startswith("```"):
+                text = text.split("\n", 1)[-1]
+                if text.endswith("```"):
+                    text = text[:-3].strip()
+
+            return [
+                {
+                    "column": item["column"],
+                    "pii_type": item.get("pii_type", "unknown"),
+                    "confidence": item.get("confidence", 0.5),
+                }
+                for item in json.loads(text)
+                if item.get("is_pii")
+            ]
+
+        return cached_generate("pii_detection", model, prompt, generate, parse)
+    except Exception:
+        return []
 
-        text = response.text.strip()
-        # Strip markdown code fences if present
-        if text.startswith("```"):
-            text = text.split("\n", 1)[-1]
-            if text.endswith("```"):
-                text = text[:-3].strip()
 
-        pii_results = json.loads(text)
+def _sample_distinct_values(
+    session,
+    table_name: str,
+    columns: list[str],
+    limit: int = 5,
+) -> dict[str, list[str]]:
+    """Return up to `limit` distinct non-null values per column, as text.
 
-        return [
-            {
-                "column": item["column"],
-                "pii_type": item.get("pii_type", "unknown"),
-                "confidence": item.get("confidence", 0.5),
-            }
-            for item in pii_results
-            if item.get("is_pii")
-        ]
+    All columns are sampled by one UNION ALL query instead of one query per
+    column. Values are cast to VARCHAR so the branches share a type.
+    """
+    branches = [
+        f"(SELECT {i} AS k, CAST(v AS VARCHAR) AS v FROM "
+        f'(SELECT DISTINCT "{col}" AS v FROM {table_name} '
+        f'WHERE "{col}" IS NOT NULL LIMIT {limit}))'
+        for i, col in enumerate(columns)
+    ]
+    samples: dict[str, list[str]] = {col: [] for col in columns}
+    try:
+        rows = session.execute(" UNION ALL ".join(branches)).fetchall()
     except Exception:
-        return []
+        return samples
+    for k, value in rows:
+        samples[columns[k]].append(value)
+    return samples
 
 
 def _validate_numeric_precision(session, table_name: str) -> list[dict]:
     """Flag numeric columns with inconsistent decimal precision.
 
-    Informational only — does not modify data.
+    Informational only — does not modify data. Decimal places are found
+    arithmetically (the fewest places the value rounds to unchanged) for
+    all floating-point columns in one scan, instead of casting every value
+    to VARCHAR. DECIMAL columns have a fixed scale, so they are not probed.
     """
     column_types = session.get_column_types(table_name)
     numeric_cols = [
-        c for c in column_types
-        if column_types[c] in ("DOUBLE", "FLOAT", "DECIMAL")
-        and c not in _PROTECTED_COLUMNS
+        c
+        for c in column_types
+        if column_types[c] in ("DOUBLE", "FLOAT") and c not in _PROTECTED_COLUMNS
     ]
 
     if not numeric_cols:
         return []
 
-    flags = []
-
+    aggregates = []
     for col in numeric_cols:
-        # Count distinct decimal places
-        precision_sql = (
-            f'SELECT '
-            f'MIN(LENGTH(SPLIT_PART(CAST("{col}" AS VARCHAR), \'.\', 2))) AS min_dec, '
-            f'MAX(LENGTH(SPLIT_PART(CAST("{col}" AS VARCHAR), \'.\', 2))) AS max_dec '
-            f'FROM {table_name} '
-            f'WHERE "{col}" IS NOT NULL '
-            f"AND CAST(\"{col}\" AS VARCHAR) LIKE '%.%'"
-        )
-        try:
-            row = session.execute(precision_sql).fetchone()
-            if row and row[0] is not None and row[1] is not None:
-                min_dec = row[0]
-                max_dec = row[1]
-                if min_dec != max_dec:
-                    flags.append({
-                        "column": col,
-                        "min_decimals": min_dec,
-                        "max_decimals": max_dec,
-                        "recommendation": (
-                            f"Inconsistent decimal precision ({min_dec}-{max_dec} places). "
-                            "Consider standardizing for currency or measurement data."
-                        ),
-                    })
-        except Exception:
-            pass
+        q = f'"{col}"'
+        places = _decimal_places_expr(q, column_types[col])
+        finite = f"WHERE isfinite({q})"
+        aggregates.append(f"MIN({places}) FILTER ({finite})")
+        aggregates.append(f"MAX({places}) FILTER ({finite})")
+    try:
+        row = session.aggregate(table_name, aggregates)
+    except Exception:
+        return []
+
+    flags = []
+    for i, col in enumerate(numeric_cols):
+        min_dec, max_dec = row[2 * i], row[2 * i + 1]
+        if min_dec is not None and max_dec is not None and min_dec != max_dec:
+            flags.append(
+                {
+                    "column": col,
+                    "min_decimals": min_dec,
+                    "max_decimals": max_dec,
+                    "recommendation": (
+                        f"Inconsistent decimal precision ({min_dec}-{max_dec} places). "
+                        "Consider standardizing for currency or measurement data."
+                    ),
+                }
+            )
 
     return flags
+
+
+# Most decimal places a DOUBLE can carry (its shortest round-trip repr)
+_MAX_DECIMAL_PLACES = 17
+
+
+def _decimal_places_expr(q: str, column_type: str) -> str:
+    """SQL for the decimal places of a FLOAT/DOUBLE value, without strings.
+
+    Whole numbers count as one place, matching how they print ("95.0").
+    FLOAT values are compared after rounding back to FLOAT so 92.3 is not
+    read as its widened DOUBLE expansion.
+    """
+    branches = " ".join(
+        f"WHEN CAST(ROUND({q}::DOUBLE, {d}) AS {column_type}) = {q} THEN {d}"
+        for d in range(1, _MAX_DECIMAL_PLACES)
+    )
+    return f"CASE {branches} ELSE {_MAX_DECIMAL_PLACES} END"
@@ -6,24 +6,40 @@ before/after metrics, per-operation details, PII flags, identifier
 columns, and numeric precision observations.
 """
 
-import json
 import os
+import shutil
 import uuid
-from datetime import datetime, timezone
-from pathlib import Path
+from datetime import UTC, datetime
 from typing import Any
 
 from google.adk.tools import ToolContext
 
+from datagrunt_agent.core.json_io import write_json
 from datagrunt_agent.tools.ingestion import _get_session
 
 REPORT_SCHEMA_VERSION = "1.0.0"
 
+# Output directories already created by this process
+_ENSURED_DIRS: set[str] = set()
+
 
 def _generate_report_id() -> str:
     return f"dcr_{uuid.uuid4().hex[:12]}"
 
 
+def _pii_entry(item: dict) -> dict[str, Any]:
+    pii_type = item.get("pii_type")
+    return {
+        "column": item.get("column", ""),
+        "pii_type": "unknown" if pii_type is None else pii_type,
+        "confidence": item.get("confidence", 0.0),
+        "recommendation": (
+            f"Review column for {'PII' if pii_type is None else pii_type} "
+            "data before sharing."
+        ),
+    }
+
+
 def build_cleaning_report(
     cleaning_result: dict,
     quality_findings: list[dict],
@@ -41,76 +57,64 @@ def build_cleaning_report(
     Returns:
         The full report dict. Includes internal '_persisted_path' key.
     """
+    # operations is stored in the report, so keep it a list; pii and
+    # identifiers are only iterated.
+    operations = cleaning_result.get("operations") or []
+    pii = cleaning_result.get("pii_detection") or ()
+    identifiers = cleaning_result.get("identifier_columns") or ()
+    file_name = os.path.basename(source_file_path) if source_file_path else ""
+
     report: dict[str, Any] = {
         "report_id": _generate_report_id(),
         "schema_version": REPORT_SCHEMA_VERSION,
-        "generated_at": datetime.now(timezone.utc).isoformat(),
-    }
-
-    # Source metadata
-    report["source"] = {
-        "file_path": source_file_path,
-        "file_name": Path(source_file_path).name if source_file_path else "",
-        "table_name": cleaning_result.get("table_name", ""),
-    }
-
-    # Summary
-    report["summary"] = {
-        "before_rows": cleaning_result.get("before_rows", 0),
-        "after_rows": cleaning_result.get("after_rows", 0),
-        "before_columns": cleaning_result.get("before_columns", 0),
-        "after_columns": cleaning_result.get("after_columns", 0),
-        "columns_added": cleaning_result.get("columns_added", 0),
-        "columns_removed": cleaning_result.get("columns_removed", 0),
-        "operations_applied": len(cleaning_result.get("operations", [])),
+        "generated_at": datetime.now(UTC).isoformat(timespec="milliseconds"),
+        # Source metadata
+        "source": {
+            "file_path": source_file_path,
+            "file_name": file_name,
+            "table_name": cleaning_result.get("table_name", ""),
+        },
+        "summary": {
+            "before_rows": cleaning_result.get("before_rows", 0),
+            "after_rows": cleaning_result.get("after_rows", 0),
+            "before_columns": cleaning_result.get("before_columns", 0),
+            "after_columns": cleaning_result.get("after_columns", 0),
+            "columns_added": cleaning_result.get("columns_added", 0),
+            "columns_removed": cleaning_result.get("columns_removed", 0),
+            "operations_applied": len(operations),
+        },
+        # Per-operation results
+        "operations": operations,
+        "pii_detection": [_pii_entry(item) for item in pii],
+        # Identifier columns preserved
+        "identifier_columns": [
+            {
+                "column": item.get("column", ""),
+                "pattern": item.get("pattern", "unknown"),
+                "preserved_as": item.get("preserved_as", "VARCHAR"),
+            }
+            for item in identifiers
+        ],
+        "numeric_precision_flags": (
+            cleaning_result.get("numeric_precision_flags") or []
+        ),
+        # Quality findings input count
+        "quality_findings_input": len(quality_findings),
+        "overall_status": "cleaned" if operations else "no_action_needed",
     }
 
-    # Per-operation results
-    report["operations"] = cleaning_result.get("operations", [])
-
-    # PII detection
-    pii = cleaning_result.get("pii_detection", [])
-    report["pii_detection"] = [
-        {
-            "column": item.get("column", ""),
-            "pii_type": item.get("pii_type", "unknown"),
-            "confidence": item.get("confidence", 0.0),
-            "recommendation": f"Review column for {item.get('pii_type', 'PII')} data before sharing.",
-        }
-        for item in pii
-    ]
-
-    # Identifier columns preserved
-    report["identifier_columns"] = [
-        {
-            "column": item.get("column", ""),
-            "pattern": item.get("pattern", "unknown"),
-            "preserved_as": item.get("preserved_as", "VARCHAR"),
-        }
-        for item in cleaning_result.get("identifier_columns", [])
-    ]
-
-    # Numeric precision flags
-    report["numeric_precision_flags"] = cleaning_result.get(
-        "numeric_precision_flags", [],
-    )
-
-    # Quality findings input count
-    report["quality_findings_input"] = len(quality_findings)
-
-    # Overall status
-    operations = cleaning_result.get("operations", [])
-    if operations:
-        report["overall_status"] = "cleaned"
-    else:
-        report["overall_status"] = "no_action_needed"
-
     # Persist to disk
-    os.makedirs(output_dir, exist_ok=True)
-    stem = Path(source_file_path).stem if source_file_path else "unknown"
+    stem = os.path.splitext(file_name)[0] or "unknown"
     report_path = os.path.join(output_dir, f"{stem}_cleaning_report.json")
-    with open(report_path, "w", encoding="utf-8") as fh:
-        json.dump(report, fh, indent=2, default=str)
+    if output_dir not in _ENSURED_DIRS:
+        os.makedirs(output_dir, exist_ok=True)
+        _ENSURED_DIRS.add(output_dir)
+    try:
+        write_json(report_path, report)
+    except FileNotFoundError:
+        # The directory was removed after it was first created
+        os.makedirs(output_dir, exist_ok=True)
+        write_json(report_path, report)
 
     report["_persisted_path"] = report_path
     return report
@@ -151,13 +155,21 @@ def export_cleaning_report(
 
     if not output_path:
         from datagrunt_agent.tools.ingestion import _get_output_dir
+
         output_dir = _get_output_dir()
         output_path = os.path.join(output_dir, f"{table_name}_cleaning_report.json")
 
-    # Re-persist existing report to requested path
-    report = {k: v for k, v in existing_report.items() if not k.startswith("_")}
-    with open(output_path, "w", encoding="utf-8") as fh:
-        json.dump(report, fh, indent=2, default=str)
+    # build_cleaning_report already serialized this report; copy its file
+    # (shutil uses sendfile on Linux) instead of encoding it again.
+    persisted = existing_report.get("_persisted_path")
+    if persisted and os.path.exists(persisted):
+        if os.path.abspath(persisted) != os.path.abspath(output_path):
+            shutil.copyfile(persisted, output_path)
+    else:
+        # _persisted_path is the only internal key build_cleaning_report adds
+        report = existing_report.copy()
+        report.pop("_persisted_path", None)
+        write_json(output_path, report)
 
     return {
         "status": "success",
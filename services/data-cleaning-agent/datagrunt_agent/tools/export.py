@@ -1,13 +1,51 @@
 """Export tools for saving DuckDB tables to various file formats."""
 
+import glob
 import os
+from collections.abc import Callable
 from typing import Any
 
+import duckdb
 from google.adk.tools import ToolContext
 
-from datagrunt_agent.core.sql_loader import load_sql
+from datagrunt_agent.core.duckdb_session import quote_identifier
+from datagrunt_agent.core.sql_loader import compile_sql
 from datagrunt_agent.tools.ingestion import _get_session
 
+_TO_CSV = compile_sql("export", "to_csv")
+_TO_PARQUET = compile_sql("export", "to_parquet")
+_TO_PARQUET_PARALLEL = compile_sql("export", "to_parquet_parallel")
+_TO_JSON = compile_sql("export", "to_json")
+_TO_JSONL = compile_sql("export", "to_jsonl")
+_TO_EXCEL = compile_sql("export", "to_excel")
+
+# From this many rows Excel output is streamed with openpyxl (when
+# installed) rather than written through the spatial extension's GDAL
+# driver, which serializes row by row.
+_OPENPYXL_EXCEL_MIN_ROWS = 100_000
+_EXCEL_MAX_ROWS = 1_048_575  # sheet row limit, less the header row
+_EXCEL_FETCH_ROWS = 8192
+# Column types openpyxl writes natively; everything else goes as text
+_EXCEL_NATIVE_TYPES = (
+    "BOOLEAN",
+    "TINYINT",
+    "SMALLINT",
+    "INTEGER",
+    "BIGINT",
+    "HUGEINT",
+    "UTINYINT",
+    "USMALLINT",
+    "UINTEGER",
+    "UBIGINT",
+    "FLOAT",
+    "DOUBLE",
+    "DECIMAL",
+    "VARCHAR",
+    "DATE",
+    "TIME",
+    "TIMESTAMP",
+)
+
 
 def _resolve_output_path(table_name: str, output_path: str, extension: str) -> str:
     """Resolve the output file path, generating a default if not provided."""
@@ -16,6 +54,88 @@ def _resolve_output_path(table_name: str, output_path: str, extension: str) -> s
     return os.path.abspath(f"{table_name}_export{extension}")
 
 
+def _copy(session, table_name: str, sql: str) -> int | None:
+    """Run an export COPY and return the rows written, or None if no table.
+
+    Existence is only checked after a catalog error, so a successful
+    export is a single statement.
+    """
+    try:
+        return session.scalar(sql)
+    except duckdb.CatalogException:
+        if session.table_exists(table_name):
+            raise
+        return None
+
+
+def _export(
+    table_name: str,
+    output_path: str,
+    extension: str,
+    render: Callable[..., str],
+    fmt: str,
+) -> dict[str, Any]:
+    """Resolve the path, run the export COPY and build the tool result."""
+    session = _get_session()
+    output_path = _resolve_output_path(table_name, output_path, extension)
+    table = quote_identifier(table_name)
+    sql = render(table_name=table, output_path=output_path.replace("'", "''"))
+    row_count = _copy(session, table, sql)
+    if row_count is None:
+        return {"error": f"Table '{table_name}' not found."}
+    return {
+        "status": "success",
+        "output_path": output_path,
+        "format": fmt,
+        "rows_exported": row_count,
+    }
+
+
+def _has_openpyxl() -> bool:
+    try:
+        import openpyxl  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _excel_cell_expr(column: str, column_type: str) -> str:
+    """Project a column into a type openpyxl can write."""
+    quoted = quote_identifier(column)
+    if column_type == "TIMESTAMP WITH TIME ZONE":
+        # Excel has no time zones; write UTC wall-clock time
+        return f"timezone('UTC', {quoted})"
+    if column_type.split("(")[0] in _EXCEL_NATIVE_TYPES:
+        return quoted
+    return f"CAST({quoted} AS VARCHAR)"
+
+
+def _write_excel_openpyxl(session, table: str, output_path: str) -> int:
+    """Stream a table into a write-only openpyxl workbook.
+
+    Returns the number of rows written.
+    """
+    from openpyxl import Workbook
+
+    relation = session.execute(f"FROM {table}")
+    projection = ", ".join(
+        _excel_cell_expr(column, str(column_type))
+        for column, column_type in zip(relation.columns, relation.types)
+    )
+    rows = session.connection.execute(f"SELECT {projection} FROM {table}")
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    sheet.append(relation.columns)
+    row_count = 0
+    while batch := rows.fetchmany(_EXCEL_FETCH_ROWS):
+        for row in batch:
+            sheet.append(row)
+        row_count += len(batch)
+    workbook.save(output_path)
+    return row_count
+
+
 def export_csv(
     table_name: str,
     output_path: str = "",
@@ -27,26 +147,13 @@ def export_csv(
         table_name: The DuckDB table to export.
         output_path: Destination file path. If empty, uses table_name_export.csv.
     """
-    session = _get_session()
-    if not session.table_exists(table_name):
-        return {"error": f"Table '{table_name}' not found."}
-
-    output_path = _resolve_output_path(table_name, output_path, ".csv")
-    sql = load_sql("export", "to_csv", table_name=table_name, output_path=output_path)
-    session.execute(sql)
-
-    row_count = session.get_row_count(table_name)
-    return {
-        "status": "success",
-        "output_path": output_path,
-        "format": "csv",
-        "rows_exported": row_count,
-    }
+    return _export(table_name, output_path, ".csv", _TO_CSV, "csv")
 
 
 def export_parquet(
     table_name: str,
     output_path: str = "",
+    parallel: bool = False,
     tool_context: ToolContext = None,
 ) -> dict[str, Any]:
     """Export a DuckDB table to a Parquet file.
@@ -54,22 +161,18 @@ def export_parquet(
     Args:
         table_name: The DuckDB table to export.
         output_path: Destination file path. If empty, uses table_name_export.parquet.
+        parallel: Write one file per DuckDB thread into output_path as a
+            directory (default table_name_export/) instead of one file.
+            Faster for large tables; the directory must be new or empty.
     """
-    session = _get_session()
-    if not session.table_exists(table_name):
-        return {"error": f"Table '{table_name}' not found."}
-
-    output_path = _resolve_output_path(table_name, output_path, ".parquet")
-    sql = load_sql("export", "to_parquet", table_name=table_name, output_path=output_path)
-    session.execute(sql)
-
-    row_count = session.get_row_count(table_name)
-    return {
-        "status": "success",
-        "output_path": output_path,
-        "format": "parquet",
-        "rows_exported": row_count,
-    }
+    if not parallel:
+        return _export(table_name, output_path, ".parquet", _TO_PARQUET, "parquet")
+    result = _export(table_name, output_path, "", _TO_PARQUET_PARALLEL, "parquet")
+    if "error" not in result:
+        result["files_written"] = len(
+            glob.glob(os.path.join(result["output_path"], "*.parquet"))
+        )
+    return result
 
 
 def export_json(
@@ -83,21 +186,7 @@ def export_json(
         table_name: The DuckDB table to export.
         output_path: Destination file path. If empty, uses table_name_export.json.
     """
-    session = _get_session()
-    if not session.table_exists(table_name):
-        return {"error": f"Table '{table_name}' not found."}
-
-    output_path = _resolve_output_path(table_name, output_path, ".json")
-    sql = load_sql("export", "to_json", table_name=table_name, output_path=output_path)
-    session.execute(sql)
-
-    row_count = session.get_row_count(table_name)
-    return {
-        "status": "success",
-        "output_path": output_path,
-        "format": "json",
-        "rows_exported": row_count,
-    }
+    return _export(table_name, output_path, ".json", _TO_JSON, "json")
 
 
 def export_jsonl(
@@ -111,55 +200,119 @@ def export_jsonl(
         table_name: The DuckDB table to export.
         output_path: Destination file path. If empty, uses table_name_export.jsonl.
     """
+    return _export(table_name, output_path, ".jsonl", _TO_JSONL, "jsonl")
+
+
+def export_excel(
+    table_name: str,
+    output_path: str = "",
+    tool_context: ToolContext = None,
+) -> dict[str, Any]:
+    """Export a DuckDB table to an Excel (.xlsx) file.
+
+    Uses the DuckDB spatial extension. Tables of 100k rows or more, or any
+    table when spatial is unavailable, are streamed with openpyxl instead
+    if it is installed. The result's "backend" says which was used.
+
+    Args:
+        table_name: The DuckDB table to export.
+        output_path: Destination file path. If empty, uses table_name_export.xlsx.
+    """
     session = _get_session()
-    if not session.table_exists(table_name):
+    table = quote_identifier(table_name)
+    try:
+        row_count = session.get_row_count(table)
+    except duckdb.CatalogException:
         return {"error": f"Table '{table_name}' not found."}
+    if row_count > _EXCEL_MAX_ROWS:
+        return {
+            "error": (
+                f"Table '{table_name}' has {row_count:,} rows; an Excel sheet "
+                f"holds at most {_EXCEL_MAX_ROWS:,}."
+            ),
+            "suggestion": "Export to Parquet or CSV instead.",
+        }
 
-    output_path = _resolve_output_path(table_name, output_path, ".jsonl")
-    sql = load_sql("export", "to_jsonl", table_name=table_name, output_path=output_path)
-    session.execute(sql)
+    has_openpyxl = _has_openpyxl()
+    if not (has_openpyxl and row_count >= _OPENPYXL_EXCEL_MIN_ROWS):
+        try:
+            result = _export(table_name, output_path, ".xlsx", _TO_EXCEL, "xlsx")
+            result["backend"] = "duckdb-spatial"
+            return result
+        except duckdb.Error as exc:
+            if not has_openpyxl:
+                return {
+                    "error": f"Excel export failed: {exc}",
+                    "suggestion": (
+                        "Ensure the DuckDB spatial extension is available, "
+                        "or install openpyxl."
+                    ),
+                }
+
+    from openpyxl.utils.exceptions import IllegalCharacterError
 
-    row_count = session.get_row_count(table_name)
+    output_path = _resolve_output_path(table_name, output_path, ".xlsx")
+    try:
+        row_count = _write_excel_openpyxl(session, table, output_path)
+    except (duckdb.Error, OSError, IllegalCharacterError) as exc:
+        return {"error": f"Excel export failed: {exc}"}
     return {
         "status": "success",
         "output_path": output_path,
-        "format": "jsonl",
+        "format": "xlsx",
         "rows_exported": row_count,
+        "backend": "openpyxl-stream",
     }
 
 
-def export_excel(
+def export_arrow(
     table_name: str,
     output_path: str = "",
     tool_context: ToolContext = None,
 ) -> dict[str, Any]:
-    """Export a DuckDB table to an Excel (.xlsx) file.
+    """Export a DuckDB table to an Arrow IPC (Feather v2) file.
 
-    Requires the DuckDB spatial extension.
+    The table leaves DuckDB as Arrow record batches without a copy and is
+    written as-is, skipping Parquet's encoding and compression. Prefer it
+    when the output is read straight back by an in-process Arrow consumer
+    (pyarrow, polars, pandas).
 
     Args:
         table_name: The DuckDB table to export.
-        output_path: Destination file path. If empty, uses table_name_export.xlsx.
+        output_path: Destination file path. If empty, uses table_name_export.arrow.
     """
-    session = _get_session()
-    if not session.table_exists(table_name):
-        return {"error": f"Table '{table_name}' not found."}
-
-    output_path = _resolve_output_path(table_name, output_path, ".xlsx")
-    sql = load_sql("export", "to_excel", table_name=table_name, output_path=output_path)
-
     try:
-        session.execute(sql)
-    except Exception as exc:
+        import pyarrow as pa
+    except ImportError:
         return {
-            "error": f"Excel export failed: {exc}",
-            "suggestion": "Ensure the DuckDB spatial extension is available.",
+            "error": "Arrow export requires pyarrow, which is not installed.",
+            "suggestion": "Install pyarrow, or export to Parquet instead.",
         }
 
-    row_count = session.get_row_count(table_name)
+    session = _get_session()
+    output_path = _resolve_output_path(table_name, output_path, ".arrow")
+    table = quote_identifier(table_name)
+    try:
+        data = session.execute(f"FROM {table}").arrow()
+    except duckdb.CatalogException:
+        if session.table_exists(table):
+            raise
+        return {"error": f"Table '{table_name}' not found."}
+
+    # Depending on the DuckDB version this is a Table or a batch reader
+    batches = data.to_batches() if isinstance(data, pa.Table) else data
+    row_count = 0
+    with (
+        pa.OSFile(output_path, "wb") as sink,
+        pa.ipc.new_file(sink, data.schema) as writer,
+    ):
+        for batch in batches:
+            writer.write_batch(batch)
+            row_count += batch.num_rows
+
     return {
         "status": "success",
         "output_path": output_path,
-        "format": "xlsx",
+        "format": "arrow",
         "rows_exported": row_count,
     }
@@ -16,13 +16,15 @@ import json
 import os
 import re
 import tempfile
-from datetime import datetime, timezone
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
 from google.adk.tools import ToolContext
 
-from datagrunt_agent.core.column_normalizer import normalize_column_name
+from datagrunt_agent.core.column_normalizer import build_rename_mapping
 from datagrunt_agent.core.delimiter_detector import (
     count_source_lines,
     detect_delimiter,
@@ -35,14 +37,18 @@ from datagrunt_agent.core.duckdb_session import (
 )
 from datagrunt_agent.core.file_detector import (
     FileFormat,
-    detect_format as detect_file_format,
+    duckdb_csv_encoding,
     ensure_utf8,
     is_blank_file,
     is_empty_file,
 )
+from datagrunt_agent.core.file_detector import (
+    detect_format as detect_file_format,
+)
+from datagrunt_agent.core.json_io import loads as json_loads
+from datagrunt_agent.core.llm_cache import cached_generate
 from datagrunt_agent.core.sql_loader import load_sql
 
-
 # ---------------------------------------------------------------------------
 # Output directory for Parquet files
 # ---------------------------------------------------------------------------
@@ -64,21 +70,58 @@ def _get_output_dir(output_dir: str = "") -> str:
 # Header Detection
 # ---------------------------------------------------------------------------
 
-def _detect_header(file_path: str, delimiter: str) -> bool:
-    """Detect whether a CSV file has column headers using an LLM.
+_HEADER_SAMPLE_ROWS = 20
+_LLM_SAMPLE_ROWS = 3
+# Fixed instructions first and file rows last, so every request shares
+# the same prefix (what Gemini's implicit context caching keys on).
+_HEADER_PROMPT_PREFIX = (
+    "Does the FIRST of the CSV rows below contain column headers "
+    "(field names), or is it data like the other rows?\n\n"
+    "Reply with exactly one word: HEADERS or DATA\n\n"
+    "CSV rows:\n\n"
+)
+_NUMERIC_TOKEN = re.compile(r"\s*[-+]?(\d+(\.\d*)?|\.\d+)([eE][-+]?\d+)?\s*")
 
-    Sends only the first 3 rows (sample data) to Gemini for classification.
-    The LLM never sees bulk data — just enough rows to determine whether
-    the first row contains field names or data values.
 
-    Falls back to True (assume headers) on any error.
+def _header_from_types(rows: list[list[str]]) -> bool | None:
+    """Decide header presence from token types, or None if unclear.
+
+    A first row of numbers is data. A first row of text over rows that are
+    mostly numbers is a header. Anything else (e.g. all-text files) is left
+    to the model.
+    """
+    first, rest = rows[0], rows[1:]
+    first_tokens = [t for t in first if t.strip()]
+    if not first_tokens or not rest:
+        return None
+    first_numeric = [bool(_NUMERIC_TOKEN.fullmatch(t)) for t in first_tokens]
+    if all(first_numeric):
+        return False
+    if any(first_numeric):
+        return None
+    rest_tokens = [t for row in rest for t in row if t.strip()]
+    numeric = sum(1 for t in rest_tokens if _NUMERIC_TOKEN.fullmatch(t))
+    if rest_tokens and numeric * 2 >= len(rest_tokens):
+        return True
+    return None
+
+
+def _detect_header(file_path: str, delimiter: str) -> bool:
+    """Detect whether a CSV file has column headers.
+
+    Reads the first 20 rows and decides locally when token types make it
+    obvious (text over numbers, or numbers in the first row). Only
+    ambiguous files, typically all text, go to Gemini, which sees just the
+    first 3 rows. Model answers are cached by prompt content, so reloading
+    an identical file skips the call. If the file is unreadable or empty,
+    or the model is unavailable, headers are assumed.
     """
     try:
         with open(file_path, "r", encoding="utf-8", errors="replace") as fh:
             reader = csv.reader(fh, delimiter=delimiter)
             rows = []
             for i, row in enumerate(reader):
-                if i >= 3:
+                if i >= _HEADER_SAMPLE_ROWS:
                     break
                 rows.append(row)
     except Exception:
@@ -87,28 +130,36 @@ def _detect_header(file_path: str, delimiter: str) -> bool:
     if not rows:
         return True
 
-    sample = "\n".join(delimiter.join(values) for values in rows)
+    decided = _header_from_types(rows)
+    if decided is not None:
+        return decided
 
-    prompt = (
-        "Look at the following CSV rows:\n\n"
-        f"{sample}\n\n"
-        "Does the FIRST row contain column headers (field names), "
-        "or is it data like the other rows?\n\n"
-        "Reply with exactly one word: HEADERS or DATA"
-    )
+    sample = "\n".join(delimiter.join(values) for values in rows[:_LLM_SAMPLE_ROWS])
+
+    prompt = _HEADER_PROMPT_PREFIX + sample
 
     try:
         from google import genai
         from google.genai import types
 
-        client = genai.Client(vertexai=True)
-        response = client.models.generate_content(
-            model=os.getenv("HEADER_DETECTION_MODEL", "gemini-2.5-flash"),
-            contents=prompt,
-            config=types.GenerateContentConfig(temperature=0.0),
+        model = os.getenv("HEADER_DETECTION_MODEL", "gemini-2.5-flash")
+
+        def generate() -> str:
+            client = genai.Client(vertexai=True)
+            response = client.models.generate_content(
+                model=model,
+                contents=prompt,
+                config=types.GenerateContentConfig(temperature=0.0),
+            )
+            return response.text
+
+        return cached_generate(
+            "header_detection",
+            model,
+            prompt,
+            generate,
+            lambda answer: "HEADER" in answer.strip().upper(),
         )
-        answer = response.text.strip().upper()
-        return "HEADER" in answer
     except Exception:
         return True
 
@@ -117,6 +168,7 @@ def _detect_header(file_path: str, delimiter: str) -> bool:
 # Post-Load Helpers (processed_at, Parquet export)
 # ---------------------------------------------------------------------------
 
+
 def _stamp_processed_at(session: DuckDBSession, table_name: str) -> str:
     """Add processed_at timestamp to all rows in the table.
 
@@ -133,9 +185,9 @@ def _stamp_processed_at(session: DuckDBSession, table_name: str) -> str:
     sql = load_sql("ingestion", "get_processed_at", table_name=table_name)
     row = session.execute(sql).fetchone()
     if row and row[0]:
-        ts = row[0].replace(tzinfo=timezone.utc)
+        ts = row[0].replace(tzinfo=UTC)
         return ts.isoformat()
-    return datetime.now(timezone.utc).isoformat()
+    return datetime.now(UTC).isoformat()
 
 
 def _export_parquet(
@@ -146,14 +198,23 @@ def _export_parquet(
 ) -> dict[str, Any]:
     """Export table to Parquet and return output metadata.
 
+    A Parquet source is still re-exported: the canonical output carries the
+    processed_at column (and any normalized column names), so the source
+    file cannot stand in for it. When the source already sits at the
+    canonical path, the output is written alongside it instead of
+    overwriting the caller's original file.
+
     Returns dict with parquet_path and size_bytes.
     """
     resolved_dir = _get_output_dir(output_dir)
     stem = Path(source_path).stem
     parquet_path = os.path.join(resolved_dir, f"{stem}.parquet")
+    if os.path.exists(parquet_path) and os.path.samefile(parquet_path, source_path):
+        parquet_path = os.path.join(resolved_dir, f"{stem}_processed.parquet")
 
     sql = load_sql(
-        "export", "to_parquet",
+        "export",
+        "to_parquet",
         table_name=table_name,
         output_path=parquet_path,
     )
@@ -163,20 +224,26 @@ def _export_parquet(
     return {"parquet_path": parquet_path, "size_bytes": size_bytes}
 
 
-
-
 # ---------------------------------------------------------------------------
 # Module-level session (shared across tool calls within an agent session)
 # ---------------------------------------------------------------------------
 
 _session: DuckDBSession | None = None
+_session_lock = threading.Lock()
 
 
 def _get_session() -> DuckDBSession:
-    """Get or create the module-level DuckDB session."""
+    """Get or create the module-level DuckDB session.
+
+    Tools run concurrently on worker threads, so creation is guarded by a
+    lock (checked again inside it) to keep two first calls from each
+    opening their own database.
+    """
     global _session
     if _session is None:
-        _session = DuckDBSession()
+        with _session_lock:
+            if _session is None:
+                _session = DuckDBSession()
     return _session
 
 
@@ -184,6 +251,7 @@ def _get_session() -> DuckDBSession:
 # CSV Helpers — Multi-Strategy Parsing (from datagrunt-ai)
 # ---------------------------------------------------------------------------
 
+
 def _try_load_csv(
     session: DuckDBSession,
     file_path: str,
@@ -192,26 +260,33 @@ def _try_load_csv(
     quote_char: str = '"',
     escape_char: str = '"',
     has_header: bool = True,
+    encoding: str = "utf-8",
 ) -> bool:
     """Try loading a CSV with specific quote/escape params. Returns True on success."""
     try:
         if quote_char:
             template = "load_csv" if has_header else "load_csv_no_header"
             sql = load_sql(
-                "ingestion", template,
+                "ingestion",
+                template,
                 table_name=table_name,
                 file_path=file_path,
                 delimiter=delimiter,
+                encoding=encoding,
                 quote_char=quote_char,
                 escape_char=escape_char,
             )
         else:
-            template = "load_csv_lenient" if has_header else "load_csv_lenient_no_header"
+            template = (
+                "load_csv_lenient" if has_header else "load_csv_lenient_no_header"
+            )
             sql = load_sql(
-                "ingestion", template,
+                "ingestion",
+                template,
                 table_name=table_name,
                 file_path=file_path,
                 delimiter=delimiter,
+                encoding=encoding,
             )
         session.execute(sql)
         return True
@@ -232,17 +307,33 @@ def _check_overflow_columns(session: DuckDBSession, table_name: str) -> list[str
         return []
 
     sparse_threshold = total_rows * 0.8
-    overflow_cols = []
 
-    for col in reversed(columns):
-        sql = load_sql("common", "null_count", table_name=table_name, column_name=col)
-        null_count = session.execute(sql).fetchone()[0]
-        if null_count >= sparse_threshold:
-            overflow_cols.insert(0, col)
-        else:
-            break
+    # The last column alone settles the usual no-overflow case with a
+    # single-column read; only when it is sparse are the others counted,
+    # all in one scan rather than one query per column.
+    sql = load_sql(
+        "common",
+        "null_count",
+        table_name=table_name,
+        column_name=columns[-1],
+    )
+    if session.scalar(sql) < sparse_threshold:
+        return []
+    leading = columns[:-1]
+    if not leading:
+        return columns
+    null_counts = session.aggregate(
+        table_name,
+        [f'COUNT(*) - COUNT("{col}")' for col in leading],
+    )
 
-    return overflow_cols
+    first_overflow_idx = len(leading)
+    while (
+        first_overflow_idx > 0
+        and null_counts[first_overflow_idx - 1] >= sparse_threshold
+    ):
+        first_overflow_idx -= 1
+    return columns[first_overflow_idx:]
 
 
 def _repair_overflow_columns(
@@ -270,14 +361,13 @@ def _repair_overflow_columns(
     )
 
     # Count affected rows before rebuild
-    count_sql = (
-        f"SELECT COUNT(*) FROM {table_name} WHERE {overflow_check_expr}"
-    )
-    rows_flagged = session.execute(count_sql).fetchone()[0]
+    count_sql = f"SELECT COUNT(*) FROM {table_name} WHERE {overflow_check_expr}"
+    rows_flagged = session.scalar(count_sql)
 
     # Rebuild table: real columns + is_shifted flag
     repair_sql = load_sql(
-        "ingestion", "repair_overflow",
+        "ingestion",
+        "repair_overflow",
         table_name=table_name,
         real_columns=real_cols_select,
         overflow_check_expr=overflow_check_expr,
@@ -286,9 +376,7 @@ def _repair_overflow_columns(
 
     # Swap repaired table into place
     session.execute(f"DROP TABLE IF EXISTS {table_name}")
-    session.execute(
-        f"ALTER TABLE {table_name}_repaired RENAME TO {table_name}"
-    )
+    session.execute(f"ALTER TABLE {table_name}_repaired RENAME TO {table_name}")
 
     return {
         "overflow_columns_repaired": overflow_cols,
@@ -296,39 +384,25 @@ def _repair_overflow_columns(
     }
 
 
-def _normalize_column_names_in_table(session: DuckDBSession, table_name: str) -> dict[str, str]:
+def _normalize_column_names_in_table(
+    session: DuckDBSession, table_name: str
+) -> dict[str, str]:
     """Normalize all column names in a DuckDB table to lowercase snake_case.
 
     Returns the mapping of old->new names for columns that were renamed.
     """
     columns = session.get_column_names(table_name)
-    renames = {}
-
-    for col in columns:
-        new_name = normalize_column_name(col)
-        if new_name != col:
-            renames[col] = new_name
-
-    # Check for conflicts before renaming
-    seen: dict[str, int] = {}
-    deduped = {}
-    for col in columns:
-        target = renames.get(col, col)
-        if target in seen:
-            seen[target] += 1
-            deduped[col] = f"{target}_{seen[target]}"
-        else:
-            seen[target] = 0
-            if col in renames:
-                deduped[col] = target
-
-    renames = deduped
+    # Normalizes and de-duplicates the whole schema in one pass
+    renames = build_rename_mapping(columns)
 
     for old_name, new_name in renames.items():
         try:
             sql = load_sql(
-                "ingestion", "rename_column",
-                table_name=table_name, old_name=old_name, new_name=new_name,
+                "ingestion",
+                "rename_column",
+                table_name=table_name,
+                old_name=old_name,
+                new_name=new_name,
             )
             session.execute(sql)
         except Exception:
@@ -338,24 +412,21 @@ def _normalize_column_names_in_table(session: DuckDBSession, table_name: str) ->
 
 
 def _remove_empty_rows(session: DuckDBSession, table_name: str) -> int:
-    """Remove rows where every column is NULL. Returns count of removed rows."""
+    """Remove rows where every column is NULL. Returns count of removed rows.
+
+    A DELETE's result row is its deleted-row count, so one statement both
+    removes and counts the empty rows.
+    """
     columns = session.get_column_names(table_name)
     null_conditions = " AND ".join([f'"{col}" IS NULL' for col in columns])
 
     sql = load_sql(
-        "ingestion", "count_empty_rows",
-        table_name=table_name, null_conditions=null_conditions,
+        "ingestion",
+        "delete_empty_rows",
+        table_name=table_name,
+        null_conditions=null_conditions,
     )
-    empty_count = session.execute(sql).fetchone()[0]
-
-    if empty_count > 0:
-        sql = load_sql(
-            "ingestion", "delete_empty_rows",
-            table_name=table_name, null_conditions=null_conditions,
-        )
-        session.execute(sql)
-
-    return empty_count
+    return session.scalar(sql)
 
 
 def _coerce_types(session: DuckDBSession, table_name: str) -> dict[str, str]:
@@ -382,7 +453,9 @@ def _coerce_types(session: DuckDBSession, table_name: str) -> dict[str, str]:
         f") UNPIVOT (value FOR column_name IN ({col_list}))"
     )
 
-    analysis_sql = load_sql("ingestion", "safe_type_coercion", unpivot_query=unpivot_query)
+    analysis_sql = load_sql(
+        "ingestion", "safe_type_coercion", unpivot_query=unpivot_query
+    )
     recommendations = session.execute(analysis_sql).pl().to_dicts()
 
     coerced = {}
@@ -391,8 +464,11 @@ def _coerce_types(session: DuckDBSession, table_name: str) -> dict[str, str]:
         new_type = rec["recommended_type"]
         try:
             sql = load_sql(
-                "ingestion", "alter_column_type",
-                table_name=table_name, column_name=col, new_type=new_type,
+                "ingestion",
+                "alter_column_type",
+                table_name=table_name,
+                column_name=col,
+                new_type=new_type,
             )
             session.execute(sql)
             coerced[col] = new_type
@@ -416,10 +492,12 @@ def _load_csv_standard(
     Raises on failure so load_file can fall through to recovery.
     """
     sql = load_sql(
-        "ingestion", "load_csv",
+        "ingestion",
+        "load_csv",
         table_name=table_name,
         file_path=file_path,
         delimiter=delimiter,
+        encoding="utf-8",
         quote_char='"',
         escape_char='"',
     )
@@ -468,12 +546,16 @@ def _load_csv_robust(
     file_path: str,
     table_name: str,
     delimiter: str,
+    encoding: str = "utf-8",
 ) -> dict[str, Any]:
     """Load CSV with multi-strategy parsing to handle bad quoting/overflow.
 
     Detects whether column headers are present. Tries multiple quote/escape
     configurations and picks the one that produces the fewest overflow columns.
     Then normalizes column names and removes fully empty rows.
+
+    ``encoding`` is passed to read_csv, so files in an encoding DuckDB reads
+    natively are loaded without a transcoded copy.
     """
     source_line_count = count_source_lines(file_path)
     has_header = _detect_header(file_path, delimiter)
@@ -490,8 +572,14 @@ def _load_csv_robust(
 
     for config in parse_configs:
         if not _try_load_csv(
-            session, file_path, table_name, delimiter,
-            config["quote"], config["escape"], has_header,
+            session,
+            file_path,
+            table_name,
+            delimiter,
+            config["quote"],
+            config["escape"],
+            has_header,
+            encoding,
         ):
             continue
 
@@ -507,8 +595,14 @@ def _load_csv_robust(
     # Reload best config if it wasn't the last one tested
     if best_config and best_config != parse_configs[-1]:
         _try_load_csv(
-            session, file_path, table_name, delimiter,
-            best_config["quote"], best_config["escape"], has_header,
+            session,
+            file_path,
+            table_name,
+            delimiter,
+            best_config["quote"],
+            best_config["escape"],
+            has_header,
+            encoding,
         )
 
     # Normalize column names
@@ -526,7 +620,9 @@ def _load_csv_robust(
     overflow_repair: dict[str, Any] = {}
     if final_overflow:
         overflow_repair = _repair_overflow_columns(
-            session, table_name, final_overflow,
+            session,
+            table_name,
+            final_overflow,
         )
 
     # Gather results (after any overflow repair)
@@ -596,6 +692,7 @@ def _load_csv_robust(
 # JSON Helpers — Validation and Repair
 # ---------------------------------------------------------------------------
 
+
 def _detect_json_format(file_path: str) -> str:
     """Detect whether a file is JSON array or JSON Lines (JSONL).
 
@@ -626,14 +723,16 @@ def _validate_json(file_path: str, json_format: str) -> dict[str, Any]:
     if json_format == "array":
         try:
             with open(file_path, "r", encoding="utf-8", errors="replace") as fh:
-                json.load(fh)
+                json_loads(fh.read())
             return {"valid": True, "errors": []}
         except json.JSONDecodeError as exc:
-            errors.append({
-                "line": exc.lineno,
-                "column": exc.colno,
-                "message": exc.msg,
-            })
+            errors.append(
+                {
+                    "line": exc.lineno,
+                    "column": exc.colno,
+                    "message": exc.msg,
+                }
+            )
     else:
         with open(file_path, "r", encoding="utf-8", errors="replace") as fh:
             for line_num, line in enumerate(fh, start=1):
@@ -641,13 +740,15 @@ def _validate_json(file_path: str, json_format: str) -> dict[str, Any]:
                 if not line:
                     continue
                 try:
-                    json.loads(line)
+                    json_loads(line)
                 except json.JSONDecodeError as exc:
-                    errors.append({
-                        "line": line_num,
-                        "column": exc.colno,
-                        "message": exc.msg,
-                    })
+                    errors.append(
+                        {
+                            "line": line_num,
+                            "column": exc.colno,
+                            "message": exc.msg,
+                        }
+                    )
                     if len(errors) >= 20:
                         break
 
@@ -669,21 +770,22 @@ def _repair_json(file_path: str, json_format: str) -> dict[str, Any]:
         Dict with 'repaired_path' and 'lines_repaired' on success,
         or 'repair_failed' with 'unrecoverable_errors' on failure.
     """
-    with open(file_path, "r", encoding="utf-8-sig", errors="replace") as fh:
-        raw_content = fh.read()
-
     if json_format == "array":
+        with open(file_path, "r", encoding="utf-8-sig", errors="replace") as fh:
+            raw_content = fh.read()
         repaired_content = _repair_json_string(raw_content)
         try:
-            json.loads(repaired_content)
+            json_loads(repaired_content)
         except json.JSONDecodeError as exc:
             return {
                 "repair_failed": True,
-                "unrecoverable_errors": [{
-                    "line": exc.lineno,
-                    "column": exc.colno,
-                    "message": exc.msg,
-                }],
+                "unrecoverable_errors": [
+                    {
+                        "line": exc.lineno,
+                        "column": exc.colno,
+                        "message": exc.msg,
+                    }
+                ],
                 "message": (
                     "JSON repair failed. The file has structural issues that "
                     "could not be automatically fixed. Manual intervention required."
@@ -698,37 +800,62 @@ def _repair_json(file_path: str, json_format: str) -> dict[str, Any]:
         tmp.close()
         return {"repaired_path": tmp.name, "lines_repaired": 1}
 
-    # JSONL — atomic: every line must parse or the whole thing fails
-    repaired_lines = []
+    # JSONL — atomic: every line must parse or the whole thing fails.
+    # Lines stream from the source straight into the temp file, so memory
+    # stays flat however large the file is; the temp file is deleted if
+    # any line turns out to be unrecoverable.
+    valid_lines = 0
     lines_repaired = 0
     unrecoverable = []
 
-    for line_num, line in enumerate(raw_content.splitlines(), start=1):
-        line = line.strip()
-        if not line:
-            continue
-        try:
-            json.loads(line)
-            repaired_lines.append(line)
-        except json.JSONDecodeError:
-            repaired = _repair_json_string(line)
-            try:
-                json.loads(repaired)
-                repaired_lines.append(repaired)
-                lines_repaired += 1
-            except json.JSONDecodeError as exc:
-                unrecoverable.append({
-                    "line": line_num,
-                    "column": exc.colno,
-                    "message": exc.msg,
-                    "content_preview": line[:100],
-                })
+    tmp = tempfile.NamedTemporaryFile(
+        mode="w", suffix=".jsonl", delete=False, encoding="utf-8"
+    )
+    try:
+        with (
+            tmp,
+            open(
+                file_path,
+                "r",
+                encoding="utf-8-sig",
+                errors="replace",
+            ) as src,
+        ):
+            for line_num, line in enumerate(src, start=1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    json_loads(line)
+                except json.JSONDecodeError:
+                    repaired = _repair_json_string(line)
+                    try:
+                        json_loads(repaired)
+                    except json.JSONDecodeError as exc:
+                        unrecoverable.append(
+                            {
+                                "line": line_num,
+                                "column": exc.colno,
+                                "message": exc.msg,
+                                "content_preview": line[:100],
+                            }
+                        )
+                        continue
+                    line = repaired
+                    lines_repaired += 1
+                valid_lines += 1
+                if not unrecoverable:
+                    tmp.write(line + "\n")
+    except BaseException:
+        os.unlink(tmp.name)
+        raise
 
     if unrecoverable:
+        os.unlink(tmp.name)
         return {
             "repair_failed": True,
             "unrecoverable_errors": unrecoverable,
-            "total_lines": len(repaired_lines) + len(unrecoverable),
+            "total_lines": valid_lines + len(unrecoverable),
             "lines_failed": len(unrecoverable),
             "message": (
                 f"{len(unrecoverable)} line(s) could not be repaired. "
@@ -737,38 +864,32 @@ def _repair_json(file_path: str, json_format: str) -> dict[str, Any]:
             ),
         }
 
-    tmp = tempfile.NamedTemporaryFile(
-        mode="w", suffix=".jsonl", delete=False, encoding="utf-8"
-    )
-    for line in repaired_lines:
-        tmp.write(line + "\n")
-    tmp.close()
-
     return {"repaired_path": tmp.name, "lines_repaired": lines_repaired}
 
 
+# Control characters other than \t, \n and \r, deleted by str.translate
+_JSON_CONTROL_CHARS = dict.fromkeys(c for c in range(0x20) if chr(c) not in "\t\n\r")
+_TRAILING_COMMA = re.compile(r",\s*([}\]])")
+# A single-quoted token after : , [ or { (including keys right after {)
+_SINGLE_QUOTED_TOKEN = re.compile(r"(?<=[:,\[\{])\s*'([^']*)'")
+
+
 def _repair_json_string(s: str) -> str:
     """Apply common JSON repair heuristics to a string."""
     # Strip BOM
     s = s.lstrip("\ufeff")
 
     # Remove control characters (except \n, \r, \t)
-    s = re.sub(r"[\x00-\x08\x0b\x0c\x0e-\x1f]", "", s)
+    s = s.translate(_JSON_CONTROL_CHARS)
 
     # Fix trailing commas: ,] -> ] and ,} -> }
-    s = re.sub(r",\s*([}\]])", r"\1", s)
+    s = _TRAILING_COMMA.sub(r"\1", s)
 
     # Fix single-quoted strings to double-quoted.
     # Handles mixed files with both single and double-quoted strings.
     # Replaces single-quoted JSON tokens: 'key' or 'value'
     if "'" in s:
-        s = re.sub(
-            r"(?<=[:,\[\{])\s*'([^']*)'",
-            r'"\1"',
-            s,
-        )
-        # Handle single-quoted keys right after { with optional whitespace
-        s = re.sub(r"(\{)\s*'([^']*)'", r'\1"\2"', s)
+        s = _SINGLE_QUOTED_TOKEN.sub(r'"\1"', s)
 
     return s
 
@@ -787,7 +908,8 @@ def _load_json_standard(
     duckdb_format = json_format if json_format != "auto" else "auto"
 
     sql = load_sql(
-        "ingestion", "load_json",
+        "ingestion",
+        "load_json",
         table_name=table_name,
         file_path=file_path,
         json_format=duckdb_format,
@@ -857,7 +979,8 @@ def _load_json_robust(
 
     # Load into DuckDB
     sql = load_sql(
-        "ingestion", "load_json",
+        "ingestion",
+        "load_json",
         table_name=table_name,
         file_path=load_path,
         json_format=duckdb_format,
@@ -869,7 +992,9 @@ def _load_json_robust(
 
     total_rows = session.get_row_count(table_name)
     columns = session.get_column_types(table_name)
-    sample = session.execute(load_sql("common", "sample_rows", table_name=table_name, limit="5")).pl()
+    sample = session.execute(
+        load_sql("common", "sample_rows", table_name=table_name, limit="5")
+    ).pl()
 
     # Cleanup temp file if we repaired
     if load_path != file_path:
@@ -903,6 +1028,7 @@ def _load_json_robust(
 # Public Tool Functions
 # ---------------------------------------------------------------------------
 
+
 def load_file(
     file_path: str,
     tool_context: ToolContext,
@@ -963,7 +1089,8 @@ def load_file(
 
         elif fmt == FileFormat.PARQUET:
             sql = load_sql(
-                "ingestion", "load_parquet",
+                "ingestion",
+                "load_parquet",
                 table_name=table_name,
                 file_path=file_path,
             )
@@ -990,7 +1117,8 @@ def load_file(
 
         elif fmt == FileFormat.EXCEL:
             sql = load_sql(
-                "ingestion", "load_excel",
+                "ingestion",
+                "load_excel",
                 table_name=table_name,
                 file_path=file_path,
             )
@@ -1030,18 +1158,32 @@ def load_file(
         load_path = file_path
         detected_encoding = None
         is_lossy_transcode = False
+        is_delimited = fmt in (FileFormat.CSV, FileFormat.TSV)
 
         try:
             load_path, detected_encoding, is_lossy_transcode = ensure_utf8(
-                file_path, fmt,
+                file_path,
+                fmt,
+                allow_native=is_delimited,
             )
         except Exception:
             pass
 
+        # Encodings read_csv handles natively skip the transcoded copy
+        csv_encoding = "utf-8"
+        if load_path == file_path:
+            csv_encoding = duckdb_csv_encoding(detected_encoding) or "utf-8"
+
         try:
-            if fmt in (FileFormat.CSV, FileFormat.TSV):
+            if is_delimited:
                 delimiter = detect_delimiter(load_path)
-                result = _load_csv_robust(session, load_path, table_name, delimiter)
+                result = _load_csv_robust(
+                    session,
+                    load_path,
+                    table_name,
+                    delimiter,
+                    csv_encoding,
+                )
 
             elif fmt in (FileFormat.JSON, FileFormat.JSONL):
                 result = _load_json_robust(session, load_path, table_name)
@@ -1138,6 +1280,85 @@ def load_file(
     return result
 
 
+# Upper bound on files loaded at once by load_files
+_MAX_PARALLEL_LOADS = 8
+
+
+def load_files(
+    file_paths: list[str],
+    tool_context: ToolContext,
+    output_dir: str = "",
+) -> dict[str, Any]:
+    """Load several independent files into DuckDB in parallel.
+
+    Runs load_file for each file concurrently (up to 8 at a time), each
+    worker on its own cursor into the shared in-memory database. Files
+    that map to the same table name are loaded one after another, in the
+    order given, so the last one wins exactly as with sequential loads.
+
+    Args:
+        file_paths: Absolute paths of the files to load.
+        output_dir: Optional output directory for Parquet files.
+            Defaults to DATAGRUNT_OUTPUT_DIR env var or /tmp/datagrunt.
+
+    Returns:
+        Dict with status ("success", "partial", or "error"), per-file
+        load_file results in input order, and the loaded table names,
+        each listed once. A file whose table was replaced by a later file
+        in the list has status "overwritten" and names that file in
+        "overwritten_by".
+    """
+    if not file_paths:
+        return {"error": "No files given. Pass at least one file path."}
+
+    session = _get_session()
+    if "loaded_tables" not in tool_context.state:
+        tool_context.state["loaded_tables"] = {}
+
+    # Files sharing a table name must not race on CREATE OR REPLACE
+    groups: dict[str, list[int]] = {}
+    for index, path in enumerate(file_paths):
+        groups.setdefault(session.generate_table_name(path), []).append(index)
+
+    results: list[dict[str, Any]] = [{} for _ in file_paths]
+
+    def load_group(indexes: list[int]):
+        for index in indexes:
+            results[index] = load_file(file_paths[index], tool_context, output_dir)
+
+    workers = min(_MAX_PARALLEL_LOADS, len(groups))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(load_group, groups.values()))
+
+    loaded = [i for i, r in enumerate(results) if "error" not in r]
+    # Within a group only the last successful load keeps its table
+    for indexes in groups.values():
+        succeeded = [i for i in indexes if "error" not in results[i]]
+        for index in succeeded[:-1]:
+            results[index]["status"] = "overwritten"
+            results[index]["overwritten_by"] = file_paths[succeeded[-1]]
+    # Concurrent loads set current_* in completion order; pin them to the
+    # last successful file in input order, as sequential loads would.
+    if loaded:
+        source = validate_path(file_paths[loaded[-1]])
+        tool_context.state["current_file"] = source
+        tool_context.state["current_table"] = results[loaded[-1]]["table_name"]
+        tool_context.state["file_format"] = detect_file_format(source).value
+
+    if len(loaded) == len(results):
+        status = "success"
+    else:
+        status = "partial" if loaded else "error"
+    return {
+        "status": status,
+        "total_files": len(file_paths),
+        "loaded_files": len(loaded),
+        "failed_files": len(results) - len(loaded),
+        "table_names": list(dict.fromkeys(results[i]["table_name"] for i in loaded)),
+        "results": results,
+    }
+
+
 def detect_format(file_path: str) -> dict[str, Any]:
     """Detect the format of a file without loading it.
 
@@ -1189,14 +1410,17 @@ def list_tables(tool_context: ToolContext) -> dict[str, Any]:
         }
 
     tables = []
-    for name, meta in registry.items():
-        tables.append({
-            "table_name": name,
-            "source_path": meta.source_path,
-            "source_format": meta.source_format,
-            "row_count": meta.row_count,
-            "column_count": meta.column_count,
-        })
+    # Snapshot the live view: a concurrent load_file may register a table
+    for meta in tuple(registry.values()):
+        tables.append(
+            {
+                "table_name": meta.table_name,
+                "source_path": meta.source_path,
+                "source_format": meta.source_format,
+                "row_count": meta.row_count,
+                "column_count": meta.column_count,
+            }
+        )
 
     return {"tables": tables, "total_tables": len(tables)}
 
@@ -0,0 +1,84 @@
+"""Composite pipeline tool — load, audit, and clean a file in one call.
+
+Chains the ingestion, quality, and cleaning tools in-process on the same
+ToolContext, so the standard pipeline costs the coordinator one tool call
+instead of a model round trip per stage.
+"""
+
+from typing import Any
+
+from google.adk.tools import ToolContext
+
+from datagrunt_agent.tools.cleaning import clean_table
+from datagrunt_agent.tools.ingestion import load_file
+from datagrunt_agent.tools.quality import quality_report
+
+# Quality finding categories that warrant running the cleaning protocol
+ACTIONABLE_CATEGORIES = frozenset(
+    {
+        "null_like_strings",
+        "whitespace",
+        "type_analysis",
+        "duplicates",
+        "constant_columns",
+        "null_analysis",
+    }
+)
+
+
+def has_actionable_findings(findings: list[dict[str, Any]]) -> bool:
+    """Return True if any finding belongs to an actionable category."""
+    return any(f.get("category") in ACTIONABLE_CATEGORIES for f in findings)
+
+
+def load_and_clean(
+    file_path: str,
+    tool_context: ToolContext,
+    output_dir: str = "",
+) -> dict[str, Any]:
+    """Load a file, audit its quality, and clean it — the full pipeline.
+
+    Runs load_file, then quality_report, then clean_table (only when the
+    audit has actionable findings) in a single call. Each stage stores its
+    usual results in session state, so the report export tools work
+    afterwards exactly as if the stages had been called one by one.
+
+    Args:
+        file_path: Absolute path to the file to load.
+        output_dir: Optional output directory for Parquet file.
+            Defaults to DATAGRUNT_OUTPUT_DIR env var or /tmp/datagrunt.
+
+    Returns:
+        Dict with status, table_name, and the load, quality, and cleaning
+        results. cleaning is None when no cleaning was needed. If a stage
+        fails, its error is returned with the results gathered so far.
+    """
+    load_result = load_file(file_path, tool_context, output_dir=output_dir)
+    if load_result.get("status") != "success":
+        return load_result
+
+    table_name = load_result["table_name"]
+    result: dict[str, Any] = {
+        "status": "success",
+        "table_name": table_name,
+        "load": load_result,
+        "quality": None,
+        "cleaning": None,
+    }
+
+    # Only the checks cleaning acts on; outliers are left to a full audit
+    quality = quality_report(table_name, tool_context, scope="cleaner_minimal")
+    result["quality"] = quality
+    if "error" in quality:
+        result["status"] = "error"
+        result["error"] = f"Quality audit failed: {quality['error']}"
+        return result
+
+    if has_actionable_findings(quality["findings"]):
+        cleaning = clean_table(table_name, tool_context)
+        result["cleaning"] = cleaning
+        if "error" in cleaning:
+            result["status"] = "error"
+            result["error"] = f"Cleaning failed: {cleaning['error']}"
+
+    return result
@@ -1,55 +1,210 @@
 """Data profiling tools for column-level and table-level analysis."""
 
+from collections.abc import Iterator
+from contextlib import ExitStack, contextmanager
 from typing import Any
 
 from google.adk.tools import ToolContext
 
+from datagrunt_agent.core.duckdb_session import quote_identifier
 from datagrunt_agent.core.sql_loader import load_sql
 from datagrunt_agent.tools.ingestion import _get_session
 
+# Tables above this row count are profiled from a reservoir sample unless
+# the caller asks for a full scan (sample_size=0).
+_AUTO_SAMPLE_MIN_ROWS = 1_000_000
+_DEFAULT_SAMPLE_SIZE = 100_000
 
-def profile_columns(table_name: str, tool_context: ToolContext) -> dict[str, Any]:
+
+def profile_columns(
+    table_name: str,
+    tool_context: ToolContext,
+    exact_cardinality: bool = False,
+    sample_size: int | None = None,
+) -> dict[str, Any]:
     """Analyze schema and produce per-column statistics for a loaded table.
 
-    Returns for each column: name, DuckDB type, approximate unique count,
-    null percentage, min, max, and average. Also suggests type coercions
-    (e.g., a VARCHAR column that looks like numbers or dates).
+    Returns for each column: name, DuckDB type, approximate unique count
+    (HyperLogLog), null percentage, min, max, and average. Also suggests
+    type coercions (e.g., a VARCHAR column that looks like numbers or dates).
 
     This is a batch operation — profiles ALL columns in one call to minimize
     LLM round-trips.
 
+    Tables over 1M rows are profiled from a 100k-row reservoir sample by
+    default; the result then has sampled=True and the sample_size used.
+
     Args:
         table_name: The DuckDB table name (returned by load_file).
+        exact_cardinality: Also compute exact distinct counts
+            (exact_unique). Slower and memory-hungry on large tables; only
+            use when the user asks for exact counts.
+        sample_size: Rows to sample for the statistics. None (default)
+            samples only tables over 1M rows; 0 always scans the full table.
     """
     session = _get_session()
     if not session.table_exists(table_name):
         return {"error": f"Table '{table_name}' not found. Use load_file first."}
 
-    # Column statistics via DuckDB SUMMARIZE
-    sql = load_sql("profiling", "column_stats", table_name=table_name)
-    stats = session.execute_to_polars(sql).to_dicts()
+    with _profiling_source(session, table_name, sample_size) as source:
+        # Column statistics via DuckDB SUMMARIZE
+        sql = load_sql("profiling", "column_stats", table_name=source)
+        stats = session.execute_to_polars(sql).to_dicts()
+        return _build_column_profile(
+            session,
+            table_name,
+            stats,
+            exact_cardinality,
+            source,
+        )
+
+
+def profile_tables(
+    table_names: list[str],
+    tool_context: ToolContext,
+    exact_cardinality: bool = False,
+    sample_size: int | None = None,
+) -> dict[str, Any]:
+    """Profile the columns of several loaded tables in one call.
+
+    Same per-table output as profile_columns, but the SUMMARIZE statistics
+    for every table come from a single UNION ALL query. Use this instead of
+    calling profile_columns once per table.
+
+    Args:
+        table_names: The DuckDB table names (returned by load_file).
+        exact_cardinality: Also compute exact distinct counts
+            (exact_unique); see profile_columns.
+        sample_size: Applied to each table; see profile_columns.
+    """
+    session = _get_session()
+    requested = list(dict.fromkeys(table_names))
+    found = [t for t in requested if session.table_exists(t)]
+    missing = [t for t in requested if t not in found]
+    if not found:
+        return {"error": f"Tables not found: {missing}. Use load_file first."}
+
+    with ExitStack() as stack:
+        sources = {
+            t: stack.enter_context(_profiling_source(session, t, sample_size))
+            for t in found
+        }
+        sql = "\nUNION ALL\n".join(
+            load_sql(
+                "profiling",
+                "column_stats_for_table",
+                table_name=t,
+                source_table=sources[t],
+            )
+            for t in found
+        )
+        stats_by_table: dict[str, list[dict]] = {t: [] for t in found}
+        for row in session.execute_to_polars(sql).to_dicts():
+            stats_by_table[row.pop("table_name")].append(row)
+
+        result: dict[str, Any] = {
+            "tables": [
+                _build_column_profile(
+                    session,
+                    t,
+                    stats_by_table[t],
+                    exact_cardinality,
+                    sources[t],
+                )
+                for t in found
+            ],
+            "total_tables": len(found),
+        }
+    if missing:
+        result["missing_tables"] = missing
+    return result
+
+
+@contextmanager
+def _profiling_source(
+    session,
+    table_name: str,
+    sample_size: int | None,
+) -> Iterator[str]:
+    """Yield the relation to profile: the table or a sample of it.
 
-    columns = session.get_column_names(table_name)
+    A sample is materialized once as a temp table so SUMMARIZE and every
+    per-column probe read the same rows, and dropped afterwards.
+    """
     total_rows = session.get_row_count(table_name)
+    if sample_size is None:
+        sample_size = _DEFAULT_SAMPLE_SIZE if total_rows > _AUTO_SAMPLE_MIN_ROWS else 0
+    if sample_size <= 0 or sample_size >= total_rows:
+        yield table_name
+        return
 
-    # Type coercion suggestions for VARCHAR columns
-    coercion_suggestions = []
-    for col in columns:
-        col_type = session.get_column_types(table_name).get(col, "")
-        if "VARCHAR" not in col_type.upper():
-            continue
+    sample_table = f"_profile_sample_{table_name}"
+    session.execute(
+        load_sql(
+            "profiling",
+            "sample_table",
+            sample_table=sample_table,
+            table_name=table_name,
+            sample_size=str(sample_size),
+        )
+    )
+    try:
+        yield sample_table
+    finally:
+        session.execute(f"DROP TABLE IF EXISTS {sample_table}")
 
-        # Check number potential (strips $, %, commas)
-        sql = load_sql("profiling", "number_potential", table_name=table_name, column_name=col)
-        number_count = session.execute(sql).fetchone()[0]
 
-        # Check date potential
-        sql = load_sql("profiling", "date_potential", table_name=table_name, column_name=col)
-        date_count = session.execute(sql).fetchone()[0]
+def _build_column_profile(
+    session,
+    table_name: str,
+    stats: list[dict],
+    exact_cardinality: bool = False,
+    source: str | None = None,
+) -> dict[str, Any]:
+    """Combine SUMMARIZE stats with type coercion suggestions for a table.
 
-        sql = load_sql("common", "non_null_count", table_name=table_name, column_name=col)
-        non_null_count = session.execute(sql).fetchone()[0]
+    ``source`` is the relation the statistics were computed over — the
+    table itself or a sample of it from _profiling_source.
+    """
+    source = source or table_name
+    sampled = source != table_name
+    columns = session.get_column_names(source)
+    non_null_counts = None
+    if exact_cardinality:
+        # Distinct and non-null counts share one scan
+        counts = (
+            session.aggregate(
+                source,
+                [
+                    expr
+                    for col in columns
+                    for expr in (
+                        f"COUNT(DISTINCT {quote_identifier(col)})",
+                        f"COUNT({quote_identifier(col)})",
+                    )
+                ],
+            )
+            if columns
+            else ()
+        )
+        exact = dict(zip(columns, counts[0::2]))
+        non_null_counts = dict(zip(columns, counts[1::2]))
+        for row in stats:
+            row["exact_unique"] = exact.get(row["column_name"])
+    total_rows = session.get_row_count(table_name)
+    profiled_rows = session.get_row_count(source) if sampled else total_rows
+    column_types = session.get_column_types(source)
 
+    # Type coercion suggestions for VARCHAR columns
+    varchar_cols = [
+        col for col in columns if "VARCHAR" in column_types.get(col, "").upper()
+    ]
+    coercion_suggestions = []
+    for col, (number_count, date_count, non_null_count) in _coercion_potential(
+        session,
+        source,
+        varchar_cols,
+    ).items():
         suggestions = []
         if non_null_count > 0:
             if number_count / non_null_count > 0.9:
@@ -58,18 +213,96 @@ def profile_columns(table_name: str, tool_context: ToolContext) -> dict[str, Any
                 suggestions.append("DATE")
 
         if suggestions:
-            coercion_suggestions.append({
-                "column": col,
-                "suggested_types": suggestions,
-            })
+            coercion_suggestions.append(
+                {
+                    "column": col,
+                    "suggested_types": suggestions,
+                }
+            )
 
-    return {
+    profile = {
         "table_name": table_name,
         "total_rows": total_rows,
         "total_columns": len(columns),
+        "sampled": sampled,
         "column_stats": stats,
+        "all_unique_columns": _all_unique_columns(
+            stats,
+            profiled_rows,
+            non_null_counts,
+        ),
+        "all_unique_exact": exact_cardinality,
         "type_coercion_suggestions": coercion_suggestions,
     }
+    if sampled:
+        profile["sample_size"] = profiled_rows
+    return profile
+
+
+def _coercion_potential(
+    session,
+    source: str,
+    varchar_cols: list[str],
+) -> dict[str, tuple[int, int, int]]:
+    """Count number-castable, date-castable and non-null values per column.
+
+    Every column's counts come back from one query as a single row,
+    instead of three COUNT(*) queries and scalar fetches per column.
+    Number potential strips $, % and commas before casting.
+
+    Returns:
+        column -> (number_count, date_count, non_null_count).
+    """
+    if not varchar_cols:
+        return {}
+    aggregates = []
+    for col in varchar_cols:
+        number = load_sql("profiling", "number_potential", column_name=col)
+        date = load_sql("profiling", "date_potential", column_name=col)
+        aggregates.append(f"COUNT(*) FILTER (WHERE {number})")
+        aggregates.append(f"COUNT(*) FILTER (WHERE {date})")
+        aggregates.append(f'COUNT("{col}")')
+    row = session.execute(
+        load_sql(
+            "profiling",
+            "coercion_potential",
+            table_name=source,
+            aggregates=", ".join(aggregates),
+        )
+    ).fetchone()
+    return {col: tuple(row[3 * i : 3 * i + 3]) for i, col in enumerate(varchar_cols)}
+
+
+def _all_unique_columns(
+    stats: list[dict],
+    total_rows: int,
+    non_null_counts: dict[str, int] | None = None,
+) -> list[str]:
+    """Columns whose cardinality matches their non-null row count (ID-like).
+
+    A value-frequency breakdown of these columns is all 1s, so reporting
+    them as all-unique replaces any top-values analysis. With
+    ``non_null_counts`` (exact_cardinality), a column qualifies when its
+    exact distinct count equals its exact non-null count. Otherwise the
+    flag is approximate: SUMMARIZE's HyperLogLog approx_unique can land on
+    either side of the true count, so a column qualifies when the estimate
+    reaches 90% of its non-null count, and no extra scan is run.
+    """
+    if total_rows == 0:
+        return []
+    unique = []
+    for row in stats:
+        col = row["column_name"]
+        if non_null_counts is not None:
+            non_null = non_null_counts.get(col) or 0
+            if non_null > 0 and row.get("exact_unique") == non_null:
+                unique.append(col)
+            continue
+        null_pct = row.get("null_percentage") or 0
+        non_null = total_rows * (1 - null_pct / 100.0)
+        if non_null > 0 and (row.get("approx_unique") or 0) >= 0.9 * non_null:
+            unique.append(col)
+    return unique
 
 
 def profile_table(table_name: str, tool_context: ToolContext) -> dict[str, Any]:
@@ -87,17 +320,26 @@ def profile_table(table_name: str, tool_context: ToolContext) -> dict[str, Any]:
     total_rows = session.get_row_count(table_name)
     columns = session.get_column_types(table_name)
 
-    # Null count per column
+    # Null counts: columns that storage statistics prove null-free need no
+    # scan; the rest are counted together in one wide SELECT.
+    null_counts = dict.fromkeys(session.get_columns_without_nulls(table_name), 0)
+    to_scan = [c for c in columns if c not in null_counts]
+    if to_scan:
+        exprs = ", ".join(f'COUNT(*) - COUNT("{c}")' for c in to_scan)
+        row = session.execute(f"SELECT {exprs} FROM {table_name}").fetchone()
+        null_counts.update(zip(to_scan, row))
+
     null_summary = []
     for col in columns:
-        sql = load_sql("common", "null_count", table_name=table_name, column_name=col)
-        null_count = session.execute(sql).fetchone()[0]
+        null_count = null_counts[col]
         null_pct = round(null_count * 100.0 / total_rows, 2) if total_rows > 0 else 0
-        null_summary.append({
-            "column": col,
-            "null_count": null_count,
-            "null_percentage": null_pct,
-        })
+        null_summary.append(
+            {
+                "column": col,
+                "null_count": null_count,
+                "null_percentage": null_pct,
+            }
+        )
 
     return {
         "table_name": table_name,
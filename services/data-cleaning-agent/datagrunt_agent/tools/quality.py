@@ -4,7 +4,8 @@ Reports findings but never modifies data. Every finding is structured
 for machine consumption (no prose message strings).
 
 Performance: all checks use wide-SELECT with FILTER clauses so the
-entire quality scan runs in ~4 queries regardless of column count.
+entire quality scan runs in 4 table scans regardless of column count:
+SUMMARIZE, one pass for every VARCHAR string check, duplicates, outliers.
 """
 
 from typing import Any
@@ -14,19 +15,23 @@ from google.adk.tools import ToolContext
 from datagrunt_agent.core.sql_loader import load_sql
 from datagrunt_agent.tools.ingestion import _get_session
 
-# Null-like sentinel values (lowercase) — must match the old per-column SQL
-_NULL_LIKE_SENTINELS = (
-    "'null'", "'none'", "'n/a'", "'na'", "'-'", "''", "'#n/a'", "'nan'", "'missing'"
-)
-_NULL_LIKE_IN_CLAUSE = ", ".join(_NULL_LIKE_SENTINELS)
+# SUMMARIZE approx_unique at or below this marks a constant-column candidate
+_CONSTANT_CANDIDATE_MAX_UNIQUE = 2
+
+# Audit scopes. "cleaner_minimal" computes only what clean_table consumes
+# and skips the informational outlier pass.
+QUALITY_SCOPES = ("full", "cleaner_minimal")
 
 
 def run_quality_checks(
-    session, table_name: str,
+    session,
+    table_name: str,
+    scope: str = "full",
 ) -> tuple[list[dict], dict, list[dict]]:
     """Run all quality checks on a table and return structured findings.
 
-    Uses wide-SELECT with FILTER clauses for single-pass scans.
+    Uses wide-SELECT with FILTER clauses for single-pass scans. With
+    scope="cleaner_minimal" the outlier pass is skipped.
 
     Returns:
         Tuple of (findings, severity_counts, summarize_rows).
@@ -41,26 +46,33 @@ def run_quality_checks(
 
     varchar_cols = [c for c in check_columns if column_types.get(c) == "VARCHAR"]
     numeric_cols = [
-        c for c in check_columns
+        c
+        for c in check_columns
         if column_types.get(c) in ("BIGINT", "INTEGER", "DOUBLE", "FLOAT", "DECIMAL")
     ]
 
     # 1 query: SUMMARIZE → nulls, constant columns, schema snapshot
     summarize_rows = _run_summarize(session, table_name)
     _nulls_from_summarize(summarize_rows, total_rows, findings)
-    _constants_from_summarize(summarize_rows, findings)
+    _constants_from_summarize(session, table_name, summarize_rows, findings)
 
     all_numeric = list(numeric_cols)
 
     if total_rows > 0 and varchar_cols:
-        # 1 query: type analysis (wide-SELECT with FILTER)
-        type_results = _batch_type_analysis(
-            session, table_name, varchar_cols, total_rows, findings,
+        # 1 query: type analysis + null-like + whitespace (wide-SELECT with FILTER)
+        type_row, null_like_row = _batch_varchar_audit(
+            session,
+            table_name,
+            varchar_cols,
         )
-
-        # 1 query: null-like + whitespace combined (wide-SELECT with FILTER)
-        _batch_null_like_and_whitespace(
-            session, table_name, varchar_cols, total_rows, findings,
+        type_results = _type_analysis_findings(varchar_cols, type_row, findings)
+        _null_like_and_whitespace_findings(
+            session,
+            table_name,
+            varchar_cols,
+            null_like_row,
+            total_rows,
+            findings,
         )
 
         # Identify numeric-like VARCHAR cols from type_results
@@ -72,9 +84,9 @@ def run_quality_checks(
     # 1 query: duplicates
     _check_duplicates(session, table_name, findings)
 
-    # 1 query: outliers (wide-SELECT with CTE bounds)
-    if all_numeric:
-        _batch_outliers(session, table_name, all_numeric, findings)
+    # 1 query: outliers (wide-SELECT with CTE bounds) — informational only
+    if all_numeric and scope == "full":
+        _batch_outliers(session, table_name, all_numeric, total_rows, findings)
 
     severity_counts = {"info": 0, "warning": 0, "critical": 0}
     for f in findings:
@@ -83,18 +95,29 @@ def run_quality_checks(
     return findings, severity_counts, summarize_rows
 
 
-def quality_report(table_name: str, tool_context: ToolContext) -> dict[str, Any]:
+def quality_report(
+    table_name: str,
+    tool_context: ToolContext,
+    scope: str = "full",
+) -> dict[str, Any]:
     """Run a comprehensive observational quality audit on a loaded table.
 
     Reports findings across multiple dimensions but changes nothing.
 
     Args:
         table_name: The DuckDB table to audit. Must already be loaded.
+        scope: "full" (default) runs every check. "cleaner_minimal" runs
+            only the checks clean_table acts on (nulls, null-like strings,
+            whitespace, type analysis, constants, duplicates) and skips
+            outlier detection.
 
     Returns:
         Dict with structured findings organized by category, each with
         severity level and typed metrics.
     """
+    if scope not in QUALITY_SCOPES:
+        return {"error": f"Unknown scope '{scope}'. Use one of {list(QUALITY_SCOPES)}."}
+
     session = _get_session()
 
     if not session.table_exists(table_name):
@@ -104,7 +127,11 @@ def quality_report(table_name: str, tool_context: ToolContext) -> dict[str, Any]
     columns = session.get_column_names(table_name)
     check_columns = [c for c in columns if c != "processed_at"]
 
-    findings, severity_counts, _summarize = run_quality_checks(session, table_name)
+    findings, severity_counts, _summarize = run_quality_checks(
+        session,
+        table_name,
+        scope,
+    )
 
     # Store findings in session state for downstream agents (DataCleaner)
     tool_context.state["quality_findings"] = findings
@@ -114,6 +141,7 @@ def quality_report(table_name: str, tool_context: ToolContext) -> dict[str, Any]
         "table_name": table_name,
         "total_rows": total_rows,
         "total_columns": len(check_columns),
+        "scope": scope,
         "findings": findings,
         "severity_counts": severity_counts,
     }
@@ -123,6 +151,7 @@ def quality_report(table_name: str, tool_context: ToolContext) -> dict[str, Any]
 # Batched helpers — wide-SELECT with FILTER
 # ---------------------------------------------------------------------------
 
+
 def _run_summarize(session, table_name: str) -> list[dict]:
     """Run SUMMARIZE and return results as a list of dicts."""
     sql = load_sql("profiling", "column_stats", table_name=table_name)
@@ -130,7 +159,9 @@ def _run_summarize(session, table_name: str) -> list[dict]:
 
 
 def _nulls_from_summarize(
-    summarize_rows: list[dict], total_rows: int, findings: list,
+    summarize_rows: list[dict],
+    total_rows: int,
+    findings: list,
 ):
     """Extract null findings from SUMMARIZE results (null_percentage column)."""
     if total_rows == 0:
@@ -145,60 +176,100 @@ def _nulls_from_summarize(
         if null_rate > 0.5:
             null_count = int(round(null_rate * total_rows))
             severity = "critical" if null_rate > 0.9 else "warning"
-            findings.append({
-                "category": "null_analysis",
-                "severity": severity,
-                "column": col,
-                "null_count": null_count,
-                "null_rate": round(null_rate, 4),
-            })
+            findings.append(
+                {
+                    "category": "null_analysis",
+                    "severity": severity,
+                    "column": col,
+                    "null_count": null_count,
+                    "null_rate": round(null_rate, 4),
+                }
+            )
 
 
-def _constants_from_summarize(summarize_rows: list[dict], findings: list):
-    """Extract constant-column finding from SUMMARIZE results."""
-    constant_cols = [
+def _constants_from_summarize(
+    session,
+    table_name: str,
+    summarize_rows: list[dict],
+    findings: list,
+):
+    """Extract constant-column finding from SUMMARIZE results.
+
+    approx_unique is a HyperLogLog estimate, so it only shortlists
+    candidates (estimate <= 2). The shortlist, usually empty, is confirmed
+    with one exact COUNT(DISTINCT) query — cheap on near-constant columns.
+    """
+    candidates = [
         row["column_name"]
         for row in summarize_rows
         if row.get("column_name") != "processed_at"
-        and (row.get("approx_unique") or 0) <= 1
+        and (row.get("approx_unique") or 0) <= _CONSTANT_CANDIDATE_MAX_UNIQUE
     ]
+    if not candidates:
+        return
+    exact = session.get_distinct_counts(table_name, candidates)
+    constant_cols = [col for col in candidates if exact[col] <= 1]
     if constant_cols:
-        findings.append({
-            "category": "constant_columns",
-            "severity": "info",
-            "columns": constant_cols,
-        })
+        findings.append(
+            {
+                "category": "constant_columns",
+                "severity": "info",
+                "columns": constant_cols,
+            }
+        )
 
 
-def _batch_type_analysis(
-    session, table_name: str, varchar_cols: list[str],
-    total_rows: int, findings: list,
-) -> dict[str, dict]:
-    """Run type castability analysis for all VARCHAR cols in one query.
+def _batch_varchar_audit(
+    session,
+    table_name: str,
+    varchar_cols: list[str],
+) -> tuple[tuple, tuple]:
+    """Scan all VARCHAR columns once for every per-column string check.
 
-    Returns dict mapping col -> {non_null, castable_double, castable_date,
-    castable_boolean, leading_zeros} for downstream use (outlier pre-check).
+    Returns (type_row, null_like_row): the type-analysis counts (5 per
+    column) and the null-like/whitespace counts (2 per column), in
+    varchar_cols order.
     """
-    if not varchar_cols:
-        return {}
-
-    # Build wide-SELECT with 5 FILTER expressions per column
-    select_parts = []
+    type_parts = []
+    null_like_parts = []
     for col in varchar_cols:
         q = f'"{col}"'
-        select_parts.extend([
-            f'COUNT({q}) FILTER (WHERE {q} IS NOT NULL) AS "{col}__non_null"',
-            f'COUNT(*) FILTER (WHERE TRY_CAST({q} AS DOUBLE) IS NOT NULL) AS "{col}__castable_double"',
-            f'COUNT(*) FILTER (WHERE TRY_CAST({q} AS DATE) IS NOT NULL) AS "{col}__castable_date"',
-            f"COUNT(*) FILTER (WHERE LOWER(TRIM({q})) IN ('true','false','0','1','yes','no')) "
-            f'AS "{col}__castable_boolean"',
-            f"COUNT(*) FILTER (WHERE {q} LIKE '0%' AND LENGTH({q}) > 1 "
-            f'AND TRY_CAST({q} AS BIGINT) IS NOT NULL) AS "{col}__leading_zeros"',
-        ])
-
-    sql = f"SELECT {', '.join(select_parts)} FROM {table_name}"
+        type_parts.extend(
+            [
+                f'COUNT({q}) FILTER (WHERE {q} IS NOT NULL) AS "{col}__non_null"',
+                f'COUNT(*) FILTER (WHERE TRY_CAST({q} AS DOUBLE) IS NOT NULL) AS "{col}__castable_double"',
+                f'COUNT(*) FILTER (WHERE TRY_CAST({q} AS DATE) IS NOT NULL) AS "{col}__castable_date"',
+                f"COUNT(*) FILTER (WHERE LOWER(TRIM({q})) IN ('true','false','0','1','yes','no')) "
+                f'AS "{col}__castable_boolean"',
+                f"COUNT(*) FILTER (WHERE {q} LIKE '0%' AND LENGTH({q}) > 1 "
+                f'AND TRY_CAST({q} AS BIGINT) IS NOT NULL) AS "{col}__leading_zeros"',
+            ]
+        )
+        null_like_parts.extend(
+            [
+                f'COUNT(*) FILTER (WHERE is_null_like({q})) AS "{col}__null_like"',
+                (
+                    f"COUNT(*) FILTER (WHERE {q} IS NOT NULL AND {q} != TRIM({q})) "
+                    f'AS "{col}__whitespace"'
+                ),
+            ]
+        )
+
+    sql = f"SELECT {', '.join(type_parts + null_like_parts)} FROM {table_name}"
     row = session.execute(sql).fetchone()
+    return row[: len(type_parts)], row[len(type_parts) :]
+
 
+def _type_analysis_findings(
+    varchar_cols: list[str],
+    row: tuple,
+    findings: list,
+) -> dict[str, dict]:
+    """Turn type castability counts into findings.
+
+    Returns dict mapping col -> {non_null, castable_double, castable_date,
+    castable_boolean, leading_zeros} for downstream use (outlier pre-check).
+    """
     # Parse the single result row back into per-column dicts
     results: dict[str, dict] = {}
     idx = 0
@@ -247,43 +318,31 @@ def _batch_type_analysis(
         elif numeric_rate > 0.9:
             suggested_cast = "DOUBLE"
 
-        findings.append({
-            "category": "type_analysis",
-            "severity": severity,
-            "column": col,
-            "numeric_castable_rate": numeric_rate,
-            "date_castable_rate": date_rate,
-            "boolean_castable_rate": boolean_rate,
-            "leading_zero_count": leading_zeros,
-            "suggested_cast": suggested_cast,
-        })
+        findings.append(
+            {
+                "category": "type_analysis",
+                "severity": severity,
+                "column": col,
+                "numeric_castable_rate": numeric_rate,
+                "date_castable_rate": date_rate,
+                "boolean_castable_rate": boolean_rate,
+                "leading_zero_count": leading_zeros,
+                "suggested_cast": suggested_cast,
+            }
+        )
 
     return results
 
 
-def _batch_null_like_and_whitespace(
-    session, table_name: str, varchar_cols: list[str],
-    total_rows: int, findings: list,
+def _null_like_and_whitespace_findings(
+    session,
+    table_name: str,
+    varchar_cols: list[str],
+    row: tuple,
+    total_rows: int,
+    findings: list,
 ):
-    """Run null-like value counts and whitespace checks in one query."""
-    if not varchar_cols:
-        return
-
-    select_parts = []
-    for col in varchar_cols:
-        q = f'"{col}"'
-        select_parts.append(
-            f"COUNT(*) FILTER (WHERE LOWER(TRIM({q}::VARCHAR)) IN ({_NULL_LIKE_IN_CLAUSE})) "
-            f'AS "{col}__null_like"'
-        )
-        select_parts.append(
-            f"COUNT(*) FILTER (WHERE {q} IS NOT NULL AND {q} != TRIM({q})) "
-            f'AS "{col}__whitespace"'
-        )
-
-    sql = f"SELECT {', '.join(select_parts)} FROM {table_name}"
-    row = session.execute(sql).fetchone()
-
+    """Turn null-like value and whitespace counts into findings."""
     idx = 0
     for col in varchar_cols:
         null_like_count = row[idx] or 0
@@ -293,29 +352,35 @@ def _batch_null_like_and_whitespace(
         if null_like_count > 0:
             # Fetch value breakdown for this column (lightweight — only flagged cols)
             breakdown_sql = load_sql(
-                "quality", "null_like_values",
-                table_name=table_name, column_name=col,
+                "quality",
+                "null_like_values",
+                table_name=table_name,
+                column_name=col,
             )
             breakdown_rows = session.execute(breakdown_sql).fetchall()
             values = {str(r[0]): r[1] for r in breakdown_rows}
 
-            findings.append({
-                "category": "null_like_strings",
-                "severity": "warning",
-                "column": col,
-                "total_count": null_like_count,
-                "values": values,
-            })
+            findings.append(
+                {
+                    "category": "null_like_strings",
+                    "severity": "warning",
+                    "column": col,
+                    "total_count": null_like_count,
+                    "values": values,
+                }
+            )
 
         if whitespace_count > 0:
             rate = whitespace_count / total_rows if total_rows > 0 else 0
-            findings.append({
-                "category": "whitespace",
-                "severity": "warning",
-                "column": col,
-                "affected_count": whitespace_count,
-                "affected_rate": round(rate, 4),
-            })
+            findings.append(
+                {
+                    "category": "whitespace",
+                    "severity": "warning",
+                    "column": col,
+                    "affected_count": whitespace_count,
+                    "affected_rate": round(rate, 4),
+                }
+            )
 
 
 def _check_duplicates(session, table_name: str, findings: list):
@@ -326,71 +391,81 @@ def _check_duplicates(session, table_name: str, findings: list):
         if result and result[0] > 0:
             count = result[0]
             severity = "critical" if count > 100 else "warning"
-            findings.append({
-                "category": "duplicates",
-                "severity": severity,
-                "approximate_count": count,
-            })
+            findings.append(
+                {
+                    "category": "duplicates",
+                    "severity": severity,
+                    "approximate_count": count,
+                }
+            )
     except Exception:
         pass
 
 
 def _batch_outliers(
-    session, table_name: str, numeric_cols: list[str], findings: list,
+    session,
+    table_name: str,
+    numeric_cols: list[str],
+    total_rows: int,
+    findings: list,
 ):
-    """Run IQR-based outlier detection for all numeric columns in one query."""
+    """Run IQR-based outlier detection for all numeric columns in two scans.
+
+    The first scan computes every column's quartiles, the second counts
+    values outside the resulting bounds. Quartiles ignore NULLs and values
+    that do not cast to DOUBLE, and findings carry the null rate and the
+    outlier rate per non-null value.
+    """
     if not numeric_cols:
         return
 
-    # Build CTE for quantile bounds
-    bounds_parts = []
-    for col in numeric_cols:
-        q = f'TRY_CAST("{col}" AS DOUBLE)'
-        bounds_parts.append(f"approx_quantile({q}, 0.25) AS \"{col}__q1\"")
-        bounds_parts.append(f"approx_quantile({q}, 0.75) AS \"{col}__q3\"")
-
-    bounds_sql = f"SELECT {', '.join(bounds_parts)} FROM {table_name}"
-
-    # Build main SELECT for outlier counts + bounds
-    select_parts = []
-    for col in numeric_cols:
-        q = f'TRY_CAST("{col}" AS DOUBLE)'
-        q1 = f'"{col}__q1"'
-        q3 = f'"{col}__q3"'
-        iqr = f"({q3} - {q1})"
-        lower = f"({q1} - 1.5 * {iqr})"
-        upper = f"({q3} + 1.5 * {iqr})"
-
-        select_parts.append(
-            f"COUNT(*) FILTER (WHERE {q} < {lower} OR {q} > {upper}) "
-            f'AS "{col}__outlier_count"'
-        )
-        select_parts.append(f'{lower} AS "{col}__lower_bound"')
-        select_parts.append(f'{upper} AS "{col}__upper_bound"')
-
-    sql = (
-        f"WITH bounds AS ({bounds_sql}) "
-        f"SELECT {', '.join(select_parts)} FROM {table_name}, bounds"
+    values = [f'TRY_CAST("{col}" AS DOUBLE)' for col in numeric_cols]
+    quartiles = session.aggregate(
+        table_name,
+        [
+            f"approx_quantile({q}, {fraction})"
+            for q in values
+            for fraction in (0.25, 0.75)
+        ],
     )
 
-    try:
-        row = session.execute(sql).fetchone()
-    except Exception:
-        return
+    bounds = []
+    count_parts = []
+    for i, q in enumerate(values):
+        q1, q3 = quartiles[2 * i], quartiles[2 * i + 1]
+        if q1 is None:
+            # No castable values: nothing to bound
+            bounds.append((None, None))
+            count_parts.append("0")
+        else:
+            iqr = q3 - q1
+            lower, upper = q1 - 1.5 * iqr, q3 + 1.5 * iqr
+            bounds.append((lower, upper))
+            count_parts.append(
+                f"COUNT(*) FILTER (WHERE {q} < '{lower!r}'::DOUBLE "
+                f"OR {q} > '{upper!r}'::DOUBLE)"
+            )
+        count_parts.append(f"COUNT({q})")
+    counts = session.aggregate(table_name, count_parts)
 
-    idx = 0
-    for col in numeric_cols:
-        outlier_count = row[idx] or 0
-        lower_bound = row[idx + 1]
-        upper_bound = row[idx + 2]
-        idx += 3
+    for i, col in enumerate(numeric_cols):
+        outlier_count = counts[2 * i] or 0
+        non_null = counts[2 * i + 1] or 0
+        lower_bound, upper_bound = bounds[i]
 
         if outlier_count > 0:
-            findings.append({
-                "category": "outliers",
-                "severity": "info",
-                "column": col,
-                "outlier_count": outlier_count,
-                "lower_bound": float(lower_bound) if lower_bound is not None else None,
-                "upper_bound": float(upper_bound) if upper_bound is not None else None,
-            })
+            findings.append(
+                {
+                    "category": "outliers",
+                    "severity": "info",
+                    "column": col,
+                    "outlier_count": outlier_count,
+                    "non_null_count": non_null,
+                    "outlier_rate": round(outlier_count / non_null, 4),
+                    "null_rate": round(1 - non_null / total_rows, 4)
+                    if total_rows
+                    else 0,
+                    "lower_bound": float(lower_bound),
+                    "upper_bound": float(upper_bound),
+                }
+            )
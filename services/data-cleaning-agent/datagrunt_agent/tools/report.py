@@ -5,15 +5,15 @@ details, full schema snapshot, structured quality findings, pipeline
 status, and overall pass/warn/fail. Designed for Pub/Sub or GCS persistence.
 """
 
-import json
 import os
 import uuid
-from datetime import datetime, timezone
+from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
 from google.adk.tools import ToolContext
 
+from datagrunt_agent.core.json_io import write_json
 from datagrunt_agent.tools.ingestion import _get_session
 
 REPORT_SCHEMA_VERSION = "1.0.0"
@@ -40,7 +40,8 @@ def _determine_overall_status(severity_counts: dict) -> tuple[str, str | None]:
 
 
 def _schema_from_summarize(
-    summarize_rows: list[dict], total_rows: int,
+    summarize_rows: list[dict],
+    total_rows: int,
 ) -> list[dict]:
     """Build per-column schema snapshot from pre-computed SUMMARIZE rows."""
     schema = []
@@ -50,16 +51,20 @@ def _schema_from_summarize(
             continue
         null_pct = row.get("null_percentage", 0) or 0
 
-        schema.append({
-            "column_name": col,
-            "column_type": row.get("column_type", "UNKNOWN"),
-            "null_count": int(round(null_pct / 100.0 * total_rows)) if total_rows > 0 else 0,
-            "null_rate": round(null_pct / 100.0, 4),
-            "approx_unique": row.get("approx_unique"),
-            "min": row.get("min"),
-            "max": row.get("max"),
-            "avg": row.get("avg"),
-        })
+        schema.append(
+            {
+                "column_name": col,
+                "column_type": row.get("column_type", "UNKNOWN"),
+                "null_count": round(null_pct / 100.0 * total_rows)
+                if total_rows > 0
+                else 0,
+                "null_rate": round(null_pct / 100.0, 4),
+                "approx_unique": row.get("approx_unique"),
+                "min": row.get("min"),
+                "max": row.get("max"),
+                "avg": row.get("avg"),
+            }
+        )
 
     return schema
 
@@ -90,7 +95,7 @@ def build_quality_report(
     report: dict[str, Any] = {
         "report_id": _generate_report_id(),
         "schema_version": REPORT_SCHEMA_VERSION,
-        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "generated_at": datetime.now(UTC).isoformat(timespec="milliseconds"),
     }
 
     # Source metadata
@@ -114,7 +119,9 @@ def build_quality_report(
     report["ingestion"] = {
         "status": ingestion_result.get("status", "unknown"),
         "table_name": table_name,
-        "source_row_count": ingestion_result.get("source_rows", ingestion_result.get("total_rows")),
+        "source_row_count": ingestion_result.get(
+            "source_rows", ingestion_result.get("total_rows")
+        ),
         "loaded_row_count": ingestion_result.get("total_rows"),
         "empty_rows_removed": ingestion_result.get("empty_rows_removed", 0),
         "rows_lost": ingestion_result.get("rows_lost", 0),
@@ -123,7 +130,9 @@ def build_quality_report(
         "is_header_detected": ingestion_result.get("header_detected"),
         "columns_renamed": ingestion_result.get("columns_renamed", {}),
         "types_coerced": ingestion_result.get("types_coerced", {}),
-        "overflow_columns_repaired": ingestion_result.get("overflow_columns_repaired", []),
+        "overflow_columns_repaired": ingestion_result.get(
+            "overflow_columns_repaired", []
+        ),
         "overflow_rows_flagged": ingestion_result.get("overflow_rows_flagged", 0),
         "json_repair": ingestion_result.get("json_repair"),
     }
@@ -134,7 +143,8 @@ def build_quality_report(
     # Quality findings + schema snapshot (shared SUMMARIZE — single pass)
     try:
         findings, severity_counts, summarize_rows = run_quality_checks(
-            session, table_name,
+            session,
+            table_name,
         )
         total_rows = ingestion_result.get("total_rows", 0) or 0
         report["schema"] = _schema_from_summarize(summarize_rows, total_rows)
@@ -170,8 +180,7 @@ def build_quality_report(
     # Persist to disk
     stem = Path(source_file_path).stem
     report_path = os.path.join(output_dir, f"{stem}_quality_report.json")
-    with open(report_path, "w", encoding="utf-8") as fh:
-        json.dump(report, fh, indent=2, default=str)
+    write_json(report_path, report)
 
     report["_persisted_path"] = report_path
     return report
@@ -204,17 +213,18 @@ def export_quality_report(
 
     if not output_path:
         from datagrunt_agent.tools.ingestion import _get_output_dir
+
         output_dir = _get_output_dir()
         output_path = os.path.join(output_dir, f"{table_name}_quality_report.json")
 
     if existing_report:
         # Re-persist existing report to requested path
         report = {k: v for k, v in existing_report.items() if not k.startswith("_")}
-        with open(output_path, "w", encoding="utf-8") as fh:
-            json.dump(report, fh, indent=2, default=str)
+        write_json(output_path, report)
     else:
         # Generate fresh report (no ingestion context available)
         from datagrunt_agent.tools.ingestion import _get_output_dir
+
         report = build_quality_report(
             session=session,
             table_name=table_name,
@@ -230,8 +240,7 @@ def export_quality_report(
         # so re-persist to the exact output_path if they differ.
         if report.get("_persisted_path") != output_path:
             clean = {k: v for k, v in report.items() if not k.startswith("_")}
-            with open(output_path, "w", encoding="utf-8") as fh:
-                json.dump(clean, fh, indent=2, default=str)
+            write_json(output_path, clean)
 
     return {
         "status": "success",
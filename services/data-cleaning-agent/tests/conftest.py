@@ -74,6 +74,7 @@ def quality_data_csv(fixtures_dir):
 def reset_session():
     """Reset the module-level DuckDB session between tests."""
     import datagrunt_agent.tools.ingestion as ingestion_module
+
     ingestion_module._session = None
     yield
     if ingestion_module._session is not None:
@@ -81,6 +82,16 @@ def reset_session():
         ingestion_module._session = None
 
 
+@pytest.fixture(autouse=True)
+def reset_llm_cache():
+    """Clear cached LLM answers so each test sees its own mocked responses."""
+    from datagrunt_agent.core.llm_cache import clear_memory_cache
+
+    clear_memory_cache()
+    yield
+    clear_memory_cache()
+
+
 @pytest.fixture(autouse=True)
 def mock_genai_for_header_detection():
     """Auto-mock the google.genai module to avoid real LLM calls in tests.
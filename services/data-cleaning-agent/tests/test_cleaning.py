@@ -3,26 +3,22 @@
 import json
 import os
 import tempfile
-
 from unittest.mock import MagicMock
 
-from datagrunt_agent.tools.ingestion import _get_session, load_file
-from datagrunt_agent.tools.quality import quality_report
 from datagrunt_agent.tools.cleaning import (
-    clean_table,
-    _clean_unknown_chars,
-    _clean_whitespace,
-    _clean_empty_strings,
-    _clean_null_like_strings,
-    _standardize_dates,
-    _clean_type_coercion,
-    _normalize_case,
-    _flag_duplicates,
     _clean_constant_columns,
+    _clean_strings,
+    _clean_type_coercion,
     _detect_pii,
+    _flag_duplicates,
+    _normalize_case,
+    _standardize_dates,
     _validate_numeric_precision,
+    clean_table,
 )
 from datagrunt_agent.tools.cleaning_report import export_cleaning_report
+from datagrunt_agent.tools.ingestion import _get_session, load_file
+from datagrunt_agent.tools.quality import quality_report
 
 
 def _make_tool_context(**state_overrides):
@@ -77,6 +73,42 @@ class TestCleanTableIntegration:
         assert "cleaning_report_path" in result
         assert result["cleaning_report_path"].endswith("_cleaning_report.json")
 
+    def test_clean_table_step_events(self, quality_data_csv):
+        ctx, table_name, _ = _load_and_scan(quality_data_csv)
+
+        result = clean_table(table_name, ctx)
+
+        events = result["step_events"]
+        assert len(events) == 9
+        assert events[0]["step"] == "string_cleanup"
+        assert events[-1]["step"] == "numeric_precision_validation"
+        assert all(e["event"] == "step_complete" for e in events)
+        assert all(e["elapsed_ms"] >= 0 for e in events)
+
+    def test_pii_detection_overlaps_precision_scan(self, quality_data_csv):
+        import threading
+        from unittest.mock import patch
+
+        ctx, table_name, _ = _load_and_scan(quality_data_csv)
+        pii_threads = []
+
+        def fake_detect_pii(session, table):
+            pii_threads.append(threading.get_ident())
+            return [{"column": "email", "is_pii": True}]
+
+        with patch(
+            "datagrunt_agent.tools.cleaning._detect_pii",
+            fake_detect_pii,
+        ):
+            result = clean_table(table_name, ctx)
+
+        assert pii_threads and pii_threads[0] != threading.get_ident()
+        assert result["pii_detection"] == [{"column": "email", "is_pii": True}]
+        assert [e["step"] for e in result["step_events"][-2:]] == [
+            "pii_detection",
+            "numeric_precision_validation",
+        ]
+
 
 class TestCleanTableNoFindings:
     """Clean table with no quality findings."""
@@ -127,18 +159,22 @@ class TestUnknownCharReplacement:
         table_name = ctx.state["current_table"]
 
         # Inject a replacement character into data
-        session.execute(
-            f"UPDATE {table_name} SET name = 'Caf\ufffd' WHERE id = 1"
-        )
+        session.execute(f"UPDATE {table_name} SET name = 'Caf\ufffd' WHERE id = 1")
 
         varchar_cols = [
-            c for c, t in session.get_column_types(table_name).items()
+            c
+            for c, t in session.get_column_types(table_name).items()
             if t == "VARCHAR" and c != "processed_at"
         ]
 
-        result = _clean_unknown_chars(session, table_name, varchar_cols)
+        [result] = _clean_strings(
+            session,
+            table_name,
+            varchar_cols,
+            [],
+            ("unknown_chars",),
+        )
 
-        assert result is not None
         assert result["operation"] == "unknown_char_replacement"
         assert result["replacements"] > 0
 
@@ -149,6 +185,60 @@ class TestUnknownCharReplacement:
         assert "\ufffd" not in check
 
 
+class TestFusedStringCleanup:
+    """Test steps 1-4 running as one multi-column UPDATE."""
+
+    def test_steps_compose_in_protocol_order(self):
+        session = _get_session()
+        session.execute(
+            "CREATE TABLE t_strings AS SELECT * FROM (VALUES "
+            "(1, ' Caf\ufffd ', ' N/A '), (2, '   ', 'ok'), (3, 'x', '')"
+            ") AS v(id, name, code)"
+        )
+        findings = [{"category": "null_like_strings", "column": "code"}]
+
+        ops = _clean_strings(session, "t_strings", ["name", "code"], findings)
+
+        assert [op["operation"] for op in ops] == [
+            "unknown_char_replacement",
+            "whitespace_trimming",
+            "empty_string_normalization",
+            "null_like_normalization",
+        ]
+        rows = session.execute(
+            "SELECT name, code FROM t_strings ORDER BY id"
+        ).fetchall()
+        assert rows == [("Caf", None), (None, "ok"), ("x", None)]
+
+    def test_non_ascii_columns(self):
+        from datagrunt_agent.tools.cleaning import _non_ascii_columns
+
+        session = _get_session()
+        session.execute(
+            "CREATE TABLE t_ascii AS SELECT * FROM (VALUES "
+            "('plain', 'CafÃ©', NULL::VARCHAR), ('text', 'ok', NULL)"
+            ") AS v(a, b, c)"
+        )
+        assert _non_ascii_columns(session, "t_ascii", ["a", "b", "c"]) == {"b"}
+        assert _non_ascii_columns(session, "t_ascii", []) == set()
+
+    def test_replace_chain_only_includes_found_patterns(self):
+        from datagrunt_agent.tools.cleaning import _string_cleanup_expr
+
+        expr = _string_cleanup_expr("c", ["unknown_chars"], ["\u00c3\u00a9"])
+        assert expr == "REPLACE(\"c\", '\u00c3\u00a9', '\u00e9')"
+
+    def test_found_patterns_gate_rows_with_one_regex(self):
+        from datagrunt_agent.tools.cleaning import _string_change_predicate
+
+        predicate = _string_change_predicate(
+            "c",
+            ["unknown_chars"],
+            ["\ufffd", "\u00c3\u00a9"],
+        )
+        assert predicate == "regexp_matches(\"c\", '\ufffd|\u00c3\u00a9')"
+
+
 class TestWhitespaceCleaning:
     """Test whitespace trimming."""
 
@@ -157,21 +247,27 @@ class TestWhitespaceCleaning:
         session = _get_session()
 
         varchar_cols = [
-            c for c, t in session.get_column_types(table_name).items()
+            c
+            for c, t in session.get_column_types(table_name).items()
             if t == "VARCHAR" and c != "processed_at"
         ]
 
-        result = _clean_whitespace(session, table_name, varchar_cols, findings)
+        [result] = _clean_strings(
+            session,
+            table_name,
+            varchar_cols,
+            findings,
+            ("whitespace",),
+        )
 
         # quality_data.csv has whitespace in name and notes columns
-        assert result is not None
         assert result["operation"] == "whitespace_trimming"
         assert len(result["columns_cleaned"]) > 0
 
         # Verify no leading/trailing whitespace remains in cleaned columns
         for col in result["columns_cleaned"]:
             remaining = session.execute(
-                f'SELECT COUNT(*) FROM {table_name} '
+                f"SELECT COUNT(*) FROM {table_name} "
                 f'WHERE "{col}" IS NOT NULL AND "{col}" != TRIM("{col}")'
             ).fetchone()[0]
             assert remaining == 0, f"Column {col} still has whitespace"
@@ -187,22 +283,28 @@ class TestEmptyStringNormalization:
         table_name = ctx.state["current_table"]
 
         varchar_cols = [
-            c for c, t in session.get_column_types(table_name).items()
+            c
+            for c, t in session.get_column_types(table_name).items()
             if t == "VARCHAR" and c != "processed_at"
         ]
 
-        result = _clean_empty_strings(session, table_name, varchar_cols)
+        ops = _clean_strings(
+            session,
+            table_name,
+            varchar_cols,
+            [],
+            ("empty_strings",),
+        )
 
         # quality_data.csv has empty strings in notes and email columns
-        if result is not None:
+        for result in ops:
             assert result["operation"] == "empty_string_normalization"
             assert result["rows_affected"] > 0
 
             # Verify no empty strings remain
             for col in result["columns_cleaned"]:
                 remaining = session.execute(
-                    f'SELECT COUNT(*) FROM {table_name} '
-                    f"WHERE TRIM(\"{col}\") = ''"
+                    f"SELECT COUNT(*) FROM {table_name} WHERE TRIM(\"{col}\") = ''"
                 ).fetchone()[0]
                 assert remaining == 0, f"Column {col} still has empty strings"
 
@@ -214,10 +316,15 @@ class TestNullLikeCleaning:
         ctx, table_name, findings = _load_and_scan(quality_data_csv)
         session = _get_session()
 
-        result = _clean_null_like_strings(session, table_name, findings)
+        [result] = _clean_strings(
+            session,
+            table_name,
+            [],
+            findings,
+            ("null_like",),
+        )
 
         # quality_data.csv has NULL, N/A, None, n/a in zip_code, email, score
-        assert result is not None
         assert result["operation"] == "null_like_normalization"
         assert len(result["columns_cleaned"]) > 0
         assert result["rows_affected"] > 0
@@ -235,6 +342,29 @@ class TestDateStandardization:
         # quality_data.csv may not have date columns, so this could be None
         # which is expected behavior
 
+    def test_columns_standardized_in_one_update(self):
+        session = _get_session()
+        session.execute(
+            "CREATE TABLE t_dates AS SELECT * FROM (VALUES "
+            "(1, '2024-1-5', '2024-2-3'), (2, 'n/a', '2024-12-31')"
+            ") AS v(id, a, b)"
+        )
+        findings = [
+            {"category": "type_analysis", "column": c, "date_castable_rate": 0.95}
+            for c in ("a", "b", "gone")
+        ]
+
+        op = _standardize_dates(session, "t_dates", findings[:2])
+        assert op["columns_standardized"] == ["a", "b"]
+        assert session.execute("SELECT a, b FROM t_dates ORDER BY id").fetchall() == [
+            ("2024-01-05", "2024-02-03"),
+            ("n/a", "2024-12-31"),
+        ]
+
+        # A missing column fails the batch; the others still go through
+        op = _standardize_dates(session, "t_dates", findings)
+        assert op["columns_standardized"] == ["a", "b"]
+
 
 class TestTypeCoercion:
     """Test type coercion with identifier preservation."""
@@ -248,7 +378,8 @@ class TestTypeCoercion:
         # score column should be coerced to DOUBLE (after null-like cleaning)
         # But we need to check if type_analysis flagged it
         type_findings = [
-            f for f in findings
+            f
+            for f in findings
             if f.get("category") == "type_analysis" and f.get("suggested_cast")
         ]
 
@@ -266,7 +397,8 @@ class TestTypeCoercion:
         # zip_code has leading zeros — should be in identifiers list
         identifier_cols = [i["column"] for i in identifiers]
         zip_findings = [
-            f for f in findings
+            f
+            for f in findings
             if f.get("category") == "type_analysis"
             and f.get("column") == "zip_code"
             and f.get("leading_zero_count", 0) > 0
@@ -279,6 +411,33 @@ class TestTypeCoercion:
             col_types = session.get_column_types(table_name)
             assert col_types.get("zip_code") == "VARCHAR"
 
+    def test_casts_in_one_rewrite_with_per_column_fallback(self):
+        session = _get_session()
+        session.execute(
+            "CREATE TABLE t_cast AS SELECT range::VARCHAR AS n, "
+            "(range / 2)::VARCHAR AS x, 'y' AS s FROM range(5)"
+        )
+        findings = [
+            {"category": "type_analysis", "column": "n", "suggested_cast": "BIGINT"},
+            {"category": "type_analysis", "column": "x", "suggested_cast": "DOUBLE"},
+        ]
+
+        op, _ = _clean_type_coercion(session, "t_cast", findings)
+        assert op["columns_coerced"] == {"n": "BIGINT", "x": "DOUBLE"}
+        assert session.get_column_types("t_cast") == {
+            "n": "BIGINT",
+            "x": "DOUBLE",
+            "s": "VARCHAR",
+        }
+
+        findings = [
+            {"category": "type_analysis", "column": "s", "suggested_cast": "BIGINT"},
+            {"category": "type_analysis", "column": "gone", "suggested_cast": "BIGINT"},
+        ]
+        op, _ = _clean_type_coercion(session, "t_cast", findings)
+        assert op["columns_coerced"] == {"s": "BIGINT"}
+        assert [f["column"] for f in op["coercion_failures"]] == ["gone"]
+
 
 class TestIdentifierPreservation:
     """Test that columns with leading zeros stay VARCHAR."""
@@ -299,7 +458,8 @@ class TestIdentifierPreservation:
         id_cols = [i["column"] for i in result.get("identifier_columns", [])]
         # zip_code should be listed if it had leading zeros flagged
         zip_findings = [
-            f for f in ctx.state.get("quality_findings", [])
+            f
+            for f in ctx.state.get("quality_findings", [])
             if f.get("column") == "zip_code" and f.get("leading_zero_count", 0) > 0
         ]
         if zip_findings:
@@ -316,15 +476,12 @@ class TestMixedCaseNormalization:
         table_name = ctx.state["current_table"]
 
         # Insert mixed-case categorical values
-        session.execute(
-            f"UPDATE {table_name} SET status = 'Active' WHERE id = 1"
-        )
-        session.execute(
-            f"UPDATE {table_name} SET status = 'ACTIVE' WHERE id = 2"
-        )
+        session.execute(f"UPDATE {table_name} SET status = 'Active' WHERE id = 1")
+        session.execute(f"UPDATE {table_name} SET status = 'ACTIVE' WHERE id = 2")
 
         varchar_cols = [
-            c for c, t in session.get_column_types(table_name).items()
+            c
+            for c, t in session.get_column_types(table_name).items()
             if t == "VARCHAR" and c != "processed_at"
         ]
 
@@ -338,11 +495,50 @@ class TestMixedCaseNormalization:
             # Verify all values are lowercase
             for col in result["columns_normalized"]:
                 remaining = session.execute(
-                    f'SELECT COUNT(*) FROM {table_name} '
+                    f"SELECT COUNT(*) FROM {table_name} "
                     f'WHERE "{col}" IS NOT NULL AND "{col}" != LOWER("{col}")'
                 ).fetchone()[0]
                 assert remaining == 0
 
+    def test_skips_high_cardinality_columns(self):
+        session = _get_session()
+        session.execute(
+            "CREATE TABLE t_case AS SELECT CASE WHEN range % 2 = 0 THEN 'A' "
+            "ELSE 'a' END AS grade, 'Item ' || range AS label FROM range(100)"
+        )
+
+        result = _normalize_case(session, "t_case", ["grade", "label"])
+
+        assert result["columns_normalized"] == ["grade"]
+        assert (
+            session.execute(
+                "SELECT COUNT(*) FROM t_case WHERE label != LOWER(label)"
+            ).fetchone()[0]
+            == 100
+        )
+
+    def test_string_probe_matches_case_probe_of_cleaned_table(self):
+        from datagrunt_agent.tools.cleaning import _probe_case
+
+        session = _get_session()
+        session.execute(
+            "CREATE TABLE t_case_probe AS SELECT * FROM (VALUES "
+            "(' A ', 'x'), ('N/A', 'Y'), ('a', ''), ('B', 'z')) AS v(grade, code)"
+        )
+        findings = [{"category": "null_like_strings", "column": "grade"}]
+        case_probe = {}
+
+        _clean_strings(
+            session,
+            "t_case_probe",
+            ["grade", "code"],
+            findings,
+            case_probe=case_probe,
+        )
+
+        assert case_probe == _probe_case(session, "t_case_probe", ["grade", "code"])
+        assert case_probe["grade"][1] == 2
+
 
 class TestSoftDedup:
     """Test duplicate flagging (soft dedup)."""
@@ -354,9 +550,7 @@ class TestSoftDedup:
         result = _flag_duplicates(session, table_name, findings)
 
         # quality_data.csv has John Smith duplicate (rows 1 and 6)
-        dup_findings = [
-            f for f in findings if f.get("category") == "duplicates"
-        ]
+        dup_findings = [f for f in findings if f.get("category") == "duplicates"]
 
         if dup_findings:
             assert result is not None
@@ -372,6 +566,27 @@ class TestSoftDedup:
             columns = session.get_column_names(table_name)
             assert "is_duplicate" in columns
 
+    def test_first_occurrence_kept_and_order_preserved(self):
+        session = _get_session()
+        session.execute(
+            "CREATE TABLE t_dups AS SELECT * FROM (VALUES "
+            "(3, 'a'), (1, 'b'), (3, 'a'), (2, NULL), (2, NULL)) AS v(k, v)"
+        )
+        findings = [{"category": "duplicates", "approximate_count": 2}]
+
+        result = _flag_duplicates(session, "t_dups", findings)
+        assert result["duplicates_flagged"] == 2
+        # A second run replaces the flag instead of adding another column
+        _flag_duplicates(session, "t_dups", findings)
+
+        assert session.execute("SELECT * FROM t_dups").fetchall() == [
+            (3, "a", False),
+            (1, "b", False),
+            (3, "a", True),
+            (2, None, False),
+            (2, None, True),
+        ]
+
 
 class TestConstantColumnRemoval:
     """Test constant column removal."""
@@ -397,6 +612,25 @@ class TestConstantColumnRemoval:
             for col in result["columns_dropped"]:
                 assert col not in remaining_cols
 
+    def test_drops_columns_in_one_rewrite(self):
+        from datagrunt_agent.tools.cleaning import _clean_high_null_columns
+
+        session = _get_session()
+        session.execute(
+            "CREATE TABLE t_drop AS SELECT range AS id, NULL AS a, NULL AS b, "
+            "'x' AS c, now() AS processed_at FROM range(10)"
+        )
+        findings = [
+            {"category": "null_analysis", "column": col, "null_rate": 1.0}
+            for col in ("a", "b", "missing", "processed_at")
+        ]
+
+        result = _clean_high_null_columns(session, "t_drop", findings)
+
+        assert result["columns_dropped"] == ["a", "b"]
+        assert session.get_column_names("t_drop") == ["id", "c", "processed_at"]
+        assert session.get_row_count("t_drop") == 10
+
 
 class TestProcessedAtProtection:
     """Ensure processed_at survives all cleaning operations."""
@@ -478,10 +712,17 @@ class TestCleaningReport:
         report = ctx.state["cleaning_report"]
 
         expected_keys = {
-            "report_id", "schema_version", "generated_at",
-            "source", "summary", "operations", "pii_detection",
-            "identifier_columns", "numeric_precision_flags",
-            "quality_findings_input", "overall_status",
+            "report_id",
+            "schema_version",
+            "generated_at",
+            "source",
+            "summary",
+            "operations",
+            "pii_detection",
+            "identifier_columns",
+            "numeric_precision_flags",
+            "quality_findings_input",
+            "overall_status",
         }
         assert expected_keys.issubset(report.keys())
 
@@ -525,6 +766,43 @@ class TestExportCleaningReport:
         )
         assert "error" in result
 
+    def test_report_dir_recreated_after_removal(self, tmp_path):
+        import shutil
+
+        from datagrunt_agent.tools.cleaning_report import build_cleaning_report
+
+        output_dir = str(tmp_path / "reports")
+        first = build_cleaning_report({}, [], "a.csv", output_dir)
+        shutil.rmtree(output_dir)
+        second = build_cleaning_report({}, [], "a.csv", output_dir)
+
+        assert first["_persisted_path"] == second["_persisted_path"]
+        assert os.path.exists(second["_persisted_path"])
+
+    def test_export_copies_persisted_report(self, tmp_path):
+        from datagrunt_agent.tools.cleaning_report import build_cleaning_report
+
+        _get_session().execute("CREATE TABLE t_report AS SELECT 1 AS id")
+        report = build_cleaning_report(
+            {"table_name": "t_report"},
+            [],
+            "t_report.csv",
+            str(tmp_path),
+        )
+        ctx = _make_tool_context()
+        ctx.state["cleaning_report"] = report
+
+        copied = tmp_path / "copied.json"
+        export_cleaning_report("t_report", str(copied), ctx)
+        with open(report["_persisted_path"], "rb") as f:
+            assert copied.read_bytes() == f.read()
+
+        os.unlink(report["_persisted_path"])
+        rewritten = tmp_path / "rewritten.json"
+        export_cleaning_report("t_report", str(rewritten), ctx)
+        assert json.loads(rewritten.read_text())["report_id"] == report["report_id"]
+        assert "_persisted_path" not in json.loads(rewritten.read_text())
+
 
 class TestPiiDetection:
     """Test PII detection with mocked LLM."""
@@ -537,20 +815,37 @@ class TestPiiDetection:
         session = _get_session()
 
         pii_response = MagicMock()
-        pii_response.text = json.dumps([
-            {"column": "email", "is_pii": True, "pii_type": "email", "confidence": 0.95},
-            {"column": "name", "is_pii": True, "pii_type": "name", "confidence": 0.85},
-        ])
+        pii_response.text = json.dumps(
+            [
+                {
+                    "column": "email",
+                    "is_pii": True,
+                    "pii_type": "email",
+                    "confidence": 0.95,
+                },
+                {
+                    "column": "name",
+                    "is_pii": True,
+                    "pii_type": "name",
+                    "confidence": 0.85,
+                },
+            ]
+        )
 
         # Create a fresh mock genai module with properly chained return values
         mock_genai_module = MagicMock()
-        mock_genai_module.Client.return_value.models.generate_content.return_value = pii_response
+        mock_genai_module.Client.return_value.models.generate_content.return_value = (
+            pii_response
+        )
         mock_types_module = MagicMock()
 
-        with patch.dict(sys.modules, {
-            "google.genai": mock_genai_module,
-            "google.genai.types": mock_types_module,
-        }):
+        with patch.dict(
+            sys.modules,
+            {
+                "google.genai": mock_genai_module,
+                "google.genai.types": mock_types_module,
+            },
+        ):
             pii_results = _detect_pii(session, table_name)
 
         assert len(pii_results) >= 1
@@ -567,18 +862,39 @@ class TestPiiDetection:
         table_name = ctx.state["current_table"]
 
         mock_genai_module = MagicMock()
-        mock_genai_module.Client.return_value.models.generate_content.side_effect = Exception("LLM down")
+        mock_genai_module.Client.return_value.models.generate_content.side_effect = (
+            Exception("LLM down")
+        )
         mock_types_module = MagicMock()
 
-        with patch.dict(sys.modules, {
-            "google.genai": mock_genai_module,
-            "google.genai.types": mock_types_module,
-        }):
+        with patch.dict(
+            sys.modules,
+            {
+                "google.genai": mock_genai_module,
+                "google.genai.types": mock_types_module,
+            },
+        ):
             pii_results = _detect_pii(session, table_name)
 
         # Should return empty list on failure, not raise
         assert pii_results == []
 
+    def test_samples_all_columns_in_one_query(self):
+        from datagrunt_agent.tools.cleaning import _sample_distinct_values
+
+        session = _get_session()
+        session.execute(
+            "CREATE TABLE t_pii AS SELECT range AS id, "
+            "CASE WHEN range < 2 THEN 'a@x.io' END AS email, NULL AS empty "
+            "FROM range(10)"
+        )
+
+        samples = _sample_distinct_values(session, "t_pii", ["id", "email", "empty"])
+
+        assert len(samples["id"]) == 5
+        assert samples["email"] == ["a@x.io"]
+        assert samples["empty"] == []
+
 
 class TestNumericPrecisionValidation:
     """Test numeric precision validation."""
@@ -595,9 +911,7 @@ class TestNumericPrecisionValidation:
             f"ALTER TABLE {table_name} ALTER COLUMN score SET DATA TYPE DOUBLE "
             f"USING TRY_CAST(score AS DOUBLE)"
         )
-        session.execute(
-            f"UPDATE {table_name} SET score = 85.123 WHERE id = 1"
-        )
+        session.execute(f"UPDATE {table_name} SET score = 85.123 WHERE id = 1")
 
         flags = _validate_numeric_precision(session, table_name)
 
@@ -606,6 +920,29 @@ class TestNumericPrecisionValidation:
             flagged_cols = [f["column"] for f in flags]
             assert "score" in flagged_cols
 
+    def test_decimal_places_without_string_casts(self):
+        session = _get_session()
+        session.execute(
+            "CREATE TABLE t_precision AS SELECT * FROM (VALUES "
+            "(95.0::DOUBLE, 92.3::FLOAT, 1.5::DOUBLE), "
+            "(85.5, 85.5, 'inf'::DOUBLE), "
+            "(85.123, 1.0, NULL)) AS v(score, reading, ratio)"
+        )
+
+        flags = _validate_numeric_precision(session, "t_precision")
+
+        assert flags == [
+            {
+                "column": "score",
+                "min_decimals": 1,
+                "max_decimals": 3,
+                "recommendation": (
+                    "Inconsistent decimal precision (1-3 places). "
+                    "Consider standardizing for currency or measurement data."
+                ),
+            }
+        ]
+
 
 class TestAfterToolCallbackChaining:
     """Test the callback chains QualityAnalyst → DataCleaner."""
@@ -649,7 +986,7 @@ class TestAfterToolCallbackChaining:
 
         result = _after_tool_callback(tool, {}, ctx, "Quality report text")
 
-        # outliers is not in _ACTIONABLE_CATEGORIES, so no chain
+        # outliers is not in ACTIONABLE_CATEGORIES, so no chain
         assert result is None
 
     def test_quality_analyst_skips_when_no_findings(self):
@@ -679,4 +1016,28 @@ class TestAfterToolCallbackChaining:
 
         assert result is None  # Returns None, modifies response in-place
         assert "next_action" in tool_response
-        assert tool_response["next_action"]["action"] == "delegate_to_quality_analyst"
+        assert tool_response["next_action"]["action"] == "parallel_delegate"
+
+
+class TestLoadAndClean:
+    """Composite pipeline tool: load → audit → clean in one call."""
+
+    def test_runs_all_stages(self, quality_data_csv):
+        from datagrunt_agent.tools.pipeline import load_and_clean
+
+        ctx = _make_tool_context()
+        result = load_and_clean(quality_data_csv, ctx)
+
+        assert result["status"] == "success"
+        assert result["load"]["table_name"] == result["table_name"]
+        assert result["quality"]["findings"]
+        assert result["cleaning"]["status"] == "success"
+        assert "cleaning_report" in ctx.state
+
+    def test_load_error_is_returned(self):
+        from datagrunt_agent.tools.pipeline import load_and_clean
+
+        result = load_and_clean("/nonexistent/file.csv", _make_tool_context())
+
+        assert "error" in result
+        assert "quality" not in result
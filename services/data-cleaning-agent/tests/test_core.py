@@ -1,5 +1,7 @@
 """Tests for core infrastructure modules."""
 
+from datetime import UTC
+
 import pytest
 
 from datagrunt_agent.core.column_normalizer import (
@@ -14,19 +16,27 @@ from datagrunt_agent.core.delimiter_detector import (
 )
 from datagrunt_agent.core.duckdb_session import (
     DuckDBSession,
+    TableMetadata,
+    quote_identifier,
     reject_destructive,
     validate_path,
 )
-from datagrunt_agent.core.file_detector import FileFormat, detect_format
-from datagrunt_agent.core.sql_loader import load_sql, render_template
-
+from datagrunt_agent.core.file_detector import (
+    FileFormat,
+    detect_encoding,
+    detect_format,
+    duckdb_csv_encoding,
+    ensure_utf8,
+    is_blank_file,
+)
+from datagrunt_agent.core.sql_loader import compile_sql, load_sql, render_template
 
 # ---------------------------------------------------------------------------
 # Column Normalizer
 # ---------------------------------------------------------------------------
 
-class TestColumnNormalizer:
 
+class TestColumnNormalizer:
     def test_simple_name(self):
         assert normalize_column_name("name") == "name"
 
@@ -39,9 +49,18 @@ class TestColumnNormalizer:
     def test_spaces_and_special_chars(self):
         assert normalize_column_name("Annual Salary ($)") == "annual_salary"
 
+    def test_lowercase_with_separators(self):
+        assert normalize_column_name("__order  date (utc)__") == "order_date_utc"
+
     def test_leading_digit(self):
         assert normalize_column_name("2024_Revenue") == "_2024_revenue"
 
+    def test_acronym_boundary(self):
+        assert normalize_column_name("HTTPServerURL") == "http_server_url"
+
+    def test_non_ascii_name(self):
+        assert normalize_column_name("Prénom Client") == "pr_nom_client"
+
     def test_empty_string(self):
         assert normalize_column_name("") == "unnamed"
 
@@ -49,6 +68,17 @@ class TestColumnNormalizer:
         result = normalize_column_names(["Name", "name", "NAME"])
         assert result == ["name", "name_1", "name_2"]
 
+    def test_wide_schema_with_repeated_names(self):
+        columns = ["Sales Amount", "Region"] * 500
+        result = normalize_column_names(columns)
+        assert len(set(result)) == 1000
+        assert result[:4] == [
+            "sales_amount",
+            "region",
+            "sales_amount_1",
+            "region_1",
+        ]
+
     def test_build_rename_mapping(self):
         mapping = build_rename_mapping(["First Name", "age", "Date Of Birth"])
         assert "First Name" in mapping
@@ -61,14 +91,21 @@ class TestColumnNormalizer:
 # Delimiter Detector
 # ---------------------------------------------------------------------------
 
-class TestDelimiterDetector:
 
+class TestDelimiterDetector:
     def test_comma_csv(self, sample_csv):
         assert detect_delimiter(sample_csv) == ","
 
     def test_semicolon_csv(self, semicolon_csv):
         assert detect_delimiter(semicolon_csv) == ";"
 
+    def test_detection_follows_file_changes(self, tmp_path):
+        path = tmp_path / "data.csv"
+        path.write_text("a,b,c\n1,2,3\n")
+        assert detect_delimiter(str(path)) == ","
+        path.write_text("a;b;c;d\n1;2;3;4\n")
+        assert detect_delimiter(str(path)) == ";"
+
     def test_count_source_lines(self, sample_csv):
         count = count_source_lines(sample_csv)
         assert count == 5  # 5 data rows (header excluded)
@@ -83,8 +120,8 @@ class TestDelimiterDetector:
 # File Detector
 # ---------------------------------------------------------------------------
 
-class TestFileDetector:
 
+class TestFileDetector:
     def test_csv_detection(self, sample_csv):
         assert detect_format(sample_csv) == FileFormat.CSV
 
@@ -94,13 +131,51 @@ class TestFileDetector:
     def test_jsonl_detection(self, sample_jsonl):
         assert detect_format(sample_jsonl) == FileFormat.JSONL
 
+    def test_blank_file(self, tmp_path):
+        blank = tmp_path / "blank.csv"
+        blank.write_bytes(b"  \r\n\t\n")
+        assert is_blank_file(str(blank)) is True
+
+    def test_non_blank_file(self, sample_jsonl):
+        assert is_blank_file(sample_jsonl) is False
+
+    def test_duckdb_csv_encoding(self):
+        assert duckdb_csv_encoding("ISO-8859-1") == "latin-1"
+        assert duckdb_csv_encoding("utf_16") is None
+        assert duckdb_csv_encoding("not-an-encoding") is None
+
+    def test_detect_encoding_shortcuts(self, tmp_path):
+        ascii_file = tmp_path / "ascii.csv"
+        ascii_file.write_bytes(b"a,b\n1,2\n")
+        utf8_file = tmp_path / "utf8.csv"
+        utf8_file.write_bytes("nom\nRené\n".encode())
+        assert detect_encoding(str(ascii_file)) == "ascii"
+        assert detect_encoding(str(utf8_file)) == "utf-8"
+
+        load_path, _, _ = ensure_utf8(str(utf8_file))
+        assert load_path == str(utf8_file)
+
+    def test_ensure_utf8_transcodes(self, tmp_path):
+        import os
+
+        path = tmp_path / "latin.csv"
+        path.write_bytes("nom,ville\nRené,Zürich\n".encode("utf-16"))
+        load_path, encoding, is_lossy = ensure_utf8(str(path))
+        try:
+            assert "16" in encoding
+            assert is_lossy is False
+            with open(load_path, encoding="utf-8") as fh:
+                assert fh.read() == "nom,ville\nRené,Zürich\n"
+        finally:
+            os.unlink(load_path)
+
 
 # ---------------------------------------------------------------------------
 # DuckDB Session
 # ---------------------------------------------------------------------------
 
-class TestDuckDBSession:
 
+class TestDuckDBSession:
     def test_create_session(self):
         session = DuckDBSession()
         assert session.connection is not None
@@ -132,6 +207,117 @@ class TestDuckDBSession:
         assert session.get_column_names("test_tbl") == ["id", "name"]
         session.close()
 
+    def test_row_count_refreshes_after_write(self):
+        session = DuckDBSession()
+        session.execute("CREATE TABLE test_tbl AS SELECT range AS id FROM range(10)")
+        assert session.get_row_count("test_tbl") == 10
+        session.execute("SELECT * FROM test_tbl WHERE id > 5")
+        assert session.get_row_count("test_tbl") == 10
+        session.execute("DELETE FROM test_tbl WHERE id > 5")
+        assert session.get_row_count("test_tbl") == 6
+        session.close()
+
+    def test_column_types_refresh_after_alter(self):
+        session = DuckDBSession()
+        session.execute("CREATE TABLE test_tbl (id VARCHAR)")
+        assert session.get_column_types("test_tbl") == {"id": "VARCHAR"}
+        session.execute('ALTER TABLE test_tbl ALTER "id" TYPE BIGINT')
+        session.execute('ALTER TABLE test_tbl ADD COLUMN "name" VARCHAR')
+        assert session.get_column_types("test_tbl") == {
+            "id": "BIGINT",
+            "name": "VARCHAR",
+        }
+        session.close()
+
+    def test_scalar(self):
+        session = DuckDBSession()
+        session.execute("CREATE TABLE test_tbl AS SELECT range AS id FROM range(10)")
+        assert session.scalar("SELECT COUNT(*) FROM test_tbl") == 10
+        assert session.scalar("SELECT id FROM test_tbl WHERE id > 100") is None
+        session.close()
+
+    def test_aggregate(self):
+        session = DuckDBSession()
+        session.execute("CREATE TABLE test_tbl AS SELECT range AS id FROM range(10)")
+        row = session.aggregate(
+            "test_tbl",
+            ["COUNT(*) FILTER (WHERE doubled > 10)", "MAX(doubled)"],
+            [["id * 2 AS doubled"]],
+        )
+        assert row == (4, 18)
+
+        row = session.aggregate(
+            "test_tbl",
+            ["SUM(quadrupled)"],
+            [["id * 2 AS doubled"], ["*", "doubled * 2 AS quadrupled"]],
+        )
+        assert row == (180,)
+        session.close()
+
+    def test_get_distinct_counts(self):
+        session = DuckDBSession()
+        session.execute(
+            "CREATE TABLE test_tbl AS SELECT range AS id, 'x' AS c, NULL AS n "
+            "FROM range(10)"
+        )
+        counts = session.get_distinct_counts("test_tbl", ["id", "c", "n"])
+        assert counts == {"id": 10, "c": 1, "n": 0}
+        session.close()
+
+    def test_get_columns_without_nulls(self):
+        session = DuckDBSession()
+        session.execute(
+            "CREATE TABLE test_tbl AS SELECT range AS id, "
+            "CASE WHEN range = 3 THEN NULL ELSE range END AS maybe "
+            "FROM range(10)"
+        )
+        assert session.get_columns_without_nulls("test_tbl") <= {"id"}
+        session.execute("UPDATE test_tbl SET id = NULL WHERE id = 1")
+        assert "id" not in session.get_columns_without_nulls("test_tbl")
+        session.close()
+
+    def test_is_null_like_macro(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        session = DuckDBSession()
+        sql = (
+            "SELECT list(v) FILTER (WHERE is_null_like(v)) FROM (VALUES "
+            "(' N/A '), ('NaN'), (''), ('none'), ('Nancy'), (NULL)) AS t(v)"
+        )
+        expected = [([" N/A ", "NaN", "", "none"],)]
+        assert session.execute(sql).fetchall() == expected
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            rows = pool.submit(lambda: session.execute(sql).fetchall()).result()
+        assert rows == expected
+        # The sentinel list is inline; no table enters the user's database
+        assert session.execute("SHOW TABLES").fetchall() == []
+        session.close()
+
+    def test_query_from_worker_thread(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        session = DuckDBSession()
+        session.execute("CREATE TABLE test_tbl AS SELECT range AS id FROM range(10)")
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            counts = list(pool.map(session.get_row_count, ["test_tbl"] * 4))
+        assert counts == [10, 10, 10, 10]
+        session.close()
+
+    def test_table_registry_is_read_only_view(self):
+        session = DuckDBSession()
+        registry = session.table_registry
+        session.register_table(TableMetadata("t", "/data/t.csv", "csv", 3, 2))
+        assert registry["t"].row_count == 3
+        with pytest.raises(TypeError):
+            registry["u"] = registry["t"]
+        session.unregister_table("t")
+        assert "t" not in registry
+        session.close()
+
+    def test_quote_identifier(self):
+        assert quote_identifier("users") == '"users"'
+        assert quote_identifier('a"b') == '"a""b"'
+
     def test_reject_destructive(self):
         result = reject_destructive("DELETE FROM test")
         assert result is not None
@@ -141,6 +327,12 @@ class TestDuckDBSession:
         result = reject_destructive("SELECT * FROM test")
         assert result is None
 
+    def test_reject_destructive_keyword_variants(self):
+        assert reject_destructive("  drop\n  table t") is not None
+        assert reject_destructive("TRUNCATE t") is not None
+        assert reject_destructive("DROP VIEW v") is None
+        assert reject_destructive("SELECT 1; DELETE FROM t") is None
+
     def test_validate_path_nonexistent(self):
         with pytest.raises(ValueError, match="File not found"):
             validate_path("/nonexistent/file.csv")
@@ -151,6 +343,7 @@ class TestDuckDBSession:
 
     def test_to_markdown(self):
         import polars as pl
+
         session = DuckDBSession()
         df = pl.DataFrame({"a": [1, 2], "b": ["x", "y"]})
         md = session.to_markdown(df)
@@ -163,8 +356,8 @@ class TestDuckDBSession:
 # SQL Loader
 # ---------------------------------------------------------------------------
 
-class TestSQLLoader:
 
+class TestSQLLoader:
     def test_render_template(self):
         result = render_template(
             "SELECT * FROM {{ table_name }} WHERE id = {{ id }}",
@@ -173,16 +366,32 @@ class TestSQLLoader:
         )
         assert result == "SELECT * FROM users WHERE id = 42"
 
+    def test_load_sql_cached_render_matches_params(self):
+        first = load_sql("common", "sample_rows", table_name="a", limit="5")
+        second = load_sql("common", "sample_rows", table_name="b", limit="5")
+        assert first == "SELECT * FROM a LIMIT 5"
+        assert second == "SELECT * FROM b LIMIT 5"
+        assert load_sql("common", "sample_rows", table_name="a", limit="5") == first
+
+    def test_compile_sql_matches_load_sql(self):
+        render = compile_sql("export", "to_csv")
+        params = {"table_name": "t", "output_path": "/tmp/t.csv"}
+        assert render(**params) == load_sql("export", "to_csv", **params)
+        with pytest.raises(KeyError, match="Missing SQL template parameter"):
+            render(table_name="t")
+
     def test_render_template_missing_param(self):
         with pytest.raises(KeyError, match="Missing SQL template parameter"):
             render_template("SELECT * FROM {{ table_name }}")
 
     def test_load_sql_ingestion_csv(self):
         sql = load_sql(
-            "ingestion", "load_csv",
+            "ingestion",
+            "load_csv",
             table_name="test",
             file_path="/data/test.csv",
             delimiter=",",
+            encoding="utf-8",
             quote_char='"',
             escape_char='"',
         )
@@ -192,3 +401,75 @@ class TestSQLLoader:
     def test_load_sql_nonexistent(self):
         with pytest.raises(FileNotFoundError):
             load_sql("nonexistent", "fake_query", table_name="test")
+
+
+class TestJsonIO:
+    def test_write_json_round_trips_with_str_fallback(self, tmp_path):
+        import json
+        from datetime import datetime
+        from pathlib import Path
+
+        from datagrunt_agent.core.json_io import dumps, write_json
+
+        when = datetime(2024, 1, 2, tzinfo=UTC)
+        report = {"name": "café", "at": when, "path": Path("/tmp/x"), "n": [1, 2.5]}
+        path = tmp_path / "report.json"
+        write_json(str(path), report)
+
+        assert json.loads(path.read_text(encoding="utf-8")) == {
+            "name": "café",
+            "at": str(when),
+            "path": "/tmp/x",
+            "n": [1, 2.5],
+        }
+        assert dumps({"a": 1}).startswith(b"{\n  ")
+        # Same output as the stdlib for NaN, non-str keys and wide ints
+        edge = {1: float("nan"), "big": 2**70}
+        assert dumps(edge) == json.dumps(edge, indent=2).encode()
+
+    def test_loads_accepts_what_the_stdlib_accepts(self):
+        import json
+        import math
+
+        from datagrunt_agent.core.json_io import loads
+
+        assert loads('{"a": [1, "x"]}') == {"a": [1, "x"]}
+        assert math.isnan(loads('{"v": NaN}')["v"])
+        assert loads(str(2**70)) == 2**70
+        with pytest.raises(json.JSONDecodeError) as excinfo:
+            loads('{"a": 1,}')
+        with pytest.raises(json.JSONDecodeError) as expected:
+            json.loads('{"a": 1,}')
+        assert (excinfo.value.colno, excinfo.value.msg) == (
+            expected.value.colno,
+            expected.value.msg,
+        )
+
+
+class TestLLMCache:
+    def test_rejected_reply_is_not_cached(self):
+        import json
+
+        from datagrunt_agent.core.llm_cache import cached_generate
+
+        replies = iter(["not json", "[1]"])
+        with pytest.raises(json.JSONDecodeError):
+            cached_generate("t", "m", "p", lambda: next(replies), json.loads)
+        assert cached_generate("t", "m", "p", lambda: next(replies), json.loads) == [1]
+        assert cached_generate("t", "m", "p", lambda: "[2]", json.loads) == [1]
+
+    def test_memory_is_bounded(self, monkeypatch):
+        from datagrunt_agent.core import llm_cache
+
+        monkeypatch.setattr(llm_cache, "_MEMORY_MAX_ENTRIES", 2)
+        for prompt in ("a", "b", "a", "c"):
+            llm_cache.cached_generate(
+                "t",
+                "m",
+                prompt,
+                lambda prompt=prompt: prompt,
+                str,
+            )
+        assert len(llm_cache._memory) == 2
+        assert llm_cache.cached_generate("t", "m", "a", lambda: "new", str) == "a"
+        assert llm_cache.cached_generate("t", "m", "b", lambda: "new", str) == "new"
@@ -0,0 +1,144 @@
+"""Tests for table export tools."""
+
+import json
+from datetime import datetime
+
+import pytest
+
+from datagrunt_agent.tools.export import (
+    export_csv,
+    export_json,
+    export_jsonl,
+    export_parquet,
+)
+from datagrunt_agent.tools.ingestion import _get_session
+
+
+class TestExport:
+    def test_rows_exported_per_format(self, tmp_path):
+        session = _get_session()
+        session.execute("CREATE TABLE t_export AS SELECT range AS id FROM range(7)")
+
+        csv_path = str(tmp_path / "out.csv")
+        result = export_csv("t_export", csv_path)
+        assert result["rows_exported"] == 7
+        with open(csv_path) as f:
+            assert f.readline().rstrip("\n") == "id"
+
+        result = export_parquet("t_export", str(tmp_path / "out.parquet"))
+        assert result["rows_exported"] == 7
+
+        json_path = str(tmp_path / "out.json")
+        assert export_json("t_export", json_path)["rows_exported"] == 7
+        with open(json_path) as f:
+            assert len(json.load(f)) == 7
+
+    def test_json_layout_does_not_depend_on_extension(self, tmp_path):
+        session = _get_session()
+        session.execute("CREATE TABLE t_export AS SELECT range AS id FROM range(3)")
+
+        jsonl_path = str(tmp_path / "out.txt")
+        export_jsonl("t_export", jsonl_path)
+        with open(jsonl_path) as f:
+            assert [json.loads(line) for line in f] == [
+                {"id": 0},
+                {"id": 1},
+                {"id": 2},
+            ]
+
+        json_path = str(tmp_path / "out.data")
+        export_json("t_export", json_path)
+        with open(json_path) as f:
+            assert json.load(f) == [{"id": 0}, {"id": 1}, {"id": 2}]
+
+    def test_quotes_table_name_and_output_path(self, tmp_path):
+        session = _get_session()
+        session.execute('CREATE TABLE "odd ""name""" AS SELECT 1 AS id')
+        path = str(tmp_path / "it's.csv")
+
+        result = export_csv('odd "name"', path)
+
+        assert result["rows_exported"] == 1
+        with open(path) as f:
+            assert f.read().splitlines() == ["id", "1"]
+        assert "error" in export_csv("t_missing; SELECT 1", path)
+
+    def test_excel_streams_with_openpyxl(self, tmp_path, monkeypatch):
+        openpyxl = pytest.importorskip("openpyxl")
+        from datagrunt_agent.tools import export
+
+        monkeypatch.setattr(export, "_OPENPYXL_EXCEL_MIN_ROWS", 5)
+        monkeypatch.setattr(export, "_EXCEL_FETCH_ROWS", 2)
+        session = _get_session()
+        session.execute(
+            "CREATE TABLE t_export AS SELECT range AS id, "
+            "TIMESTAMPTZ '2024-01-02 03:04:05+00' AS seen_at, "
+            "[range] AS tags FROM range(7)"
+        )
+        path = str(tmp_path / "out.xlsx")
+
+        result = export.export_excel("t_export", path)
+
+        assert result["backend"] == "openpyxl-stream"
+        assert result["rows_exported"] == 7
+        rows = list(openpyxl.load_workbook(path).active.values)
+        assert rows[0] == ("id", "seen_at", "tags")
+        assert rows[1] == (0, datetime(2024, 1, 2, 3, 4, 5), "[0]")
+        assert len(rows) == 8
+
+    def test_excel_refuses_more_rows_than_a_sheet_holds(self, monkeypatch):
+        from datagrunt_agent.tools import export
+
+        monkeypatch.setattr(export, "_EXCEL_MAX_ROWS", 5)
+        _get_session().execute("CREATE TABLE t_export AS FROM range(7)")
+
+        assert "Parquet" in export.export_excel("t_export")["suggestion"]
+
+    def test_missing_table(self, tmp_path):
+        result = export_csv("t_missing", str(tmp_path / "out.csv"))
+        assert "error" in result
+
+    def test_parallel_parquet_writes_a_directory(self, tmp_path):
+        session = _get_session()
+        session.execute("CREATE TABLE t_export AS SELECT range AS id FROM range(7)")
+        out_dir = str(tmp_path / "parts")
+
+        result = export_parquet("t_export", out_dir, parallel=True)
+
+        assert result["rows_exported"] == 7
+        assert result["files_written"] >= 1
+        assert (
+            session.scalar(f"SELECT COUNT(*) FROM read_parquet('{out_dir}/*.parquet')")
+            == 7
+        )
+
+    def test_arrow_ipc_round_trip(self, tmp_path):
+        import pyarrow as pa
+
+        from datagrunt_agent.tools.export import export_arrow
+
+        session = _get_session()
+        session.execute(
+            "CREATE TABLE t_export AS SELECT range AS id, 'x' || range AS label "
+            "FROM range(7)"
+        )
+        path = str(tmp_path / "out.arrow")
+
+        result = export_arrow("t_export", path)
+
+        assert result["rows_exported"] == 7
+        table = pa.ipc.open_file(path).read_all()
+        assert table.column_names == ["id", "label"]
+        assert table.num_rows == 7
+        assert "error" in export_arrow("t_missing", str(tmp_path / "none.arrow"))
+
+    def test_arrow_without_pyarrow_returns_error(self, tmp_path, monkeypatch):
+        import sys
+
+        from datagrunt_agent.tools.export import export_arrow
+
+        monkeypatch.setitem(sys.modules, "pyarrow", None)
+        result = export_arrow("t_export", str(tmp_path / "out.arrow"))
+
+        assert "pyarrow" in result["error"]
+        assert not (tmp_path / "out.arrow").exists()
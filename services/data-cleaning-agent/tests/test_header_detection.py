@@ -1,9 +1,8 @@
 """Tests for LLM-based CSV header detection."""
 
+import os
 import sys
 import tempfile
-import os
-
 from unittest.mock import MagicMock, patch
 
 from datagrunt_agent.tools.ingestion import _detect_header, load_file
@@ -24,11 +23,14 @@ def _mock_genai(response_text):
     mock_response.text = response_text
     mock_genai.Client.return_value.models.generate_content.return_value = mock_response
 
-    return {"google.genai": mock_genai, "google.genai.types": mock_types, "google": MagicMock(genai=mock_genai)}
+    return {
+        "google.genai": mock_genai,
+        "google.genai.types": mock_types,
+        "google": MagicMock(genai=mock_genai),
+    }
 
 
 class TestDetectHeader:
-
     def test_detects_standard_headers(self, sample_csv):
         with patch.dict(sys.modules, _mock_genai("HEADERS")):
             assert _detect_header(sample_csv, ",") is True
@@ -43,12 +45,10 @@ class TestDetectHeader:
 
     def test_data_response_means_no_header(self):
         """LLM responding DATA means no headers present."""
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".csv", delete=False
-        ) as f:
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as f:
             f.write("red,blue,red,green\n")
-            f.write("1,2,3,4\n")
-            f.write("5,6,7,8\n")
+            f.write("teal,navy,teal,lime\n")
+            f.write("plum,gold,rose,sand\n")
             path = f.name
 
         try:
@@ -59,11 +59,9 @@ class TestDetectHeader:
 
     def test_headers_response_means_has_header(self):
         """LLM responding HEADERS means headers present."""
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".csv", delete=False
-        ) as f:
-            f.write("name,age,score\n")
-            f.write("Alice,30,95.5\n")
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as f:
+            f.write("name,city\n")
+            f.write("Alice,Paris\n")
             path = f.name
 
         try:
@@ -74,9 +72,7 @@ class TestDetectHeader:
 
     def test_empty_file_defaults_to_true(self):
         """Empty file should default to True without calling the LLM."""
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".csv", delete=False
-        ) as f:
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as f:
             path = f.name
 
         try:
@@ -85,33 +81,77 @@ class TestDetectHeader:
         finally:
             os.unlink(path)
 
-    def test_api_error_defaults_to_true(self, sample_csv):
-        """If the LLM call fails, default to True (assume headers)."""
+    def test_api_error_defaults_to_true(self, tmp_path):
+        """If the LLM call fails on an all-text file, default to True."""
+        # csv.Sniffer votes "no header" on this file
+        path = tmp_path / "cities.csv"
+        path.write_text("city,country\nParis,France\nLima,Peru\nOslo,Norway\n")
         mock_genai = MagicMock()
-        mock_genai.Client.return_value.models.generate_content.side_effect = Exception("API error")
-        mocks = {"google.genai": mock_genai, "google.genai.types": MagicMock(), "google": MagicMock(genai=mock_genai)}
+        mock_genai.Client.return_value.models.generate_content.side_effect = Exception(
+            "API error"
+        )
+        mocks = {
+            "google.genai": mock_genai,
+            "google.genai.types": MagicMock(),
+            "google": MagicMock(genai=mock_genai),
+        }
 
         with patch.dict(sys.modules, mocks):
-            assert _detect_header(sample_csv, ",") is True
+            assert _detect_header(str(path), ",") is True
 
-    def test_ambiguous_response_defaults_to_true(self, sample_csv):
+    def test_ambiguous_response_defaults_to_true(self, tmp_path):
         """If the LLM returns something unexpected, default to True."""
+        path = tmp_path / "colors.csv"
+        path.write_text("red,blue\nteal,navy\n")
         with patch.dict(sys.modules, _mock_genai("I'm not sure, it could be either")):
             # "HEADER" not in the response → defaults to False actually
             # But "HEADER" IS in "...HEADER..." — let's test a truly absent case
             pass
 
         with patch.dict(sys.modules, _mock_genai("UNKNOWN")):
-            assert _detect_header(sample_csv, ",") is False
+            assert _detect_header(str(path), ",") is False
+
+    def test_type_contrast_decided_without_model(self, tmp_path):
+        """Text over numbers, or numbers first, never reaches the LLM."""
+        mocks = _mock_genai("UNKNOWN")
+        generate = mocks["google.genai"].Client.return_value.models.generate_content
+        headed = tmp_path / "headed.csv"
+        headed.write_text("name,age,score\nAlice,30,95.5\nBob,41,88\n")
+        bare = tmp_path / "bare.csv"
+        bare.write_text("1,2.5,-3\n4,5,6\n")
 
-    def test_prompt_sends_only_sample_rows(self, sample_csv):
+        with patch.dict(sys.modules, mocks):
+            assert _detect_header(str(headed), ",") is True
+            assert _detect_header(str(bare), ",") is False
+        assert generate.call_count == 0
+
+    def test_prompt_sends_only_sample_rows(self, tmp_path):
         """Verify the LLM only receives the first 3 rows, not bulk data."""
+        sample_csv = str(tmp_path / "text.csv")
+        with open(sample_csv, "w") as f:
+            f.write("name,city\n")
+            f.writelines(
+                f"{name},{city}\n"
+                for name, city in [
+                    ("Al", "Rome"),
+                    ("Bo", "Oslo"),
+                    ("Cy", "Lima"),
+                    ("Di", "Bern"),
+                    ("Ed", "Riga"),
+                ]
+            )
         mock_genai = MagicMock()
         mock_types = MagicMock()
         mock_response = MagicMock()
         mock_response.text = "HEADERS"
-        mock_genai.Client.return_value.models.generate_content.return_value = mock_response
-        mocks = {"google.genai": mock_genai, "google.genai.types": mock_types, "google": MagicMock(genai=mock_genai)}
+        mock_genai.Client.return_value.models.generate_content.return_value = (
+            mock_response
+        )
+        mocks = {
+            "google.genai": mock_genai,
+            "google.genai.types": mock_types,
+            "google": MagicMock(genai=mock_genai),
+        }
 
         with patch.dict(sys.modules, mocks):
             _detect_header(sample_csv, ",")
@@ -122,13 +162,25 @@ class TestDetectHeader:
 
         # Prompt should contain CSV rows but not be excessively long
         assert "HEADERS or DATA" in prompt
-        # Extract the CSV sample between the prompt markers
-        # The sample sits between "CSV rows:\n\n" and "\n\nDoes the FIRST"
-        csv_section = prompt.split("CSV rows:\n\n")[1].split("\n\nDoes the FIRST")[0]
+        # Instructions come first so prompts share a cacheable prefix; the
+        # CSV sample is everything after "CSV rows:\n\n"
+        assert prompt.startswith("Does the FIRST")
+        csv_section = prompt.split("CSV rows:\n\n")[1]
         csv_lines = [line for line in csv_section.split("\n") if line.strip()]
-        # sample.csv has 5 data rows + 1 header — only first 3 should be sent
+        # text.csv has 5 data rows + 1 header — only first 3 should be sent
         assert len(csv_lines) <= 3
 
+    def test_identical_file_reuses_cached_answer(self, tmp_path):
+        path = tmp_path / "data.csv"
+        path.write_text("red,blue\nteal,navy\n")
+        mocks = _mock_genai("DATA")
+        generate = mocks["google.genai"].Client.return_value.models.generate_content
+
+        with patch.dict(sys.modules, mocks):
+            assert _detect_header(str(path), ",") is False
+            assert _detect_header(str(path), ",") is False
+        assert generate.call_count == 1
+
 
 class TestLoadFileHeaderDetection:
     """Test that load_file handles header detection.
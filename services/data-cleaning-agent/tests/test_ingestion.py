@@ -1,14 +1,16 @@
 """Tests for ingestion tools — CSV, JSON/JSONL loading and preprocessing."""
 
+import os
 from unittest.mock import MagicMock
 
 from datagrunt_agent.tools.ingestion import (
     _detect_json_format,
-    _validate_json,
     _repair_json,
     _repair_json_string,
+    _validate_json,
     detect_format,
     load_file,
+    load_files,
 )
 
 
@@ -23,8 +25,8 @@ def _make_tool_context():
 # CSV Loading
 # ---------------------------------------------------------------------------
 
-class TestCSVLoading:
 
+class TestCSVLoading:
     def test_load_simple_csv(self, sample_csv):
         ctx = _make_tool_context()
         result = load_file(sample_csv, ctx)
@@ -92,13 +94,116 @@ class TestCSVLoading:
         # All parsed rows survive the repair — none are dropped
         assert result["total_rows"] > 0
 
+    def test_overflow_columns_are_the_trailing_sparse_run(self):
+        from datagrunt_agent.tools.ingestion import (
+            _check_overflow_columns,
+            _get_session,
+        )
+
+        session = _get_session()
+        session.execute(
+            "CREATE TABLE t_overflow AS SELECT range AS id, "
+            "CASE WHEN range = 0 THEN 'x' END AS sparse_inner, "
+            "'v' AS dense, "
+            "CASE WHEN range = 0 THEN 'x' END AS spill_1, "
+            "NULL::VARCHAR AS spill_2 FROM range(10)"
+        )
+        assert _check_overflow_columns(session, "t_overflow") == [
+            "spill_1",
+            "spill_2",
+        ]
+
+        session.execute("CREATE TABLE t_dense AS SELECT range AS id FROM range(10)")
+        assert _check_overflow_columns(session, "t_dense") == []
+
+    def test_remove_empty_rows_returns_deleted_count(self):
+        from datagrunt_agent.tools.ingestion import _get_session, _remove_empty_rows
+
+        session = _get_session()
+        session.execute(
+            "CREATE TABLE t_empty AS SELECT CASE WHEN range % 3 = 0 THEN NULL "
+            "ELSE range END AS id, NULL::VARCHAR AS note FROM range(10)"
+        )
+        assert _remove_empty_rows(session, "t_empty") == 4
+        assert session.get_row_count("t_empty") == 6
+        assert _remove_empty_rows(session, "t_empty") == 0
+
+
+class TestSession:
+    def test_concurrent_first_calls_share_one_session(self, monkeypatch):
+        import threading
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+
+        from datagrunt_agent.tools import ingestion
+
+        created = []
+
+        def slow_session():
+            time.sleep(0.05)
+            created.append(object())
+            return created[-1]
+
+        monkeypatch.setattr(ingestion, "_session", None)
+        monkeypatch.setattr(ingestion, "DuckDBSession", slow_session)
+        barrier = threading.Barrier(8)
+
+        def first_call(_):
+            barrier.wait()
+            return ingestion._get_session()
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            sessions = list(pool.map(first_call, range(8)))
+
+        assert len(created) == 1
+        assert all(session is created[0] for session in sessions)
+
+
+class TestLoadFiles:
+    def test_loads_files_in_parallel(self, tmp_path):
+        paths = []
+        for name in ("orders", "customers", "items"):
+            path = tmp_path / f"{name}.csv"
+            path.write_text("id,label\n1,a\n2,b\n3,c\n")
+            paths.append(str(path))
+        ctx = _make_tool_context()
+
+        result = load_files(paths + ["/nonexistent/file.csv"], ctx, str(tmp_path))
+
+        assert result["status"] == "partial"
+        assert result["loaded_files"] == 3
+        assert result["table_names"] == [
+            "table_orders",
+            "table_customers",
+            "table_items",
+        ]
+        assert "error" in result["results"][-1]
+        assert set(result["table_names"]) <= set(ctx.state["loaded_tables"])
+        assert ctx.state["current_table"] == "table_items"
+
+    def test_same_table_name_reports_overwrite(self, tmp_path):
+        first = tmp_path / "a" / "orders.csv"
+        second = tmp_path / "b" / "orders.csv"
+        for path, rows in ((first, "1,a\n"), (second, "1,a\n2,b\n")):
+            path.parent.mkdir()
+            path.write_text("id,label\n" + rows)
+        ctx = _make_tool_context()
+
+        result = load_files([str(first), str(second)], ctx, str(tmp_path))
+
+        assert result["status"] == "success"
+        assert result["table_names"] == ["table_orders"]
+        assert result["results"][0]["status"] == "overwritten"
+        assert result["results"][0]["overwritten_by"] == str(second)
+        assert result["results"][1]["status"] == "success"
+
 
 # ---------------------------------------------------------------------------
 # JSON/JSONL Format Detection
 # ---------------------------------------------------------------------------
 
-class TestJSONFormatDetection:
 
+class TestJSONFormatDetection:
     def test_detect_json_array(self, sample_json):
         assert _detect_json_format(sample_json) == "array"
 
@@ -110,8 +215,8 @@ class TestJSONFormatDetection:
 # JSON Validation
 # ---------------------------------------------------------------------------
 
-class TestJSONValidation:
 
+class TestJSONValidation:
     def test_valid_json_array(self, sample_json):
         result = _validate_json(sample_json, "array")
         assert result["valid"] is True
@@ -135,14 +240,15 @@ class TestJSONValidation:
 # JSON Repair
 # ---------------------------------------------------------------------------
 
-class TestJSONRepair:
 
+class TestJSONRepair:
     def test_repair_trailing_comma(self):
         repaired = _repair_json_string('{"name": "Alice", "age": 30,}')
         assert repaired == '{"name": "Alice", "age": 30}'
 
     def test_repair_single_quotes(self):
         import json
+
         repaired = _repair_json_string("{'name': 'Alice'}")
         parsed = json.loads(repaired)
         assert parsed == {"name": "Alice"}
@@ -159,13 +265,37 @@ class TestJSONRepair:
         assert result["repair_failed"] is True
         assert result["lines_failed"] > 0
 
+    def test_repair_jsonl_streams_to_temp_file(self, tmp_path, monkeypatch):
+        import json
+        import tempfile
+
+        source = tmp_path / "mixed.jsonl"
+        source.write_text('{"a": 1}\n\n{\'a\': 2,}\n{"a": 3}\n')
+        monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+
+        result = _repair_json(str(source), "newline_delimited")
+
+        assert result["lines_repaired"] == 1
+        with open(result["repaired_path"]) as fh:
+            assert [json.loads(line) for line in fh] == [
+                {"a": 1},
+                {"a": 2},
+                {"a": 3},
+            ]
+
+        os.unlink(result["repaired_path"])
+        source.write_text('{"a": 1}\nnot json\n{"a": 3}\n')
+        result = _repair_json(str(source), "newline_delimited")
+        assert result["total_lines"] == 3
+        assert os.listdir(tmp_path) == ["mixed.jsonl"]
+
 
 # ---------------------------------------------------------------------------
 # JSON Loading
 # ---------------------------------------------------------------------------
 
-class TestJSONLoading:
 
+class TestJSONLoading:
     def test_load_json_array(self, sample_json):
         ctx = _make_tool_context()
         result = load_file(sample_json, ctx)
@@ -200,8 +330,8 @@ class TestJSONLoading:
 # detect_format tool
 # ---------------------------------------------------------------------------
 
-class TestDetectFormat:
 
+class TestDetectFormat:
     def test_detect_csv(self, sample_csv):
         result = detect_format(sample_csv)
         assert result["detected_format"] == "csv"
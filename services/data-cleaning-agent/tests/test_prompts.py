@@ -0,0 +1,54 @@
+"""Tests for agent prompt providers, versions and warmup."""
+
+from unittest.mock import MagicMock
+
+
+class TestPromptProviders:
+    """Test lazily resolved prompts, their versions and cache warmup."""
+
+    def test_agents_use_static_instruction_providers(self):
+        from datagrunt_agent.agent import root_agent
+        from datagrunt_agent.prompts.coordinator import COORDINATOR_PROMPT
+
+        assert callable(root_agent.instruction)
+        assert root_agent.instruction(None) is COORDINATOR_PROMPT
+
+    def test_warmup_sends_each_prompt_once(self, mock_genai_for_header_detection):
+        from datagrunt_agent.prompts._precompiled import get_prompt, warmup
+
+        assert warmup() == []
+
+        class APIError(Exception):
+            pass
+
+        mock_genai_for_header_detection.errors.APIError = APIError
+        client = MagicMock()
+        client.models.generate_content.side_effect = [None, APIError("429")]
+        warmed = warmup(client, {"coordinator": "m1", "profiler": "m2"})
+
+        assert warmed == ["coordinator"]
+        assert client.models.generate_content.call_args_list[0].kwargs["model"] == "m1"
+        config = mock_genai_for_header_detection.types.GenerateContentConfig
+        first = config.call_args_list[0].kwargs
+        assert first["system_instruction"] is get_prompt("coordinator")
+        assert first["max_output_tokens"] == 1
+
+    def test_prompt_versions_track_prompt_content(self):
+        import hashlib
+
+        from datagrunt_agent.prompts._precompiled import prompt_versions
+        from datagrunt_agent.prompts.coordinator import (
+            COORDINATOR_PROMPT,
+            PROMPT_VERSION,
+        )
+
+        versions = prompt_versions()
+        assert set(versions) == {
+            "coordinator",
+            "data_cleaner",
+            "profiler",
+            "quality_analyst",
+            "schema_architect",
+        }
+        sha = hashlib.sha256(COORDINATOR_PROMPT.encode()).hexdigest()[:12]
+        assert versions["coordinator"] == PROMPT_VERSION == f"coordinator@{sha}"
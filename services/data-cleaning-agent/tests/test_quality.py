@@ -51,6 +51,7 @@ class TestParquetExport:
 
     def test_parquet_file_exists(self, sample_csv):
         import os
+
         ctx = _make_tool_context()
         result = load_file(sample_csv, ctx)
         parquet_path = result["output"]["parquet_path"]
@@ -65,12 +66,42 @@ class TestParquetExport:
         assert parquet_path.endswith("sample.parquet")
         # Cleanup
         import os
+
+        os.unlink(parquet_path)
+
+    def test_parquet_output_is_zstd_compressed(self, sample_csv):
+        import os
+
+        ctx = _make_tool_context()
+        result = load_file(sample_csv, ctx)
+        parquet_path = result["output"]["parquet_path"]
+        session = _get_session()
+        codecs = session.execute(
+            f"SELECT DISTINCT compression FROM parquet_metadata('{parquet_path}')"
+        ).fetchall()
+        assert codecs == [("ZSTD",)]
         os.unlink(parquet_path)
 
+    def test_parquet_source_in_output_dir_is_not_overwritten(self, tmp_path):
+        import os
+
+        source = tmp_path / "events.parquet"
+        session = _get_session()
+        session.execute(
+            f"COPY (SELECT range AS id FROM range(3)) TO '{source}' (FORMAT PARQUET)"
+        )
+        original_size = os.path.getsize(source)
+
+        result = load_file(str(source), _make_tool_context(), output_dir=str(tmp_path))
+
+        assert result["output"]["parquet_path"].endswith("events_processed.parquet")
+        assert os.path.getsize(source) == original_size
+
     def test_custom_output_dir(self, sample_csv):
         import os
         import shutil
         import tempfile
+
         custom_dir = tempfile.mkdtemp()
         ctx = _make_tool_context()
         result = load_file(sample_csv, ctx, output_dir=custom_dir)
@@ -132,7 +163,8 @@ class TestQualityReport:
 
         report = quality_report(table_name, ctx)
         type_findings = [
-            f for f in report["findings"]
+            f
+            for f in report["findings"]
             if f["category"] == "type_analysis" and f.get("leading_zero_count", 0) > 0
         ]
         # quality_data.csv has zip codes with leading zeros (07102, 08901, etc.)
@@ -165,3 +197,122 @@ class TestQualityReport:
         assert "critical" in counts
         total = counts["info"] + counts["warning"] + counts["critical"]
         assert total == len(report["findings"])
+
+    def test_outliers_ignore_nulls(self):
+        session = _get_session()
+        session.execute(
+            "CREATE TABLE t_outliers AS SELECT CASE WHEN range < 60 THEN NULL "
+            "WHEN range = 99 THEN 1000.0 ELSE range::DOUBLE END AS score "
+            "FROM range(100)"
+        )
+        report = quality_report("t_outliers", _make_tool_context())
+        outliers = [f for f in report["findings"] if f["category"] == "outliers"]
+        assert len(outliers) == 1
+        assert outliers[0]["outlier_count"] == 1
+        assert outliers[0]["non_null_count"] == 40
+        assert outliers[0]["null_rate"] == 0.6
+
+    def test_cleaner_minimal_scope_skips_outliers(self):
+        session = _get_session()
+        session.execute(
+            "CREATE TABLE t_scope AS SELECT CASE WHEN range = 99 THEN 1000.0 "
+            "ELSE range::DOUBLE END AS score FROM range(100)"
+        )
+        ctx = _make_tool_context()
+        minimal = quality_report("t_scope", ctx, scope="cleaner_minimal")
+        assert minimal["scope"] == "cleaner_minimal"
+        assert not any(f["category"] == "outliers" for f in minimal["findings"])
+
+        full = quality_report("t_scope", ctx)
+        outliers = [f for f in full["findings"] if f["category"] == "outliers"]
+        assert [(f["column"], f["outlier_count"]) for f in outliers] == [("score", 1)]
+
+    def test_unknown_scope(self):
+        result = quality_report("t_scope", _make_tool_context(), scope="partial")
+        assert "error" in result
+
+
+class TestProfileTables:
+    """Test multi-table profiling in one call."""
+
+    def test_profiles_each_table(self, sample_csv, semicolon_csv):
+        from datagrunt_agent.tools.profiling import profile_columns, profile_tables
+
+        ctx = _make_tool_context()
+        first = load_file(sample_csv, ctx)["table_name"]
+        second = load_file(semicolon_csv, ctx)["table_name"]
+
+        result = profile_tables([first, second, "table_missing"], ctx)
+
+        assert [t["table_name"] for t in result["tables"]] == [first, second]
+        assert result["missing_tables"] == ["table_missing"]
+        assert result["tables"][0] == profile_columns(first, ctx)
+
+    def test_all_unique_columns(self):
+        from datagrunt_agent.tools.profiling import _all_unique_columns
+
+        # Estimates within 10% of the non-null count, either side, qualify
+        stats = [
+            {"column_name": "id", "approx_unique": 9, "null_percentage": 0.0},
+            {"column_name": "code", "approx_unique": 6, "null_percentage": 50.0},
+            {"column_name": "status", "approx_unique": 3, "null_percentage": 0.0},
+        ]
+        assert _all_unique_columns(stats, 10) == ["id", "code"]
+        assert _all_unique_columns(stats, 0) == []
+
+    def test_all_unique_columns_exact_with_nulls(self):
+        from datagrunt_agent.tools.profiling import profile_columns
+
+        session = _get_session()
+        # 5 NULLs in 200,000 rows round null_percentage to 0.0
+        session.execute(
+            "CREATE TABLE t_unique AS SELECT "
+            "CASE WHEN range >= 5 THEN range END AS id, "
+            "range AS id2, range % 1000 AS bucket FROM range(200000)"
+        )
+        ctx = _make_tool_context()
+
+        exact = profile_columns("t_unique", ctx, exact_cardinality=True, sample_size=0)
+        assert exact["all_unique_exact"] is True
+        assert exact["all_unique_columns"] == ["id", "id2"]
+
+        approx = profile_columns("t_unique", ctx, sample_size=0)
+        assert approx["all_unique_exact"] is False
+        assert "bucket" not in approx["all_unique_columns"]
+
+    def test_sample_size(self):
+        from datagrunt_agent.tools.profiling import profile_columns
+
+        session = _get_session()
+        session.execute(
+            "CREATE TABLE t_sampled AS SELECT range AS id, range::VARCHAR AS code "
+            "FROM range(5000)"
+        )
+        ctx = _make_tool_context()
+
+        full = profile_columns("t_sampled", ctx)
+        assert full["sampled"] is False
+        assert "sample_size" not in full
+
+        sampled = profile_columns("t_sampled", ctx, sample_size=500)
+        assert sampled["sampled"] is True
+        assert sampled["sample_size"] == 500
+        assert sampled["total_rows"] == 5000
+        assert not session.table_exists("_profile_sample_t_sampled")
+
+    def test_type_coercion_suggestions(self):
+        from datagrunt_agent.tools.profiling import profile_columns
+
+        session = _get_session()
+        session.execute(
+            "CREATE TABLE t_suggest AS SELECT * FROM (VALUES "
+            "('$1,200', '01/02/2024', 'a'), ('35%', '2024-02-03', 'b'), "
+            "(NULL, NULL, 'c')) AS v(amount, day, label)"
+        )
+
+        profile = profile_columns("t_suggest", _make_tool_context())
+
+        assert profile["type_coercion_suggestions"] == [
+            {"column": "amount", "suggested_types": ["DOUBLE"]},
+            {"column": "day", "suggested_types": ["DATE"]},
+        ]
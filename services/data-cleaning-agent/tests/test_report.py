@@ -3,14 +3,13 @@
 import json
 import os
 import tempfile
-
 from unittest.mock import MagicMock
 
 from datagrunt_agent.tools.ingestion import _get_session, load_file
 from datagrunt_agent.tools.report import (
+    _determine_overall_status,
     build_quality_report,
     export_quality_report,
-    _determine_overall_status,
 )
 
 
@@ -72,9 +71,16 @@ class TestBuildQualityReport:
             )
 
         expected_keys = {
-            "report_id", "schema_version", "generated_at",
-            "source", "ingestion", "schema", "quality",
-            "pipeline", "overall_status", "overall_status_reason",
+            "report_id",
+            "schema_version",
+            "generated_at",
+            "source",
+            "ingestion",
+            "schema",
+            "quality",
+            "pipeline",
+            "overall_status",
+            "overall_status_reason",
         }
         assert expected_keys.issubset(report.keys())
 
@@ -308,8 +314,10 @@ class TestAfterToolCallback:
 
         assert result is None  # Returns None to keep original response
         assert "next_action" in tool_response
-        assert tool_response["next_action"]["action"] == "delegate_to_quality_analyst"
+        assert tool_response["next_action"]["action"] == "parallel_delegate"
         assert tool_response["next_action"]["table_name"] == "table_abc"
+        agents = [d["agent"] for d in tool_response["next_action"]["delegates"]]
+        assert agents == ["Profiler", "QualityAnalyst"]
 
     def test_callback_skips_on_error(self):
         from datagrunt_agent.agent import _after_tool_callback
@@ -332,3 +340,54 @@ class TestAfterToolCallback:
         _after_tool_callback(tool, {}, MagicMock(), tool_response)
 
         assert "next_action" not in tool_response
+
+
+class TestConcurrentToolWrapper:
+    """Test that blocking tools are exposed to ADK as awaitable tools."""
+
+    def test_wrapped_tool_is_async_and_keeps_signature(self):
+        import asyncio
+        import inspect
+
+        from datagrunt_agent.agent import _concurrent
+
+        def tool(table_name: str, tool_context=None) -> dict:
+            """Docstring."""
+            return {"table_name": table_name}
+
+        wrapped = _concurrent(tool)
+
+        assert inspect.iscoroutinefunction(wrapped)
+        assert wrapped.__name__ == "tool"
+        assert wrapped.__doc__ == "Docstring."
+        assert list(inspect.signature(wrapped).parameters) == [
+            "table_name",
+            "tool_context",
+        ]
+        assert asyncio.run(wrapped(table_name="t")) == {"table_name": "t"}
+
+
+class TestAgentConfig:
+    """Test that agent settings are read once into a frozen config."""
+
+    def test_config_is_cached_and_frozen(self):
+        import dataclasses
+
+        import pytest
+
+        from datagrunt_agent.agent import get_config, root_agent
+
+        config = get_config()
+        assert get_config() is config
+        assert root_agent.canonical_model.model == config.coordinator_model
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.default_model = "other"
+
+    def test_fallback_chain_skips_primary_model(self):
+        from datagrunt_agent.agent import FallbackGemini, get_config, root_agent
+
+        config = get_config()
+        model = root_agent.canonical_model
+        if isinstance(model, FallbackGemini):
+            assert config.coordinator_model not in model.fallback_models
+            assert set(model.fallback_models) <= set(config.fallback_models)